@@ -17,6 +17,1529 @@ from pathlib import Path
 import debugpy
 import time
 from configparser import ConfigParser
+import hashlib
+import json
+import threading
+import multiprocessing
+import sqlite3
+import openpyxl
+from concurrent.futures import ProcessPoolExecutor, as_completed
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+try:
+    import holidays
+except ImportError:
+    holidays = None
+
+
+# 마스터 파일 스냅샷 저장 폴더
+snapshotDir = r'.\\cache\\snapshot'
+
+
+# 파일 내용 해시값 계산 함수
+def getFileHash(path, blockSize=1024 * 1024):
+    hashObj = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(blockSize), b''):
+            hashObj.update(block)
+    return hashObj.hexdigest()
+
+
+# 스냅샷 파일 저장 함수(Feather 저장이 불가능한 컬럼 구성은 pickle로 저장)
+def writeSnapshot(df, snapshotPath):
+    tempPath = f'{snapshotPath}.{os.getpid()}.{threading.get_ident()}.tmp'
+    fileFormat = 'pickle'
+    if feather is not None and all(isinstance(col, str) for col in df.columns):
+        try:
+            feather.write_feather(df.reset_index(drop=True), tempPath)
+            fileFormat = 'feather'
+        except Exception:
+            fileFormat = 'pickle'
+    if fileFormat == 'pickle':
+        pd.to_pickle(df, tempPath)
+    os.replace(tempPath, snapshotPath)
+    return fileFormat
+
+
+# 스냅샷 파일 불러오기 함수
+def readSnapshot(snapshotPath, fileFormat):
+    if fileFormat == 'feather':
+        df = feather.read_feather(snapshotPath)
+        # Feather는 문자열 컬럼의 빈값을 None으로 복원하므로, 엑셀 원본과 같이 NaN으로 통일
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].where(df[col].notnull(), np.nan)
+        return df
+    return pd.read_pickle(snapshotPath)
+
+
+# 마스터 파일별 읽기 규격
+#   version     : 규격 변경시 증가 (스냅샷 재생성용)
+#   usecols     : 읽어올 컬럼 (None이면 전체 컬럼)
+#   required    : 필수 컬럼
+#   skiprows    : 머리글 전 건너뛸 행 수
+#   dtype       : 컬럼별 타입
+#   linkage     : 16자리 문자열 키로 변환할 Linkage Number 컬럼
+#   dates       : datetime64로 변환할 날짜 컬럼
+#   category    : category 타입으로 변환할 구분값 컬럼
+#   stream      : 설정 엔진과 관계없이 행 단위로 읽으며 msCode 컬럼 기준으로 제외 대상 행을 걸러낼지 여부
+dict_masterSchema = {
+    'SOS2': {'version': 2,
+                'stream': True,
+                'msCode': 'MS Code',
+                'usecols': ['Linkage Number', 'MS Code', 'Planned Prod. Completion date', 'Order Quantity'],
+                'required': ['Linkage Number', 'MS Code', 'Planned Prod. Completion date', 'Order Quantity'],
+                'dtype': {'MS Code': str},
+                'linkage': ['Linkage Number'],
+                'dates': ['Planned Prod. Completion date']},
+    'LEVELING': {'version': 1,
+                    'usecols': None,
+                    'required': ['No (*)', 'Sequence No', 'Planned Order', 'Scheduled Start Date (*)', 'MS-CODE', 'Linkage Number'],
+                    'dtype': {'Sequence No': object},
+                    'linkage': ['Linkage Number'],
+                    'category': ['Manual', 'Allocate', 'Combination flag', 'Leveling Group', 'Leveling Class', 'Planning Plant', 'Demand destination country']},
+    'PICKING': {'version': 1,
+                'usecols': ['ASSY NO', '대수', 'SMT STORE ADDRESS'],
+                'required': ['ASSY NO', '대수'],
+                'skiprows': 5,
+                'dtype': {'ASSY NO': str}},
+    'CALENDAR': {'version': 1,
+                    'usecols': ['Date', 'WorkingDay'],
+                    'required': ['Date', 'WorkingDay'],
+                    'dates': ['Date']},
+}
+
+
+# Linkage Number를 16자리 문자열 키로 변환
+def toLinkageKey(value):
+    if pd.isnull(value) or str(value).strip() == '':
+        return np.nan
+    if isinstance(value, (float, np.floating)):
+        value = int(value)
+    return str(value).strip().zfill(16)
+
+
+# SOS2 파일에서 착공 대상 외로 제외할 MS Code 문자열
+def getSosExcludeMsCode(roundTxt):
+    list_excludeMsCode = ['ZOTHER', 'YZ', 'SF', 'KM', 'TA80']
+    # CT사양은 1차에서만 착공내리도록 처리
+    if roundTxt != '1차':
+        list_excludeMsCode.append('CT')
+    return list_excludeMsCode
+
+
+# 엑셀 읽기 엔진 (Config.ini의 [엑셀 읽기 설정] Engine 값으로 선택, auto이면 벤치마크 결과를 사용)
+#   openpyxl        : pandas 기본 엔진 (pd.read_excel)
+#   openpyxl_stream : openpyxl 읽기전용 모드로 행 단위 읽기
+#   calamine        : python-calamine 기반 행 단위 읽기 (설치된 경우만)
+configFilePath = r'.\\Config.ini'
+excelEngineResultPath = r'.\\cache\\excel_engine.json'
+dict_excelEngine = {}
+
+
+# 사용 가능한 엑셀 읽기 엔진 리스트
+def getAvailableExcelEngine():
+    list_engine = ['openpyxl', 'openpyxl_stream']
+    if CalamineWorkbook is not None:
+        list_engine.append('calamine')
+    return list_engine
+
+
+# 사용할 엑셀 읽기 엔진 확인 (한번 확인한 결과는 재사용)
+def getExcelEngine():
+    if 'engine' not in dict_excelEngine:
+        engine = 'auto'
+        if os.path.exists(configFilePath):
+            parser = ConfigParser()
+            parser.read(configFilePath, encoding='euc-kr')
+            engine = parser.get('엑셀 읽기 설정', 'Engine', fallback='auto').strip()
+        if engine == 'auto':
+            engine = 'openpyxl'
+            if os.path.exists(excelEngineResultPath):
+                try:
+                    with open(excelEngineResultPath, 'r', encoding='utf-8') as f:
+                        engine = json.load(f).get('engine', 'openpyxl')
+                except (OSError, ValueError):
+                    engine = 'openpyxl'
+        if engine not in getAvailableExcelEngine():
+            logging.warning('%s 엑셀 읽기 엔진을 사용할 수 없어 openpyxl 엔진으로 읽습니다.', engine)
+            engine = 'openpyxl'
+        dict_excelEngine['engine'] = engine
+    return dict_excelEngine['engine']
+
+
+# 엔진별로 첫번째 시트를 행 단위로 읽는 함수
+def iterExcelRows(path, engine):
+    if engine == 'calamine':
+        for row in CalamineWorkbook.from_path(path).get_sheet_by_index(0).to_python(skip_empty_area=False):
+            yield tuple(None if value == '' else value for value in row)
+    else:
+        wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            for row in wb.worksheets[0].iter_rows(values_only=True):
+                yield row
+        finally:
+            wb.close()
+
+
+# 행 조건을 적용하며 엑셀 파일을 행 단위로 읽는 함수 (제외 대상 행은 DataFrame으로 만들지 않음)
+def readExcelRows(path, engine, list_useCol=None, skiprows=0, filterCol=None, list_excludeWord=None):
+    """
+    Args:
+        path(str)               : 엑셀 파일 경로
+        engine(str)             : 행 단위 읽기 엔진 (openpyxl_stream, calamine)
+        list_useCol(list)       : 읽어올 컬럼 (None이면 전체 컬럼)
+        skiprows(int)           : 머리글 전 건너뛸 행 수
+        filterCol(str)          : 제외 조건을 확인할 컬럼
+        list_excludeWord(list)  : filterCol 값에 포함되어 있으면 제외할 문자열
+    Return:
+        return(DataFrame)       : 엑셀 파일 DataFrame
+    """
+    iterRow = iterExcelRows(path, engine)
+    for _ in range(skiprows):
+        next(iterRow, None)
+    header = list(next(iterRow, None) or ())
+    while len(header) > 0 and header[-1] is None:
+        header.pop()
+    if list_useCol is None:
+        list_colIdx = list(range(len(header)))
+        list_colName = [col if col is not None else f'Unnamed: {idx}' for idx, col in enumerate(header)]
+    else:
+        list_colIdx = [idx for idx, col in enumerate(header) if col is not None and col in list_useCol]
+        list_colName = [header[idx] for idx in list_colIdx]
+    filterIdx = header.index(filterCol) if filterCol is not None and filterCol in header else None
+    list_excludeWord = list_excludeWord or []
+    dict_col = {col: [] for col in list_colName}
+    emptyRowCnt = 0
+    for row in iterRow:
+        # pandas와 동일하게 중간의 빈 행은 유지하고 마지막의 빈 행은 제외
+        if all(value is None for value in row):
+            emptyRowCnt += 1
+            continue
+        if filterIdx is not None and filterIdx < len(row):
+            filterValue = row[filterIdx]
+            if isinstance(filterValue, str) and any(word in filterValue for word in list_excludeWord):
+                continue
+        for col in list_colName:
+            dict_col[col].extend([np.nan] * emptyRowCnt)
+        emptyRowCnt = 0
+        for col, idx in zip(list_colName, list_colIdx):
+            value = row[idx] if idx < len(row) else None
+            # pandas의 openpyxl 엔진과 동일하게 정수형 실수는 정수로, 빈 셀은 NaN으로 변환
+            if value is None:
+                value = np.nan
+            elif isinstance(value, float) and value.is_integer():
+                value = int(value)
+            dict_col[col].append(value)
+    df = pd.DataFrame(dict_col, columns=list_colName).infer_objects()
+    for col in df.columns[df.dtypes == object]:
+        values = df[col].dropna()
+        if len(values) > 0 and values.map(lambda value: isinstance(value, datetime.datetime)).all():
+            df[col] = pd.to_datetime(df[col])
+    return df
+
+
+# 설정된 엔진으로 엑셀 파일의 첫번째 시트를 읽는 함수
+def readExcel(path, engine=None, skiprows=0):
+    """
+    Args:
+        path(str)           : 엑셀 파일 경로
+        engine(str)         : 엑셀 읽기 엔진 (None이면 설정값 사용)
+        skiprows(int)       : 머리글 전 건너뛸 행 수
+    Return:
+        return(DataFrame)   : 엑셀 파일 DataFrame
+    """
+    if engine is None:
+        engine = getExcelEngine()
+    if engine == 'openpyxl':
+        return pd.read_excel(path, engine='openpyxl', skiprows=skiprows)
+    return readExcelRows(path, engine, skiprows=skiprows)
+
+
+# 두 DataFrame의 값이 같은지 비교 (엔진 검증용)
+def isSameFrame(df_left, df_right):
+    try:
+        pd.testing.assert_frame_equal(df_left.reset_index(drop=True), df_right.reset_index(drop=True), check_dtype=False, check_column_type=False)
+        return True
+    except AssertionError:
+        return False
+
+
+# 엑셀 읽기 엔진 벤치마크 (python FAM3_Leveling.py --bench-excel [파일 또는 폴더 ...])
+def benchmarkExcelEngine(list_target):
+    """
+    Args:
+        list_target(list)   : 벤치마크 대상 엑셀 파일 또는 폴더 (없으면 최신 마스터 파일 폴더, DB 폴더, 캘린더 폴더)
+    Return:
+        return(str)         : 검증을 통과한 엔진 중 가장 빠른 엔진
+    """
+    list_target = list(list_target)
+    if len(list_target) == 0:
+        list_masterDir = sorted(glob.glob(r'.\\input\\Master_File\\*'))
+        if len(list_masterDir) > 0:
+            list_target.append(list_masterDir[-1])
+        list_target += [r'.\\input\\DB', r'.\\input\\Calendar_File']
+    list_file = []
+    for target in list_target:
+        if os.path.isdir(target):
+            list_file += [path for path in glob.glob(os.path.join(target, '**', '*.xlsx'), recursive=True) if not os.path.basename(path).startswith('~$')]
+        elif os.path.isfile(target):
+            list_file.append(target)
+    if len(list_file) == 0:
+        print('벤치마크 대상 엑셀 파일이 없습니다.')
+        return None
+    list_engine = getAvailableExcelEngine()
+    dict_time = {engine: 0.0 for engine in list_engine}
+    dict_valid = {engine: True for engine in list_engine}
+    for path in list_file:
+        df_reference = None
+        for engine in list_engine:
+            start = time.time()
+            try:
+                df = readExcel(path, engine=engine)
+            except Exception as e:
+                print(f'{engine:16s} 읽기 실패 : {os.path.basename(path)} ({e})')
+                dict_valid[engine] = False
+                continue
+            elapsed = time.time() - start
+            dict_time[engine] += elapsed
+            # pandas 기본 엔진(openpyxl)의 결과를 기준으로 검증
+            if engine == 'openpyxl':
+                df_reference = df
+                isValid = True
+            else:
+                isValid = df_reference is not None and isSameFrame(df_reference, df)
+                if not isValid:
+                    dict_valid[engine] = False
+            print(f'{engine:16s} {elapsed:8.2f}초 {"" if isValid else "(결과 불일치) "}: {os.path.basename(path)}')
+    list_validEngine = [engine for engine in list_engine if dict_valid[engine]]
+    bestEngine = min(list_validEngine, key=lambda engine: dict_time[engine]) if len(list_validEngine) > 0 else 'openpyxl'
+    print('-' * 40)
+    for engine in list_engine:
+        print(f'{engine:16s} 합계 {dict_time[engine]:8.2f}초 {"검증 통과" if dict_valid[engine] else "검증 실패"}')
+    print(f'선택된 엔진 : {bestEngine}')
+    os.makedirs(os.path.dirname(excelEngineResultPath), exist_ok=True)
+    with open(excelEngineResultPath, 'w', encoding='utf-8') as f:
+        json.dump({'engine': bestEngine,
+                    'time': dict_time,
+                    'valid': dict_valid,
+                    'fileCnt': len(list_file),
+                    'date': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}, f, ensure_ascii=False, indent=4)
+    return bestEngine
+
+
+# 읽기 규격을 적용한 엑셀 마스터파일 읽기 함수
+def readMasterExcel(path, schemaName=None, excludeMsCode=None, **kwargs):
+    """
+    Args:
+        path(str)           : 엑셀 파일 경로
+        schemaName(str)     : dict_masterSchema의 읽기 규격 이름 (None이면 규격 미적용)
+        excludeMsCode(list) : 읽는 중에 제외할 MS Code 문자열 (msCode 컬럼이 있는 규격만 해당)
+        kwargs              : readExcel 옵션(skiprows 등)
+    Return:
+        return(DataFrame)   : 엑셀 파일 DataFrame
+    """
+    if schemaName is None:
+        return readExcel(path, **kwargs)
+    schema = dict_masterSchema[schemaName]
+    engine = getExcelEngine()
+    fileName = os.path.basename(path)
+    # Linkage Number는 float 변환으로 자리수가 깨지지 않도록 원본 값 그대로 읽음
+    dict_dtype = dict(schema.get('dtype', {}))
+    for col in schema.get('linkage', []):
+        dict_dtype[col] = object
+    if schema.get('stream') or engine != 'openpyxl':
+        df = readExcelRows(path, 'openpyxl_stream' if engine == 'openpyxl' else engine, schema.get('usecols'), schema.get('skiprows', 0), schema.get('msCode'), excludeMsCode)
+        for col, colType in dict_dtype.items():
+            if col in df.columns and colType is str:
+                df[col] = df[col].map(lambda value: value if pd.isnull(value) else str(value))
+            elif col in df.columns and colType is object:
+                df[col] = df[col].astype(object)
+    else:
+        option = dict(kwargs)
+        if schema.get('usecols') is not None:
+            set_useCol = set(schema['usecols'])
+            option['usecols'] = lambda col: col in set_useCol
+        if 'skiprows' in schema:
+            option['skiprows'] = schema['skiprows']
+        option['dtype'] = dict_dtype
+        df = pd.read_excel(path, **option)
+    # 필수 컬럼 검증
+    list_missingCol = [col for col in schema['required'] if col not in df.columns]
+    if len(list_missingCol) > 0:
+        raise ValueError(f'{fileName} 파일에 필수 컬럼이 없습니다. ({", ".join(list_missingCol)})')
+    for col in schema.get('linkage', []):
+        df[col] = df[col].map(toLinkageKey)
+    for col in schema.get('dates', []):
+        dates = pd.to_datetime(df[col], errors='coerce')
+        if (dates.isnull() & df[col].notnull()).any():
+            raise ValueError(f'{fileName} 파일의 {col} 컬럼에 날짜로 변환할 수 없는 값이 있습니다.')
+        df[col] = dates
+    for col in schema.get('category', []):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
+
+# 엑셀 마스터파일 스냅샷 캐시 읽기 함수
+def readExcelCached(path, schemaName=None, snapshotOnly=False, **kwargs):
+    """
+    Args:
+        path(str)           : 엑셀 파일 경로
+        schemaName(str)     : dict_masterSchema의 읽기 규격 이름 (None이면 규격 미적용)
+        snapshotOnly(bool)  : 유효한 스냅샷이 없을 때 엑셀을 읽지 않고 None을 반환할지 여부
+        kwargs              : pd.read_excel 옵션(skiprows 등)
+    Return:
+        return(DataFrame)   : 엑셀 파일 DataFrame
+    """
+    absPath = os.path.abspath(path)
+    schemaKey = ''
+    if schemaName is not None:
+        schemaKey = f'{schemaName}:{dict_masterSchema[schemaName]["version"]}'
+    cacheKey = hashlib.sha1((absPath + schemaKey + json.dumps(kwargs, sort_keys=True, default=str)).encode('utf-8')).hexdigest()
+    metaPath = os.path.join(snapshotDir, cacheKey + '.json')
+    snapshotPath = os.path.join(snapshotDir, cacheKey + '.snapshot')
+    stat = os.stat(absPath)
+    fileHash = None
+    meta = None
+    if os.path.exists(metaPath) and os.path.exists(snapshotPath):
+        try:
+            with open(metaPath, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = None
+    if meta is not None and meta.get('format') in ('feather', 'pickle') and (meta['format'] != 'feather' or feather is not None):
+        isHit = False
+        # 수정시간, 크기가 같으면 그대로 사용하고, 다르면 내용 해시값으로 재확인 (복사 등으로 수정시간만 바뀐 경우)
+        if meta.get('mtime') == stat.st_mtime_ns and meta.get('size') == stat.st_size:
+            isHit = True
+        elif meta.get('size') == stat.st_size:
+            fileHash = getFileHash(absPath)
+            isHit = meta.get('hash') == fileHash
+        if isHit:
+            try:
+                df = readSnapshot(snapshotPath, meta['format'])
+                if meta.get('mtime') != stat.st_mtime_ns:
+                    meta['mtime'] = stat.st_mtime_ns
+                    with open(metaPath, 'w', encoding='utf-8') as f:
+                        json.dump(meta, f)
+                return df
+            except Exception:
+                logging.warning('%s 파일의 스냅샷을 읽을 수 없어 엑셀 파일을 다시 읽습니다.', path)
+    if snapshotOnly:
+        return None
+    df = readMasterExcel(absPath, schemaName, **kwargs)
+    try:
+        os.makedirs(snapshotDir, exist_ok=True)
+        if fileHash is None:
+            fileHash = getFileHash(absPath)
+        fileFormat = writeSnapshot(df, snapshotPath)
+        with open(metaPath, 'w', encoding='utf-8') as f:
+            json.dump({'path': absPath,
+                        'mtime': stat.st_mtime_ns,
+                        'size': stat.st_size,
+                        'hash': fileHash,
+                        'format': fileFormat}, f)
+    except OSError:
+        logging.warning('%s 파일의 스냅샷을 저장할 수 없습니다.', path)
+    return df
+
+
+# 착공 1회 동안 각 라인 쓰레드가 공유하는 읽기전용 마스터파일 저장소
+class MasterFrameStore():
+    def __init__(self):
+        self.dict_frame = {}
+        self.dict_lock = {}
+        self.lock = threading.Lock()
+
+    # 저장소 키 생성 (파일 경로 + 읽기 옵션)
+    def makeKey(self, path, kwargs):
+        return (os.path.abspath(path), json.dumps(kwargs, sort_keys=True, default=str))
+
+    # 파일을 읽어 저장소에 등록 (같은 파일을 여러 쓰레드가 동시에 요청해도 한번만 읽음)
+    def load(self, path, **kwargs):
+        key = self.makeKey(path, kwargs)
+        with self.lock:
+            if key in self.dict_frame:
+                return self.dict_frame[key]
+            keyLock = self.dict_lock.setdefault(key, threading.Lock())
+        with keyLock:
+            if key not in self.dict_frame:
+                df = readExcelCached(path, **kwargs)
+                with self.lock:
+                    self.dict_frame[key] = df
+        return self.dict_frame[key]
+
+    # 로딩 단계에서 읽은 DataFrame을 저장소에 등록
+    def put(self, path, df, **kwargs):
+        with self.lock:
+            self.dict_frame[self.makeKey(path, kwargs)] = df
+
+    # 저장소의 DataFrame을 복사본으로 전달 (라인별 수정내용이 다른 라인에 영향을 주지 않도록)
+    def get(self, path, rowFilter=None, **kwargs):
+        """
+        Args:
+            path(str)           : 엑셀 파일 경로
+            rowFilter(function) : DataFrame을 받아 필요한 행의 Bool Series를 반환하는 함수 (해당 행만 복사)
+            kwargs              : readExcelCached 옵션(schemaName 등)
+        Return:
+            return(DataFrame)   : 저장소 DataFrame의 복사본
+        """
+        df = self.load(path, **kwargs)
+        if rowFilter is not None:
+            return df.loc[rowFilter(df)].copy(deep=True)
+        return df.copy(deep=True)
+
+
+# 마스터 파일 병렬 로딩용 함수 (프로세스 풀에서 실행되므로 모듈 최상위에 선언)
+def loadMasterFrame(path, kwargs):
+    start = time.time()
+    df = readExcelCached(path, **kwargs)
+    return [df, time.time() - start]
+
+
+# 마스터 파일 로딩 쓰레드 (각 라인 쓰레드 시작 전에 필요한 파일을 동시에 읽어 저장소에 등록)
+class LoadThread(QObject):
+    loadReturnError = pyqtSignal(Exception)
+    loadReturnInfo = pyqtSignal(str)
+    loadReturnEnd = pyqtSignal(bool)
+
+    def __init__(self, frameStore, list_loadTarget, maxWorkers):
+        super().__init__()
+        self.frameStore = frameStore
+        self.list_loadTarget = list_loadTarget
+        self.maxWorkers = maxWorkers
+
+    def run(self):
+        try:
+            start = time.time()
+            list_parseTarget = []
+            # 스냅샷이 유효한 파일은 바로 등록하고, 엑셀 파싱이 필요한 파일만 프로세스 풀로 전달
+            for path, kwargs in self.list_loadTarget:
+                fileStart = time.time()
+                df = readExcelCached(path, snapshotOnly=True, **kwargs)
+                if df is None:
+                    list_parseTarget.append([path, kwargs])
+                else:
+                    self.frameStore.put(path, df, **kwargs)
+                    self.loadReturnInfo.emit(f'{os.path.basename(path)} 파일 로딩 완료 - 스냅샷 ({time.time() - fileStart:.2f}초)')
+            if len(list_parseTarget) > 0:
+                with ProcessPoolExecutor(max_workers=max(1, min(self.maxWorkers, len(list_parseTarget)))) as executor:
+                    dict_future = {executor.submit(loadMasterFrame, path, kwargs): [path, kwargs] for path, kwargs in list_parseTarget}
+                    for future in as_completed(dict_future):
+                        path, kwargs = dict_future[future]
+                        df, parseTime = future.result()
+                        self.frameStore.put(path, df, **kwargs)
+                        self.loadReturnInfo.emit(f'{os.path.basename(path)} 파일 로딩 완료 - 엑셀 ({parseTime:.2f}초)')
+            self.loadReturnInfo.emit(f'마스터 파일 로딩 완료 (총 {time.time() - start:.2f}초)')
+            self.loadReturnEnd.emit(True)
+        except Exception as e:
+            self.loadReturnError.emit(e)
+
+
+# 오라클 세션풀 관리 클래스 (접속정보(Config.ini의 DB 섹션)별로 세션풀을 만들어 쓰레드간 재사용)
+class OracleSessionPool():
+    def __init__(self, clientDir=r'.\\instantclient_21_7', minSession=1, maxSession=3, arraySize=5000):
+        self.clientDir = clientDir
+        self.arraySize = arraySize
+        self.minSession = minSession
+        self.maxSession = maxSession
+        self.isClientInit = False
+        self.dict_pool = {}
+        self.lock = threading.Lock()
+
+    # 오라클 클라이언트 초기화 (프로세스당 한번만 가능하므로 PATH 변경 대신 시작시 한번만 실시)
+    def initClient(self):
+        with self.lock:
+            if not self.isClientInit:
+                if os.path.isdir(self.clientDir):
+                    try:
+                        cx_Oracle.init_oracle_client(lib_dir=self.clientDir)
+                    except cx_Oracle.ProgrammingError:
+                        # 이미 초기화된 경우
+                        pass
+                self.isClientInit = True
+
+    # 접속정보별 세션풀 확인 (없으면 생성)
+    def getPool(self, ip, port, sid, userName, password):
+        self.initClient()
+        # 실행 중 Config.ini의 비밀번호가 바뀌면 새 세션풀을 만들도록 비밀번호 Hash도 키에 포함
+        key = (ip, port, sid, userName, hashlib.sha256(str(password).encode('utf-8')).hexdigest())
+        with self.lock:
+            if key not in self.dict_pool:
+                # 같은 계정의 이전 비밀번호 세션풀은 종료 (사용 중인 세션이 있으면 프로그램 종료시 정리)
+                for oldKey in [poolKey for poolKey in self.dict_pool if poolKey[:4] == key[:4]]:
+                    try:
+                        self.dict_pool[oldKey].close()
+                        del self.dict_pool[oldKey]
+                    except cx_Oracle.Error:
+                        pass
+                dsn = cx_Oracle.makedsn(ip, port, sid)
+                self.dict_pool[key] = cx_Oracle.SessionPool(user=userName,
+                                                            password=password,
+                                                            dsn=dsn,
+                                                            min=self.minSession,
+                                                            max=self.maxSession,
+                                                            increment=1,
+                                                            threaded=True,
+                                                            getmode=cx_Oracle.SPOOL_ATTRVAL_WAIT)
+            return self.dict_pool[key]
+
+    # 세션풀에서 세션을 빌려 Sql 실행 후 결과를 Dataframe으로 반환
+    def readDB(self, ip, port, sid, userName, password, sql, dict_bind=None, arraySize=None, batchCallback=None):
+        """
+        Args:
+            ip(str)                 : DB 호스트
+            port(int)               : DB 포트
+            sid(str)                : DB SID
+            userName(str)           : 접속 계정
+            password(str)           : 접속 비밀번호
+            sql(str)                : 실행할 Sql
+            dict_bind(dict)         : Sql의 Bind 변수 값
+            arraySize(int)          : 한번에 가져올 행 수 (None이면 기본값 사용)
+            batchCallback(function) : 행 묶음을 가져올 때마다 호출할 함수 (인자는 해당 묶음의 DataFrame)
+        Return:
+            return(DataFrame)       : Sql 실행 결과
+        """
+        if arraySize is None:
+            arraySize = self.arraySize
+        pool = self.getPool(ip, port, sid, userName, password)
+        db = pool.acquire()
+        try:
+            cursor = db.cursor()
+            try:
+                # 왕복 횟수를 줄이기 위해 한번에 가져올 행 수와 미리 가져올 행 수를 지정
+                cursor.arraysize = arraySize
+                cursor.prefetchrows = arraySize + 1
+                cursor.execute(sql, dict_bind or {})
+                list_desc = cursor.description
+                col_names = [row[0] for row in list_desc]
+                list_colValue = [[] for _ in col_names]
+                while True:
+                    list_row = cursor.fetchmany()
+                    if len(list_row) == 0:
+                        break
+                    # 행 단위 결과를 바로 컬럼 단위로 옮겨 담음
+                    for values, batchValues in zip(list_colValue, zip(*list_row)):
+                        values.extend(batchValues)
+                    if batchCallback is not None:
+                        batchCallback(pd.DataFrame(list_row, columns=col_names))
+            finally:
+                cursor.close()
+        finally:
+            # 예외가 발생해도 세션은 반드시 세션풀에 반납
+            pool.release(db)
+        df_oracle = pd.DataFrame({col: self.toColumnArray(desc, values) for col, desc, values in zip(col_names, list_desc, list_colValue)}, columns=col_names)
+        return df_oracle
+
+    # 컬럼 타입 정보로 가져온 값을 NumPy 배열로 변환
+    def toColumnArray(self, desc, values):
+        """
+        Args:
+            desc(tuple)         : cursor.description의 컬럼 정보
+            values(list)        : 컬럼 값
+        Return:
+            return(ndarray)     : 컬럼 배열 (숫자는 결측이 없는 정수만 int64, 그 외 float64 / 날짜는 datetime64, 범위를 벗어난 날짜가 있으면 object / 문자열은 object)
+        """
+        dbType = desc[1]
+        if dbType is cx_Oracle.DB_TYPE_NUMBER or dbType is cx_Oracle.DB_TYPE_BINARY_DOUBLE or dbType is cx_Oracle.DB_TYPE_BINARY_FLOAT:
+            # 기존 DataFrame 변환과 동일하게 결측 없이 모두 정수이면 정수형으로 지정
+            if len(values) > 0 and all(isinstance(value, int) for value in values):
+                return np.array(values, dtype=np.int64)
+            return np.array(values, dtype=np.float64)
+        if dbType is cx_Oracle.DB_TYPE_DATE or dbType is cx_Oracle.DB_TYPE_TIMESTAMP:
+            try:
+                return pd.to_datetime(pd.Series(values, dtype=object)).values
+            except pd.errors.OutOfBoundsDatetime:
+                # 9999-12-31 등 datetime64 범위를 벗어난 날짜가 있으면 기존 DataFrame 변환과 동일하게 object로 유지
+                return np.array(values, dtype=object)
+        return np.array(values, dtype=object)
+
+    # 전체 세션풀 종료 (프로그램 종료시)
+    def close(self):
+        with self.lock:
+            for pool in self.dict_pool.values():
+                try:
+                    pool.close(force=True)
+                except cx_Oracle.Error:
+                    pass
+            self.dict_pool = {}
+
+
+oraclePool = OracleSessionPool()
+
+
+# 오프라인용 SQLite 데이터 소스 클래스 (--capture-db 명령으로 기록한 DB 조회 결과를 Oracle과 같은 Sql로 조회)
+class SqliteDataSource():
+    def __init__(self, path):
+        self.path = path
+
+    # Oracle 날짜 형식을 SQLite에 저장된 날짜 문자열로 변환 (TO_DATE 대체 함수)
+    @staticmethod
+    def toDate(value, dateFormat):
+        pyFormat = dateFormat.upper().replace('YYYY', '%Y').replace('MM', '%m').replace('DD', '%d').replace('HH24', '%H').replace('MI', '%M').replace('SS', '%S')
+        return datetime.datetime.strptime(str(value), pyFormat).strftime('%Y-%m-%d %H:%M:%S')
+
+    # 접속 (Oracle과 동일하게 LIKE는 대소문자 구분)
+    def connect(self):
+        conn = sqlite3.connect(self.path, detect_types=sqlite3.PARSE_DECLTYPES)
+        conn.create_function('TO_DATE', 2, self.toDate)
+        conn.execute('PRAGMA case_sensitive_like = ON')
+        # 테이블별 기록 시각과 내용 Hash
+        conn.execute('CREATE TABLE IF NOT EXISTS FIXTURE_META (TABLE_NAME TEXT PRIMARY KEY, CAPTURED_AT TEXT, CONTENT_HASH TEXT)')
+        return conn
+
+    # Oracle 전용 문법을 SQLite 문법으로 변환
+    def convertSql(self, sql):
+        sql = re.sub(r'\bsap\.', '', sql)
+        # 변경 확인용 MAX(ORA_ROWSCN)은 기록 시점의 내용 Hash로 대체 (Hash가 없는 이전 기록 파일은 rowid 사용)
+        match = re.search(r'\bMAX\(ORA_ROWSCN\).*?\bFROM\s+(\w+)', sql, re.IGNORECASE | re.DOTALL)
+        if match is not None:
+            sql = sql.replace('MAX(ORA_ROWSCN)', f"COALESCE((SELECT CONTENT_HASH FROM FIXTURE_META WHERE TABLE_NAME = '{match.group(1)}'), MAX(rowid))")
+        sql = re.sub(r'\bORA_ROWSCN\b', 'rowid', sql)
+        return sql
+
+    # OracleSessionPool.readDB와 같은 형식으로 조회 (접속정보는 사용하지 않음)
+    def readDB(self, ip, port, sid, userName, password, sql, dict_bind=None, arraySize=None, batchCallback=None):
+        conn = self.connect()
+        try:
+            cursor = conn.execute(self.convertSql(sql), dict_bind or {})
+            col_names = [row[0] for row in cursor.description]
+            list_data = []
+            while True:
+                list_row = cursor.fetchmany(arraySize or oraclePool.arraySize)
+                if len(list_row) == 0:
+                    break
+                list_data += list_row
+                if batchCallback is not None:
+                    batchCallback(pd.DataFrame(list_row, columns=col_names))
+        finally:
+            conn.close()
+        df_sqlite = pd.DataFrame(list_data, columns=col_names)
+        return df_sqlite
+
+    # 조회 결과 기록 (deleteWhere 조건이 있으면 해당 행만 교체, 없으면 테이블 전체 교체)
+    def writeTable(self, tableName, df, deleteWhere=None, dict_bind=None):
+        conn = self.connect()
+        try:
+            isExist = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (tableName,)).fetchone() is not None
+            if deleteWhere is not None and isExist:
+                conn.execute(f'DELETE FROM {tableName} WHERE {deleteWhere}', dict_bind or {})
+                df.to_sql(tableName, conn, if_exists='append', index=False)
+            else:
+                df.to_sql(tableName, conn, if_exists='replace', index=False)
+            # 다시 기록해도 행 수와 rowid가 같을 수 있으므로, 기록 후 테이블 전체 내용의 Hash를 남김
+            df_table = pd.read_sql(f'SELECT * FROM {tableName}', conn)
+            contentHash = hashlib.sha1((','.join(df_table.columns) + '|').encode('utf-8') + pd.util.hash_pandas_object(df_table, index=False).values.tobytes()).hexdigest()
+            conn.execute('INSERT OR REPLACE INTO FIXTURE_META (TABLE_NAME, CAPTURED_AT, CONTENT_HASH) VALUES (?, ?, ?)',
+                            (tableName, datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), contentHash))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def close(self):
+        pass
+
+
+# 데이터 소스 (Config.ini의 [데이터 소스 설정] Backend 값으로 선택, oracle 또는 sqlite)
+defaultFixturePath = r'.\\cache\\fixture.db'
+dict_dataSource = {}
+dataSourceLock = threading.Lock()
+
+
+# 사용할 데이터 소스 확인 (한번 확인한 결과는 재사용)
+def getDataSource():
+    with dataSourceLock:
+        if 'source' not in dict_dataSource:
+            backend = 'oracle'
+            fixturePath = defaultFixturePath
+            if os.path.exists(configFilePath):
+                parser = ConfigParser()
+                parser.read(configFilePath, encoding='euc-kr')
+                backend = parser.get('데이터 소스 설정', 'Backend', fallback='oracle').strip().lower()
+                fixturePath = parser.get('데이터 소스 설정', 'Path', fallback=defaultFixturePath).strip()
+            if backend == 'sqlite':
+                if not os.path.exists(fixturePath):
+                    raise FileNotFoundError(f'{fixturePath} 파일이 없습니다. --capture-db 명령으로 DB 조회 결과를 먼저 기록해주세요.')
+                dict_dataSource['source'] = SqliteDataSource(fixturePath)
+                dict_dataSource['name'] = f'sqlite:{os.path.abspath(fixturePath)}'
+            else:
+                dict_dataSource['source'] = oraclePool
+                dict_dataSource['name'] = 'oracle'
+        return dict_dataSource['source']
+
+
+# 해당 날짜의 DB 조회 결과를 SQLite 파일에 기록 (python FAM3_Leveling.py --capture-db [YYYYMMDD])
+def captureDataSource(list_arg):
+    """
+    Args:
+        list_arg(list)      : [재고 날짜(YYYYMMDD)] (없으면 전일)
+    Return:
+        return(str)         : 기록한 SQLite 파일 경로
+    """
+    invDate = list_arg[0] if len(list_arg) > 0 else (datetime.datetime.now() - datetime.timedelta(days=1)).strftime('%Y%m%d')
+    parser = ConfigParser()
+    parser.read(configFilePath, encoding='euc-kr')
+    fixturePath = parser.get('데이터 소스 설정', 'Path', fallback=defaultFixturePath).strip()
+    if os.path.dirname(fixturePath) != '':
+        os.makedirs(os.path.dirname(fixturePath), exist_ok=True)
+    fixture = SqliteDataSource(fixturePath)
+
+    def readSection(section, sql, dict_bind=None):
+        return oraclePool.readDB(parser.get(section, 'Host'),
+                                    parser.getint(section, 'Port'),
+                                    parser.get(section, 'SID'),
+                                    parser.get(section, 'Username'),
+                                    parser.get(section, 'Password'),
+                                    sql,
+                                    dict_bind)
+    oraclePool.initClient()
+    try:
+        # Smt Assy 재고는 날짜별로 누적 기록
+        df_inven = readSection('SMT Assy DB정보', "SELECT INV_D, PARTS_NO, CURRENT_INV_QTY FROM pdsg0040 WHERE INV_D = TO_DATE(:invDate, 'YYYYMMDD')", {'invDate': invDate})
+        fixture.writeTable('pdsg0040', df_inven, "INV_D = TO_DATE(:invDate, 'YYYYMMDD')", {'invDate': invDate})
+        print(f'pdsg0040 : {len(df_inven)}행 ({invDate})')
+        # MSCode별 사용 Smt Assy는 라인별 조건이 달라 사용 컬럼만 전체 기록
+        df_pdbs = readSection('MSCODE별 SMT Assy DB정보', 'SELECT SMT_MS_CODE, SMT_SMT_ASSY, SMT_CRP_GR_NO FROM sap.pdbs0010')
+        fixture.writeTable('pdbs0010', df_pdbs)
+        print(f'pdbs0010 : {len(df_pdbs)}행')
+        df_productTime = readSection('FAM3공수계산DB 정보', 'SELECT MODEL, M_FUNCTION_CHECK, A_FUNCTION_CHECK, INSPECTION_EQUIPMENT FROM FAM3_PRODUCT_TIME_TB')
+        fixture.writeTable('FAM3_PRODUCT_TIME_TB', df_productTime)
+        print(f'FAM3_PRODUCT_TIME_TB : {len(df_productTime)}행')
+    finally:
+        oraclePool.close()
+    print(f'기록 완료 : {os.path.abspath(fixturePath)}')
+    return fixturePath
+
+
+# Oracle IN 목록은 1000개까지만 가능하므로 나누어 OR로 연결하는 Sql 조건 생성
+def getInClause(colName, list_value, bindPrefix, chunkSize=1000):
+    """
+    Args:
+        colName(str)        : 조건 컬럼
+        list_value(list)    : IN 목록 값
+        bindPrefix(str)     : Bind 변수 이름 접두어
+        chunkSize(int)      : IN 목록 하나의 최대 개수
+    Return:
+        return(list)        : [Sql 조건(str), Bind 변수 값(dict)]
+    """
+    if len(list_value) == 0:
+        return ['1 = 0', {}]
+    list_clause = []
+    dict_bind = {}
+    for start in range(0, len(list_value), chunkSize):
+        list_name = []
+        for idx, value in enumerate(list_value[start:start + chunkSize], start):
+            dict_bind[f'{bindPrefix}{idx}'] = value
+            list_name.append(f':{bindPrefix}{idx}')
+        list_clause.append(f"{colName} IN ({', '.join(list_name)})")
+    return ['(' + ' OR '.join(list_clause) + ')', dict_bind]
+
+
+# MSCode별 사용 Smt Assy 조회 Sql 생성 (AST, BMS, WEB 모델은 Sql 조건으로 제외)
+def getPdbsSql(list_grNo, list_msCodeWord=None):
+    """
+    Args:
+        list_grNo(list)         : 대상 SMT_CRP_GR_NO
+        list_msCodeWord(list)   : SMT_CRP_GR_NO와 관계없이 추가로 포함할 MS Code 문자열
+    Return:
+        return(list)            : [Sql(str), Bind 변수 값(dict)]
+    """
+    grClause, dict_bind = getInClause('SMT_CRP_GR_NO', list_grNo, 'gr')
+    list_clause = [grClause]
+    for idx, word in enumerate(list_msCodeWord or []):
+        dict_bind[f'ms{idx}'] = word
+        list_clause.append(f'INSTR(SMT_MS_CODE, :ms{idx}) > 0')
+    sql = ('SELECT SMT_MS_CODE, SMT_SMT_ASSY, SMT_CRP_GR_NO FROM sap.pdbs0010 '
+            f"WHERE ({' OR '.join(list_clause)}) "
+            "AND SMT_MS_CODE NOT LIKE '%AST%' AND SMT_MS_CODE NOT LIKE '%BMS%' AND SMT_MS_CODE NOT LIKE '%WEB%'")
+    return [sql, dict_bind]
+
+
+# 해당 날짜의 Smt Assy 재고 조회 Sql 생성
+def getSmtInvenSql(invDate, list_partsNo):
+    """
+    Args:
+        invDate(str)        : 재고 날짜 (YYYYMMDD)
+        list_partsNo(list)  : 조회할 Smt Assy
+    Return:
+        return(list)        : [Sql(str), Bind 변수 값(dict)]
+    """
+    partsClause, dict_bind = getInClause('PARTS_NO', list_partsNo, 'p')
+    dict_bind['invDate'] = str(invDate)
+    sql = f"SELECT INV_D, PARTS_NO, CURRENT_INV_QTY FROM pdsg0040 WHERE INV_D = TO_DATE(:invDate, 'YYYYMMDD') AND {partsClause}"
+    return [sql, dict_bind]
+
+
+# 생산시간 합계용 함수
+def getSec(time_str):
+    time_str = re.sub(r'[^0-9:]', '', str(time_str))
+    if len(time_str) > 0:
+        h, m, s = time_str.split(':')
+        return int(h) * 3600 + int(m) * 60 + int(s)
+    else:
+        return 0
+
+
+# 백슬래쉬 삭제용 함수
+def delBackslash(value):
+    value = re.sub(r"\\c", "", str(value))
+    return value
+
+
+# 검사시간DB 스냅샷 (테이블 변경이 드물기 때문에 가공 결과를 로컬에 저장하고 변경시에만 새로 가져옴)
+productTimeSnapshotPath = r'.\\cache\\product_time'
+productTimeSnapshotVersion = 2
+productTimeLock = threading.Lock()
+
+
+# 검사시간DB를 가져와 전체 검사시간, 검사설비, 대표모델을 가공하는 함수
+def loadProductTime(ip, port, sid, userName, password):
+    """
+    Args:
+        ip(str)             : DB 호스트
+        port(int)           : DB 포트
+        sid(str)            : DB SID
+        userName(str)       : 접속 계정
+        password(str)       : 접속 비밀번호
+    Return:
+        return(DataFrame)   : 대표모델별 검사시간 DataFrame (TotalTime, INSPECTION_EQUIPMENT 정리, 대표모델 중복 제거)
+    """
+    with productTimeLock:
+        # 행 수와 최종 변경 SCN으로 테이블 변경 여부를 확인
+        dataSource = getDataSource()
+        df_probe = dataSource.readDB(ip, port, sid, userName, password, 'SELECT COUNT(*) AS ROW_CNT, MAX(ORA_ROWSCN) AS MAX_SCN FROM FAM3_PRODUCT_TIME_TB')
+        dict_probe = {'version': productTimeSnapshotVersion,
+                        'source': f'{dict_dataSource["name"]}/{ip}:{port}/{sid}',
+                        'rowCnt': str(df_probe['ROW_CNT'][0]),
+                        'maxScn': str(df_probe['MAX_SCN'][0])}
+        metaPath = productTimeSnapshotPath + '.json'
+        snapshotPath = productTimeSnapshotPath + '.snapshot'
+        if os.path.exists(metaPath) and os.path.exists(snapshotPath):
+            try:
+                with open(metaPath, 'r', encoding='utf-8') as f:
+                    dict_meta = json.load(f)
+                if all(dict_meta.get(key) == value for key, value in dict_probe.items()):
+                    return readSnapshot(snapshotPath, dict_meta['format'])
+            except (OSError, ValueError, KeyError):
+                pass
+        df_productTime = dataSource.readDB(ip, port, sid, userName, password, 'SELECT MODEL, M_FUNCTION_CHECK, A_FUNCTION_CHECK, INSPECTION_EQUIPMENT FROM FAM3_PRODUCT_TIME_TB')
+        # 전체 검사시간을 계산
+        df_productTime['TotalTime'] = (df_productTime['M_FUNCTION_CHECK'].apply(getSec) + df_productTime['A_FUNCTION_CHECK'].apply(getSec))
+        # 대표모델 컬럼생성 및 중복 제거
+        df_productTime['대표모델'] = df_productTime['MODEL'].str[:9]
+        df_productTime = df_productTime.drop_duplicates(['대표모델'])
+        df_productTime = df_productTime.reset_index(drop=True)
+        # 검사설비 정리
+        df_productTime['INSPECTION_EQUIPMENT'] = df_productTime['INSPECTION_EQUIPMENT'].apply(delBackslash)
+        df_productTime['INSPECTION_EQUIPMENT'] = df_productTime['INSPECTION_EQUIPMENT'].str.strip()
+        try:
+            os.makedirs(os.path.dirname(productTimeSnapshotPath), exist_ok=True)
+            dict_probe['format'] = writeSnapshot(df_productTime, snapshotPath)
+            with open(metaPath, 'w', encoding='utf-8') as f:
+                json.dump(dict_probe, f, ensure_ascii=False)
+        except OSError as e:
+            logging.warning('검사시간DB 스냅샷 저장 실패 : %s', e)
+        return df_productTime
+
+
+# 대한민국 양력 고정 공휴일 (holidays 패키지가 없을 때 사용)
+list_krFixedHoliday = ['01-01', '03-01', '05-05', '06-06', '08-15', '10-03', '10-09', '12-25']
+
+
+# 대한민국 공휴일 리스트
+def getKrHolidays(startYear, endYear):
+    """
+    Args:
+        startYear(int)      : 시작 연도
+        endYear(int)        : 종료 연도
+    Return:
+        return(list)        : 공휴일 날짜 리스트 (datetime.date)
+    """
+    list_year = list(range(startYear, endYear + 1))
+    if holidays is not None:
+        return sorted(holidays.KR(years=list_year).keys())
+    return [datetime.date(year, int(day[:2]), int(day[3:])) for year in list_year for day in list_krFixedHoliday]
+
+
+# 워킹데이 캘린더 인덱스 클래스 (날짜순 워킹데이 누적 수로 남은 워킹데이를 한번에 계산)
+class WorkDayIndex():
+    def __init__(self, df_calendar):
+        df_calendar = df_calendar[df_calendar['Date'].notnull()].sort_values(by=['Date'], kind='mergesort')
+        self.array_date = df_calendar['Date'].values.astype('datetime64[ns]')
+        # array_cumWorkDay[k] : 날짜순 앞에서부터 k개 행의 워킹데이 수
+        self.array_cumWorkDay = np.concatenate([[0], np.cumsum((df_calendar['WorkingDay'] == 1).values)]).astype(np.int64)
+
+    # 기준일 이전(미만)/이하 날짜의 워킹데이 수
+    def countBefore(self, array_dt, isInclude):
+        return self.array_cumWorkDay[np.searchsorted(self.array_date, array_dt, side='right' if isInclude else 'left')]
+
+    # 남은 워킹데이 계산
+    def getRemainWorkDay(self, today, series_compDate):
+        """
+        Args:
+            today(str)                  : 기준일 (YYYYMMDD)
+            series_compDate(Series)     : 완성지정일
+        Return:
+            return(list)                : [남은 워킹데이(ndarray), 캘린더에 없는 완성지정일 리스트(list)]
+        """
+        dtToday = np.datetime64(datetime.datetime.strptime(today, '%Y%m%d'), 'ns')
+        array_comp = pd.to_datetime(series_compDate).values.astype('datetime64[ns]')
+        array_workDay = np.zeros(len(array_comp), dtype=np.int64)
+        array_valid = ~np.isnat(array_comp)
+        array_exist = array_valid & np.isin(array_comp, self.array_date)
+        # 구동 당일 ~ 완성지정일 : 당일 초과, 완성지정일 이하의 워킹데이 수
+        array_after = self.countBefore(array_comp, True) - self.countBefore(np.full(len(array_comp), dtToday), True)
+        # 완성지정일 ~ 구동 당일 : 완성지정일 이상, 당일 미만의 워킹데이 수를 차감
+        array_before = self.countBefore(np.full(len(array_comp), dtToday), False) - self.countBefore(array_comp, False)
+        array_workDay[array_exist] = np.where(array_comp[array_exist] > dtToday,
+                                                array_after[array_exist],
+                                                np.where(array_comp[array_exist] < dtToday, -array_before[array_exist], 0))
+        # 캘린더에 없는 날짜는 대한민국 휴일을 제외한 평일 기준으로 계산
+        array_missing = array_valid & ~array_exist
+        list_missingDate = []
+        if array_missing.any():
+            array_missingDay = array_comp[array_missing].astype('datetime64[D]')
+            todayDay = dtToday.astype('datetime64[D]')
+            list_year = [int(str(day)[:4]) for day in np.concatenate([array_missingDay, [todayDay]])]
+            list_holiday = getKrHolidays(min(list_year), max(list_year))
+            array_workDay[array_missing] = np.busday_count(todayDay, array_missingDay, holidays=list_holiday)
+            list_missingDate = sorted(set(pd.to_datetime(array_missingDay).date))
+        return [array_workDay, list_missingDate]
+
+
+# 알람 상세 누적 기록 클래스 (알람을 컬럼별 리스트에 추가하고 마지막에 한번만 DataFrame으로 변환)
+class AlarmCollector():
+    __slots__ = ('list_col', 'dict_value', 'no')
+
+    def __init__(self, list_col):
+        self.list_col = list(list_col)
+        self.dict_value = {col: [] for col in self.list_col}
+        self.no = 1
+
+    def __len__(self):
+        return self.no - 1
+
+    # 알람 한건 추가 (No.는 자동 채번, 처음 나온 항목은 새 컬럼으로 추가하고 이전 행은 NaN으로 채움)
+    def append(self, dict_record):
+        dict_record = dict(dict_record)
+        dict_record['No.'] = self.no
+        for col, value in dict_record.items():
+            if col not in self.dict_value:
+                self.list_col.append(col)
+                self.dict_value[col] = [np.nan] * (self.no - 1)
+            self.dict_value[col].append(value)
+        for col in self.list_col:
+            if len(self.dict_value[col]) < self.no:
+                self.dict_value[col].append(np.nan)
+        self.no += 1
+
+    # 알람 상세 DataFrame으로 변환
+    def toFrame(self):
+        return pd.DataFrame(self.dict_value, columns=self.list_col)
+
+
+# MS Code별 사용 Smt Assy 연결 구조 (CSR: MS Code별 구간 시작 위치 + Smt Assy 코드)
+class SmtAssyIncidence():
+    def __init__(self, df_pdbs, nonManagePattern=None, codeCol='SMT_MS_CODE', assyCol='SMT_SMT_ASSY'):
+        """
+        Args:
+            df_pdbs(DataFrame)          : MS Code별 사용 Smt Assy DataFrame
+            nonManagePattern(str)       : SMT 비관리 대상 Smt Assy 정규식 (없으면 None)
+            codeCol(str)                : MS Code 컬럼명
+            assyCol(str)                : Smt Assy 컬럼명
+        """
+        df_pdbs = df_pdbs[df_pdbs[codeCol].notna()]
+        array_codeNo, array_code = pd.factorize(df_pdbs[codeCol])
+        # MS Code 순으로 정렬하되, 같은 MS Code 안에서는 기존 순서를 유지
+        array_order = np.argsort(array_codeNo, kind='stable')
+        self.list_msCode = list(array_code)
+        self.dict_codePos = {code: pos for pos, code in enumerate(self.list_msCode)}
+        self.array_offset = np.zeros(len(self.list_msCode) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(array_codeNo, minlength=len(self.list_msCode)), out=self.array_offset[1:])
+        # 마지막 항목은 연결된 Smt Assy가 없는 MS Code가 가리키는 빈 값
+        list_assyValue = df_pdbs[assyCol].values[array_order].tolist() + [np.nan]
+        self.nanPos = len(list_assyValue) - 1
+        self.array_assyId, array_assyName = pd.factorize(np.array([str(value) for value in list_assyValue], dtype=object))
+        self.array_assyId = self.array_assyId.astype(np.int64)
+        self.list_assyName = list(array_assyName)
+        self.array_nonManage = np.zeros(len(list_assyValue), dtype=bool)
+        if nonManagePattern is not None:
+            regex = re.compile(nonManagePattern, re.IGNORECASE)
+            self.array_nonManage = np.array([isinstance(value, str) and regex.search(value) is not None for value in list_assyValue], dtype=bool)
+
+    # 주문별 사용 Smt Assy 구간 조회
+    def getRowAssy(self, series_msCode, list_countInvalid):
+        """
+        Args:
+            series_msCode(Series)       : 주문별 MS Code
+            list_countInvalid(List)     : 사용 Smt Assy 개수 확인 시 빈 값으로 취급할 문자열
+        Return:
+            return(List)
+                array_rowPtr(ndarray)       : 주문별 Smt Assy 구간 시작 위치 (주문수 + 1)
+                array_entryPos(ndarray)     : 구간별 Smt Assy 항목 위치
+        """
+        array_invalidName = np.isin(np.array(self.list_assyName, dtype=object), list_countInvalid)
+        list_codeEntry = []
+        for pos in range(len(self.list_msCode)):
+            list_entry = list(range(self.array_offset[pos], self.array_offset[pos + 1]))
+            # 앞에서부터 연속으로 값이 있는 Smt Assy까지를 사용 Smt Assy로 판단 (최소 1개)
+            useCnt = len(list_entry)
+            for entryNo, entryPos in enumerate(list_entry):
+                if array_invalidName[self.array_assyId[entryPos]]:
+                    useCnt = entryNo
+                    break
+            list_codeEntry.append(list_entry[:max(useCnt, 1)])
+        # 연결된 MS Code가 없는 주문은 빈 값 1개를 사용
+        list_codeEntry.append([self.nanPos])
+        array_codeCnt = np.array([len(list_entry) for list_entry in list_codeEntry], dtype=np.int64)
+        array_codeStart = np.zeros(len(list_codeEntry), dtype=np.int64)
+        np.cumsum(array_codeCnt[:-1], out=array_codeStart[1:])
+        array_codeEntry = np.array([entryPos for list_entry in list_codeEntry for entryPos in list_entry], dtype=np.int64)
+        array_codePos = series_msCode.map(self.dict_codePos).fillna(-1).values.astype(np.int64)
+        array_start = array_codeStart[array_codePos]
+        array_cnt = array_codeCnt[array_codePos]
+        array_rowPtr = np.zeros(len(array_codePos) + 1, dtype=np.int64)
+        np.cumsum(array_cnt, out=array_rowPtr[1:])
+        array_entryPos = array_codeEntry[np.repeat(array_start - array_rowPtr[:-1], array_cnt) + np.arange(array_rowPtr[-1])]
+        return [array_rowPtr, array_entryPos]
+
+    # 디버그용 MS Code - Smt Assy 목록
+    def toFrame(self):
+        return pd.DataFrame({'SMT_MS_CODE': np.repeat(self.list_msCode, np.diff(self.array_offset)),
+                             'SMT_SMT_ASSY': [self.list_assyName[assyId] for assyId in self.array_assyId[:self.nanPos]],
+                             'SMT비관리대상': self.array_nonManage[:self.nanPos]})
+
+
+# Smt Assy 잔량 반영 착공량 계산 커널
+def smtAllocateKernel(array_rowPtr, array_assyId, array_nameValid, array_registered, array_stock, array_inst, array_urgent, array_codeValid, array_manage, array_bypass, isRemain, isIntResult=True):
+    """
+    Args:
+        array_rowPtr(ndarray)       : 행별 Smt Assy 구간 시작 위치 (행수 + 1)
+        array_assyId(ndarray)       : Smt Assy 코드
+        array_nameValid(ndarray)    : 코드별 Smt Assy 이름 유효 여부
+        array_registered(ndarray)   : 코드별 Smt 잔여량 등록 여부
+        array_stock(ndarray)        : 코드별 Smt 잔여량
+        array_inst(ndarray)         : 행별 착공 요청량
+        array_urgent(ndarray)       : 행별 긴급오더/당일착공 여부
+        array_codeValid(ndarray)    : 행별 MS Code와 연결된 Smt Assy 등록 여부
+        array_manage(ndarray)       : 행별 Smt 관리 대상 여부
+        array_bypass(ndarray)       : 행별 Smt 확인 제외 여부
+        isRemain(Bool)              : 잔여착공 여부 Flag
+        isIntResult(Bool)           : 결과컬럼이 정수형인지 여부
+    Return:
+        return(List)
+            list_result(List)           : 행별 Smt 반영 착공량
+            list_stock(List)            : 코드별 Smt 잔여량 (갱신 후)
+            array_alarmPos(ndarray)     : 알람 발생 행 위치
+            array_alarmCategory(ndarray): 알람 분류
+            array_alarmAssy(ndarray)    : 알람 Smt Assy 코드 (미등록은 -1)
+            array_alarmShortage(ndarray): 알람 부족 수량
+            list_missingAssy(List)      : 잔여량 차감 대상이지만 등록되지 않은 Smt Assy 코드
+    """
+    list_rowPtr = np.asarray(array_rowPtr).tolist()
+    list_assyId = np.asarray(array_assyId).tolist()
+    list_nameValid = np.asarray(array_nameValid, dtype=bool).tolist()
+    list_registered = np.asarray(array_registered, dtype=bool).tolist()
+    list_stock = list(array_stock)
+    list_inst = list(array_inst)
+    list_urgent = np.asarray(array_urgent, dtype=bool).tolist()
+    list_codeValid = np.asarray(array_codeValid, dtype=bool).tolist()
+    list_manage = np.asarray(array_manage, dtype=bool).tolist()
+    list_bypass = np.asarray(array_bypass, dtype=bool).tolist()
+    list_result = [0] * len(list_inst)
+    list_alarmPos = []
+    list_alarmCategory = []
+    list_alarmAssy = []
+    list_alarmShortage = []
+    list_missingAssy = []
+    # 우선순위 순(행 순서)으로 순차 계산
+    for i, inst in enumerate(list_inst):
+        if list_bypass[i]:
+            result = inst
+        else:
+            list_rowAssy = list_assyId[list_rowPtr[i]:list_rowPtr[i + 1]]
+            minCnt = 9999
+            # MS Code와 연결된 SMT Assy가 등록되지 않았을 경우, Smt Assy 개수만큼 기타1 알람
+            if not list_codeValid[i]:
+                for assyId in list_rowAssy:
+                    minCnt = 0
+                    list_alarmPos.append(i)
+                    list_alarmCategory.append('기타1')
+                    list_alarmAssy.append(-1)
+                    list_alarmShortage.append(0)
+            elif list_manage[i]:
+                for assyId in list_rowAssy:
+                    if not list_nameValid[assyId]:
+                        continue
+                    # SMT Assy가 DB에 등록되지 않은 경우, 기타3 알람
+                    if not list_registered[assyId]:
+                        minCnt = 0
+                        list_alarmPos.append(i)
+                        list_alarmCategory.append('기타3')
+                        list_alarmAssy.append(assyId)
+                        list_alarmShortage.append(0)
+                    # 긴급오더 혹은 당일착공 대상은 Smt Assy 잔량에 관계없이 착공
+                    elif not list_urgent[i]:
+                        stock = list_stock[assyId]
+                        if stock >= inst:
+                            if minCnt > inst:
+                                minCnt = inst
+                        else:
+                            if stock > 0:
+                                if minCnt > stock:
+                                    minCnt = stock
+                            else:
+                                minCnt = 0
+                            # 최소착공필요량 전체에 비해 SmtAssy수량이 부족한 경우, 분류1 알람
+                            if not isRemain and stock > 0:
+                                list_alarmPos.append(i)
+                                list_alarmCategory.append('1')
+                                list_alarmAssy.append(assyId)
+                                list_alarmShortage.append(inst - stock)
+            result = inst if minCnt == 9999 else minCnt
+        # 정수형 결과컬럼은 소수가 처음 들어오는 시점부터 실수형으로 바뀜
+        if isIntResult and float(result).is_integer():
+            result = int(result)
+        else:
+            isIntResult = False
+            result = float(result)
+        list_result[i] = result
+        # 사용되는 각 Smt Assy 수량에서 결과값을 차감 (마지막 Smt Assy부터 유효한 이름이 이어지는 동안)
+        if not list_bypass[i]:
+            isPrevValid = list_nameValid[list_rowAssy[-1]]
+            for assyId in list_rowAssy:
+                if not isPrevValid:
+                    break
+                if list_registered[assyId]:
+                    list_stock[assyId] -= result
+                else:
+                    list_missingAssy.append(assyId)
+                isPrevValid = list_nameValid[assyId]
+    return [list_result,
+            list_stock,
+            np.array(list_alarmPos, dtype=np.int64),
+            np.array(list_alarmCategory, dtype=object),
+            np.array(list_alarmAssy, dtype=np.int64),
+            np.array(list_alarmShortage, dtype=object),
+            list_missingAssy]
+
+
+# 검사설비 잔여능력으로 착공 가능한 최대 수량 계산 (임시수량, 최대착공량 이내)
+def getAtePartialCnt(ateCapa, totalTime, tempCnt, moduleMaxCnt):
+    """
+    Args:
+        ateCapa(float)          : 검사설비 잔여능력(초)
+        totalTime(int)          : 대당 검사시간(초)
+        tempCnt(int)            : 임시수량
+        moduleMaxCnt(int)       : 최대착공량
+    Return:
+        return(int)             : 착공 가능 수량 (불가능할 경우 0)
+    """
+    cnt = min(tempCnt, math.floor(moduleMaxCnt))
+    if totalTime > 0:
+        timeCnt = math.floor(ateCapa / totalTime)
+        # 나눗셈 반올림으로 1대 초과되는 경우 보정
+        if totalTime * timeCnt > ateCapa:
+            timeCnt -= 1
+        cnt = min(cnt, timeCnt)
+    elif ateCapa < 0:
+        cnt = 0
+    return max(cnt, 0)
+
+
+# 기존 역순 탐색 방식의 착공 가능 수량 계산 (검증용)
+def getAtePartialCntLoop(ateCapa, totalTime, tempCnt, moduleMaxCnt):
+    for j in range(tempCnt, 0, -1):
+        if ateCapa >= totalTime * j:
+            if moduleMaxCnt >= j:
+                return j
+    return 0
+
+
+# 디버그 실행 시 기록된 검사설비 착공 계산값으로 검증 (python FAM3_Leveling.py --check-ate [파일 ...])
+def checkAtePartialCnt(list_target):
+    """
+    Args:
+        list_target(list)   : 검증 대상 기록 파일 (없으면 debug 폴더의 ate_partial.xlsx 전체)
+    Return:
+        return(int)         : 결과 불일치 건수
+    """
+    list_file = list(list_target)
+    if len(list_file) == 0:
+        list_file = glob.glob(r'.\\debug\\*\\ate_partial.xlsx')
+    if len(list_file) == 0:
+        print('검증 대상 기록 파일이 없습니다. 디버그 모드로 착공을 실행해주세요.')
+        return 0
+    diffCnt = 0
+    for path in list_file:
+        df_log = readExcel(path)
+        fileDiffCnt = 0
+        for ateCapa, totalTime, tempCnt, moduleMaxCnt in zip(df_log['검사설비잔여능력'], df_log['검사시간'], df_log['임시수량'], df_log['최대착공량']):
+            if getAtePartialCnt(ateCapa, int(totalTime), int(tempCnt), moduleMaxCnt) != getAtePartialCntLoop(ateCapa, int(totalTime), int(tempCnt), moduleMaxCnt):
+                fileDiffCnt += 1
+        print(f'{len(df_log):8d}건 중 불일치 {fileDiffCnt}건 : {path}')
+        diffCnt += fileDiffCnt
+    return diffCnt
+
+
+# 검사설비 문자열별 검사설비 튜플 (중복 제거, 입력 순서 유지)
+dict_ateSet = {}
+
+
+# 검사설비 문자열을 검사설비 튜플로 변환 (한번 변환한 문자열은 재사용)
+def getAteSet(equipment):
+    """
+    Args:
+        equipment(str)          : 검사설비 문자열 (ex. 'ABC')
+    Return:
+        return(tuple)           : 검사설비 튜플 (ex. ('A', 'B', 'C'))
+    """
+    if equipment not in dict_ateSet:
+        dict_ateSet[equipment] = tuple(dict.fromkeys(equipment))
+    return dict_ateSet[equipment]
+
+
+# 검사설비별 비트값 Dict 생성 (검사설비 능력표의 순서대로 비트 배정)
+def getAteBit(series_ate):
+    """
+    Args:
+        series_ate(Series)      : 검사설비 Series (검사호기 분류)
+    Return:
+        return(Dict)            : 검사설비별 비트값 Dict
+    """
+    list_ate = list(dict.fromkeys(str(ate) for ate in series_ate))
+    if len(list_ate) > 63:
+        raise ValueError(f'검사설비가 {len(list_ate)}개로, 비트마스크로 표현할 수 있는 63개를 초과합니다.')
+    return {ate: 1 << bitNo for bitNo, ate in enumerate(list_ate)}
+
+
+# 검사설비 문자열을 검사설비 비트마스크로 변환 (검사설비 능력표에 없는 검사설비는 제외)
+def getAteMask(series_equipment, dict_ateBit):
+    """
+    Args:
+        series_equipment(Series)    : 검사설비 문자열 Series
+        dict_ateBit(Dict)           : 검사설비별 비트값 Dict
+    Return:
+        return(ndarray)             : 검사설비 비트마스크 (검사설비가 없으면 0. 능력표에 없는 검사설비는 비트를 갖지 않으므로, 검사설비 유무 판단에는 사용하지 않음)
+    """
+    dict_mask = {}
+    for equipment in series_equipment.dropna().unique():
+        mask = 0
+        for ate in getAteSet(str(equipment)):
+            mask |= dict_ateBit.get(ate, 0)
+        dict_mask[equipment] = mask
+    return series_equipment.map(dict_mask).fillna(0).astype(np.int64).values
+
+
+# 수량을 chunkSize 단위로 분할하여 행을 나눈 DataFrame 생성 (ex. 83대를 20대 단위로 분할 시, 20, 20, 20, 20, 3으로 5분할)
+def splitChunk(df_input, qtyCol, chunkSize):
+    """
+    Args:
+        df_input(DataFrame)     : 입력 DataFrame
+        qtyCol(str)             : 분할할 수량 컬럼명
+        chunkSize(int)          : 분할 단위 수량
+    Return:
+        return(DataFrame)       : 분할된 DataFrame (분할전_Index 컬럼에 분할 전 행 위치를 기록, 수량이 0 이하인 행은 제외)
+    """
+    array_qty = np.maximum(df_input[qtyCol].values.astype(np.int64), 0)
+    array_chunkCnt = (array_qty + chunkSize - 1) // chunkSize
+    array_srcPos = np.repeat(np.arange(len(df_input)), array_chunkCnt)
+    # 분할 전 행별로 몇번째 분할인지 계산하여, 마지막 분할만 나머지 수량을 배정
+    array_chunkNo = np.arange(len(array_srcPos)) - np.repeat(np.cumsum(array_chunkCnt) - array_chunkCnt, array_chunkCnt)
+    df_chunk = df_input.iloc[array_srcPos].reset_index(drop=True)
+    df_chunk[qtyCol] = np.minimum(chunkSize, array_qty[array_srcPos] - array_chunkNo * chunkSize)
+    df_chunk['분할전_Index'] = array_srcPos
+    return df_chunk
+
+
+# 분할된 행의 결과 컬럼을 분할 전 행 기준으로 한번에 합산하여 분할 전 DataFrame에 추가
+def mergeChunk(df_origin, df_chunk, list_col):
+    """
+    Args:
+        df_origin(DataFrame)    : 분할 전 DataFrame
+        df_chunk(DataFrame)     : 분할된 DataFrame (분할전_Index 컬럼 포함)
+        list_col(List)          : 합산할 결과 컬럼 리스트
+    Return:
+        return(DataFrame)       : 결과 컬럼이 추가된 분할 전 DataFrame (분할된 행이 없으면 0)
+    """
+    df_sum = df_chunk.groupby('분할전_Index')[list_col].sum().reindex(range(len(df_origin)), fill_value=0)
+    df_result = df_origin.copy()
+    for column in list_col:
+        df_result[column] = df_sum[column].values
+    return df_result
+
+
+# 착공수량만큼 레벨링 리스트의 행을 선택하여 구간(Run) 단위로 압축 (Linkage Number로 연결, 같은 Linkage Number가 연속된 구간의 앞에서부터 착공수량만큼)
+def encodeOrderRun(df_inst, df_mergeOrder, cntCol='총착공량'):
+    """
+    Args:
+        df_inst(DataFrame)          : Linkage Number별 착공수량 DataFrame
+        df_mergeOrder(DataFrame)    : 레벨링 리스트와 병합된 DataFrame
+        cntCol(str)                 : 착공수량 컬럼명
+    Return:
+        return(DataFrame)           : 구간 DataFrame (Linkage Number, 원본Pos : 레벨링 리스트 상의 시작 위치, 수량)
+                                        착공수량 DataFrame 순서, 같은 Linkage Number 안에서는 레벨링 리스트 순서
+    """
+    series_linkage = df_mergeOrder['Linkage Number']
+    # 같은 Linkage Number가 연속된 구간의 시작 위치와 길이
+    array_isStart = (series_linkage != series_linkage.shift()).values
+    array_start = np.flatnonzero(array_isStart)
+    array_runLen = np.diff(np.append(array_start, len(df_mergeOrder)))
+    df_right = pd.DataFrame({'Linkage Number': series_linkage.values[array_start], '원본Pos': array_start, 'runLen': array_runLen})
+    df_left = pd.DataFrame({'Linkage Number': df_inst['Linkage Number'].values, 'instPos': np.arange(len(df_inst)), 'orderCnt': df_inst[cntCol].values.astype(np.int64)})
+    df_left = df_left[df_left['Linkage Number'].notna()]
+    df_run = pd.merge(df_left, df_right, on='Linkage Number', how='inner')
+    df_run['수량'] = np.minimum(df_run['orderCnt'].values, df_run['runLen'].values)
+    df_run = df_run[df_run['수량'] > 0]
+    df_run = df_run.sort_values(by=['instPos', '원본Pos'])
+    return df_run[['Linkage Number', '원본Pos', '수량']].reset_index(drop=True)
+
+
+# 구간 DataFrame을 1대 단위로 전개 (원본Pos는 대당 레벨링 리스트 상의 위치로 변환)
+def expandOrderRun(df_run):
+    """
+    Args:
+        df_run(DataFrame)       : encodeOrderRun으로 생성한 구간 DataFrame (추가 컬럼은 그대로 복제)
+    Return:
+        return(DataFrame)       : 1대 단위 DataFrame (수량 컬럼 제외)
+    """
+    array_cnt = df_run['수량'].values.astype(np.int64)
+    array_runPos = np.repeat(np.arange(len(df_run)), array_cnt)
+    # 구간 안에서의 순번
+    array_offset = np.arange(len(array_runPos)) - np.repeat(np.cumsum(array_cnt) - array_cnt, array_cnt)
+    df_result = df_run.drop(columns=['수량']).iloc[array_runPos].reset_index(drop=True)
+    df_result['원본Pos'] = df_result['원본Pos'].values + array_offset
+    return df_result
+
+
+# 착공수량만큼 레벨링 리스트의 행을 선택하여 개별화
+def explodeOrder(df_inst, df_mergeOrder, cntCol='총착공량'):
+    """
+    Args:
+        df_inst(DataFrame)          : Linkage Number별 착공수량 DataFrame
+        df_mergeOrder(DataFrame)    : 레벨링 리스트와 병합된 DataFrame
+        cntCol(str)                 : 착공수량 컬럼명
+    Return:
+        return(DataFrame)           : 개별화된 DataFrame (착공수량 DataFrame 순서, 같은 Linkage Number 안에서는 레벨링 리스트 순서)
+    """
+    df_unit = expandOrderRun(encodeOrderRun(df_inst, df_mergeOrder, cntCol))
+    return df_mergeOrder.iloc[df_unit['원본Pos'].values]
+
+
+# 사이클그룹 계산. 같은 키가 연속된 구간마다 1부터 번호를 매기고(최대 사이클 미만에서 순환), 최대 사이클 / 키별 수량을 곱하여 배수처리
+def getCycleGroup(array_key, array_cnt, array_isCycle, maxCycle):
+    """
+    Args:
+        array_key(ndarray)      : 사이클 구분 키 (검사설비, 상세구분, 대표모델 등)
+        array_cnt(ndarray)      : 키별 수량
+        array_isCycle(ndarray)  : 사이클 대상 여부 (긴급오더 제외)
+        maxCycle(float)         : 최대 사이클 번호
+    Return:
+        return(ndarray)         : 사이클그룹 (사이클 비대상은 0)
+    """
+    rowCnt = len(array_key)
+    array_pos = np.arange(rowCnt)
+    array_isCycle = np.asarray(array_isCycle, dtype=bool)
+    # 직전 행과 키가 달라지는 사이클 대상 행에서 번호를 다시 시작 (두번째 행에서 달라지면 2부터 시작)
+    array_isBreak = np.zeros(rowCnt, dtype=bool)
+    if rowCnt > 1:
+        array_isBreak[1:] = np.asarray(array_key[1:] != array_key[:-1], dtype=bool)
+    array_isBreak &= array_isCycle
+    array_isStart = array_isBreak.copy()
+    if array_isCycle.any():
+        array_isStart[np.argmax(array_isCycle)] = True
+    array_startNo = np.where(array_isBreak & (array_pos == 1), 2, 1)
+    # 구간 안에서 사이클 대상 행의 순번
+    array_cycleNo = np.cumsum(array_isCycle)
+    array_runNo = np.maximum(np.cumsum(array_isStart) - 1, 0)
+    array_rank = array_cycleNo - array_cycleNo[array_isStart][array_runNo] if array_isStart.any() else np.zeros(rowCnt, dtype=np.int64)
+    array_startNo = array_startNo[array_isStart][array_runNo] if array_isStart.any() else array_startNo
+    # 사이클 번호는 최대 사이클 미만에서 1로 순환
+    cycleLen = max(math.ceil(maxCycle) - 1, 1)
+    array_cycleGr = np.where(array_rank == 0, array_startNo, (array_startNo - 1 + array_rank) % cycleLen + 1).astype(float)
+    array_multi = maxCycle / np.asarray(array_cnt, dtype=float)
+    array_result = np.where(array_pos == 0, array_cycleGr, array_cycleGr * array_multi)
+    return np.where(array_isCycle, array_result, 0.0)
+
+
+# 사이클그룹을 작성하고 사이클그룹 순으로 정렬
+def cycleSequence(df_input, keyCol, cntCol, maxCycle, list_tieCol=None):
+    """
+    Args:
+        df_input(DataFrame)     : 사이클링 대상 DataFrame
+        keyCol(str)             : 사이클 구분 키 컬럼명
+        cntCol(str)             : 키별 수량 컬럼명
+        maxCycle(float)         : 최대 사이클 번호
+        list_tieCol(list)       : 사이클그룹이 같을 때 추가로 정렬할 컬럼
+    Return:
+        return(DataFrame)       : 사이클그룹 컬럼을 추가하여 정렬한 DataFrame
+    """
+    df_result = df_input.reset_index(drop=True)
+    df_result['사이클그룹'] = getCycleGroup(df_result[keyCol].values,
+                                        df_result[cntCol].values,
+                                        (df_result['긴급오더'] != '대상').values,
+                                        maxCycle)
+    list_sortCol = ['사이클그룹'] + (list_tieCol if list_tieCol is not None else [])
+    df_result = df_result.sort_values(by=list_sortCol, ascending=[True] * len(list_sortCol), kind='stable')
+    return df_result.reset_index(drop=True)
+
+
+# 같은 키가 연속으로 오지 않도록 순서를 재조정. 연속된 행은 앞에서부터 찾은 첫번째 빈 자리(앞뒤 행과 키가 다른 사이클 대상 행의 뒤)로 옮김
+def spreadAdjacent(df_input, keyCol):
+    """
+    Args:
+        df_input(DataFrame)     : 사이클그룹 순으로 정렬된 DataFrame
+        keyCol(str)             : 연속 여부를 판단할 키 컬럼명
+    Return:
+        return(List)            : [재조정된 DataFrame, 해소하지 못한 연속 건수]
+    """
+    list_key = df_input[keyCol].tolist()
+    list_isCycle = (df_input['긴급오더'] != '대상').tolist()
+    list_order = list(range(len(df_input)))
+    rowCnt = len(list_order)
+    for i in range(1, rowCnt):
+        key = list_key[list_order[i]]
+        if list_isCycle[list_order[i]] and key == list_key[list_order[i - 1]]:
+            for j in range(1, rowCnt - 1):
+                if list_isCycle[list_order[j]] and key != list_key[list_order[j + 1]] and key != list_key[list_order[j]]:
+                    # j행과 j+1행 사이로 이동 (긴급오더는 이동하지 않음)
+                    rowPos = list_order.pop(i)
+                    list_order.insert(j + 1 if j < i else j, rowPos)
+                    break
+    conflictCnt = sum(1 for i in range(1, rowCnt)
+                        if list_isCycle[list_order[i]] and list_key[list_order[i]] == list_key[list_order[i - 1]])
+    df_result = df_input.iloc[list_order].reset_index(drop=True)
+    return [df_result, conflictCnt]
+
+
+# 홀딩리스트와 착공 결과를 MODEL, Linkage Number, MS Code별 착공량으로 비교하여 알람 메시지 작성 (한 항목에 여러 조건이 맞으면 MS-CODE > LINKAGENO > MODEL 순으로 우선)
+def getHoldingMessage(df_holdingList, df_input):
+    """
+    Args:
+        df_holdingList(DataFrame)   : 홀딩리스트 DataFrame
+        df_input(DataFrame)         : 총착공량이 반영된 착공 결과 DataFrame
+    Return:
+        return(List)                : 알람 메시지 리스트 (홀딩리스트 순서)
+    """
+    # Linkage Number는 합계가 아닌 첫번째 착공량을 사용
+    df_linkage = df_input[df_input['Linkage Number'].notna()].drop_duplicates(subset=['Linkage Number'])
+    list_match = [('MODEL', df_input.groupby('MODEL')['총착공량'].sum()),
+                    ('LINKAGENO', df_linkage.set_index('Linkage Number')['총착공량']),
+                    ('MS-CODE', df_input.groupby('MS Code')['총착공량'].sum())]
+    list_remark = df_holdingList['REMARK'].tolist()
+    list_message = [''] * len(df_holdingList)
+    for holdingCol, series_cnt in list_match:
+        list_key = df_holdingList[holdingCol].tolist()
+        array_cnt = df_holdingList[holdingCol].map(series_cnt).values
+        for pos in np.flatnonzero(pd.notna(array_cnt)):
+            list_message[pos] = f"{list_key[pos]} {int(array_cnt[pos])}대 {list_remark[pos]}"
+    return [message for message in list_message if len(message) > 0]
 
 
 # 메인라인 동작 쓰레드
@@ -33,7 +1556,7 @@ class MainThread(QObject):
     mainReturnEmgMscode = pyqtSignal(dict)
 
     # 초기화
-    def __init__(self, debugFlag, date, constDate, list_masterFile, moduleMaxCnt, emgHoldList, cb_round, df_etcOrderInput):
+    def __init__(self, debugFlag, date, constDate, list_masterFile, moduleMaxCnt, emgHoldList, cb_round, df_etcOrderInput, frameStore):
         super().__init__(),
         self.isDebug = debugFlag
         self.date = date
@@ -43,67 +1566,18 @@ class MainThread(QObject):
         self.emgHoldList = emgHoldList
         self.cb_round = cb_round
         self.df_etcOrderInput = df_etcOrderInput
-
-    # 워킹데이 체크 내부함수
-    def checkWorkDay(self, df, today, compDate):
-        dtToday = pd.to_datetime(datetime.datetime.strptime(today, '%Y%m%d'))
-        dtComp = pd.to_datetime(compDate, unit='s')
-        workDay = 0
-        if len(df.index[(df['Date'] == dtComp)].tolist()) > 0:
-            index = int(df.index[(df['Date'] == dtComp)].tolist()[0])
-            # 위에서 찾은 완성지정일로부터 프로그램 구동 당일까지 워킹데이를 계산.
-            while dtToday > pd.to_datetime(df['Date'][index], unit='s'):
-                if df['WorkingDay'][index] == 1:
-                    workDay -= 1
-                index += 1
-            # 프로그램 구동 당일 ~ 완성지정일 까지의 워킹데이를 계산
-            for i in df.index:
-                dt = pd.to_datetime(df['Date'][i], unit='s')
-                if dtToday < dt and dt <= dtComp:
-                    if df['WorkingDay'][i] == 1:
-                        workDay += 1
-        else:
-            self.mainReturnWarning.emit(f'FY{today[2:4]}_Calendar.xlsx 파일에 {str(dtComp.date())} 날짜의 워킹데이 데이터가 없습니다. 대한민국 휴일을 기준으로 근무일을 계산합니다. 이후, 해당 파일에 사력을 추가해주세요')
-            workDay = np.busday_count(begindates=dtToday.date(), enddates=dtComp.date())
-        return workDay
+        self.frameStore = frameStore
+        # 디버그 시, 검사설비 부분 착공 계산값 기록 (검증용)
+        self.list_atePartialLog = []
 
     # 콤마 삭제용 내부함수
     def delComma(self, value):
         return str(value).split('.')[0]
 
     # 디비 불러오기 공통내부함수
-    def readDB(self, ip, port, sid, userName, password, sql):
-        # 오라클 클라이언트 폴더 지정 (프로그램 파일에 이미 넣어둠)
-        location = r'.\\instantclient_21_7'
-        # 해당 폴더를 환경변수에 지정
-        os.environ["PATH"] = location + ";" + os.environ["PATH"]
-        # 입력된 Dsn 설정 및 접속정보로 오라클 접속
-        dsn = cx_Oracle.makedsn(ip, port, sid)
-        db = cx_Oracle.connect(userName, password, dsn)
-        cursor = db.cursor()
-        # Sql 실행
-        cursor.execute(sql)
-        out_data = cursor.fetchall()
-        # 결과값을 Dataframe화
-        df_oracle = pd.DataFrame(out_data)
-        # 컬럼명 지정
-        col_names = [row[0] for row in cursor.description]
-        df_oracle.columns = col_names
-        return df_oracle
-
-    # 생산시간 합계용 내부함수
-    def getSec(self, time_str):
-        time_str = re.sub(r'[^0-9:]', '', str(time_str))
-        if len(time_str) > 0:
-            h, m, s = time_str.split(':')
-            return int(h) * 3600 + int(m) * 60 + int(s)
-        else:
-            return 0
-
-    # 백슬래쉬 삭제용 내부함수
-    def delBackslash(self, value):
-        value = re.sub(r"\\c", "", str(value))
-        return value
+    def readDB(self, ip, port, sid, userName, password, sql, dict_bind=None):
+        # 설정된 데이터 소스(Oracle 세션풀 또는 오프라인 SQLite)로 조회
+        return getDataSource().readDB(ip, port, sid, userName, password, sql, dict_bind)
 
     # 초단위의 시간을 시/분/초로 분할
     def convertSecToTime(self, seconds):
@@ -115,216 +1589,140 @@ class MainThread(QObject):
         return "%d:%02d:%02d" % (hour, minutes, seconds)
 
     # 알람 상세 누적 기록용 내부함수
-    def concatAlarmDetail(self, df_target, no, category, df_data, index, smtAssy, shortageCnt):
+    def concatAlarmDetail(self, alarmDetail, category, df_data, index, smtAssy, shortageCnt):
         """
         Args:
-            df_target(DataFrame)    : 알람상세내역 DataFrame
-            no(int)                 : 알람 번호
-            category(str)           : 알람 분류
-            df_data(DataFrame)      : 원본 DataFrame
-            index(int)              : 원본 DataFrame의 인덱스
-            smtAssy(str)            : Smt Assy 이름
-            shortageCnt(int)        : 부족 수량
-        Return:
-            return(DataFrame)       : 알람상세 Merge결과 DataFrame
+            alarmDetail(AlarmCollector) : 알람상세내역 누적 기록
+            category(str)               : 알람 분류
+            df_data(DataFrame)          : 원본 DataFrame
+            index(int)                  : 원본 DataFrame의 인덱스
+            smtAssy(str)                : Smt Assy 이름
+            shortageCnt(int)            : 부족 수량
         """
-        df_result = pd.DataFrame()
         if category == '1':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": smtAssy,
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '2':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": '-',
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": df_data['INSPECTION_EQUIPMENT'][index],
-                                                                "대상 검사시간(초)": df_data['TotalTime'][index],
-                                                                "필요시간(초)": shortageCnt * df_data['TotalTime'][index],
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '-',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": df_data['INSPECTION_EQUIPMENT'][index],
+                                "대상 검사시간(초)": df_data['TotalTime'][index],
+                                "필요시간(초)": shortageCnt * df_data['TotalTime'][index],
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타1':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": '미등록',
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": 0,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '미등록',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": 0,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타2':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": '-',
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '-',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타3':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": smtAssy,
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타4':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": smtAssy,
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
-        return [df_result, no + 1]
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
 
     # SMT Assy 반영 착공로직
-    def smtReflectInst(self, df_input, isRemain, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo):
+    def smtReflectInst(self, df_input, isRemain, dict_smtCnt, alarmDetail, smtIncidence):
         """
         Args:
             df_input(DataFrame)         : 입력 DataFrame
             isRemain(Bool)              : 잔여착공 여부 Flag
             dict_smtCnt(Dict)           : Smt잔여량 Dict
-            alarmDetailNo(int)          : 알람 번호
-            df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame
-            rowNo(int)                  : 사용 Smt Assy 갯수
+            alarmDetail(AlarmCollector) : 알람 상세 누적 기록
+            smtIncidence(SmtAssyIncidence) : MS Code별 사용 Smt Assy 연결 구조
         Return:
             return(List)
                 df_input(DataFrame)         : 입력 DataFrame (갱신 후)
                 dict_smtCnt(Dict)           : Smt잔여량 Dict (갱신 후)
-                alarmDetailNo(int)          : 알람 번호
-                df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame (갱신 후)
         """
         instCol = '평준화_적용_착공량'
         resultCol = 'SMT반영_착공량'
         if isRemain:
             instCol = '잔여_착공량'
             resultCol = 'SMT반영_착공량_잔여'
-        # 행별로 확인
-        for i in df_input.index:
-            # 사용 Smt Assy 개수 확인
-            for j in range(1, rowNo):
-                if j == 1:
-                    rowCnt = 1
-                if (str(df_input[f'ROW{str(j)}'][i]) != '' and str(df_input[f'ROW{str(j)}'][i]) != 'nan'):
-                    rowCnt = j
-                else:
-                    break
-            if rowNo == 1:
-                rowCnt = 1
-            minCnt = 9999
-            # 각 SmtAssy 별로 착공 가능 대수 확인
-            for j in range(1, rowCnt + 1):
-                smtAssyName = str(df_input[f'ROW{str(j)}'][i])
-                if (df_input['SMT_MS_CODE'][i] != 'nan' and df_input['SMT_MS_CODE'][i] != 'None' and df_input['SMT_MS_CODE'][i] != ''):
-                    if (smtAssyName != '' and smtAssyName != 'nan' and smtAssyName != 'None'):
-                        # 긴급오더 혹은 당일착공 대상일 경우, SMT Assy 잔량에 관계없이 착공 실시.
-                        # SMT Assy가 부족할 경우에는 분류1 알람을 발생.
-                        if df_input['긴급오더'][i] == '대상' or df_input['당일착공'][i] == '대상':
-                            # MS Code와 연결된 SMT Assy가 있을 경우, 정상적으로 로직을 실행
-                            if smtAssyName in dict_smtCnt:
-                                if dict_smtCnt[smtAssyName] < 0:
-                                    diffCnt = df_input['미착공수주잔'][i]
-                                    if dict_smtCnt[smtAssyName] + df_input['미착공수주잔'][i] > 0:
-                                        diffCnt = 0 - dict_smtCnt[smtAssyName]
-                                    if not isRemain:
-                                        if dict_smtCnt[smtAssyName] > 0:
-                                            df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '1', df_input, i, smtAssyName, diffCnt)
-                            # SMT Assy가 DB에 등록되지 않은 경우, 기타3 알람을 출력.
-                            else:
-                                minCnt = 0
-                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타3', df_input, i, smtAssyName, 0)
-                        # 긴급오더 혹은 당일착공 대상이 아닐 경우, SMT Assy 잔량을 확인 후, SMT Assy 잔량이 부족할 경우, 부족한 양만큼 착공.
-                        else:
-                            # 사용하는 SmtAssy가 이미 등록된 SmtAssy일 경우의 로직
-                            if smtAssyName in dict_smtCnt:
-                                # 최소필요착공량보다 SmtAssy 수량이 여유 있는 경우, 그대로 착공
-                                if dict_smtCnt[smtAssyName] >= df_input[instCol][i]:
-                                    # 사용하는 SmtAssy가 다수 일 경우를 고려하여 최소수량 확인
-                                    if minCnt > df_input[instCol][i]:
-                                        minCnt = df_input[instCol][i]
-                                # SmtAssy 수량의 여유가 없는 경우
-                                else:
-                                    # 최소수량과 SmtAssy수량을 다시 비교
-                                    if dict_smtCnt[smtAssyName] > 0:
-                                        if minCnt > dict_smtCnt[smtAssyName]:
-                                            minCnt = dict_smtCnt[smtAssyName]
-                                    # SmtAssy수량이 0개 인 경우, 최소수량을 0으로 전환
-                                    else:
-                                        minCnt = 0
-                                    # 최소착공필요량 전체에 비해 SmtAssy수량이 부족한 경우, 알람을 출력.
-                                    if not isRemain:
-                                        if dict_smtCnt[smtAssyName] > 0:
-                                            df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '1', df_input, i, smtAssyName, df_input[instCol][i] - dict_smtCnt[smtAssyName])
-                            # SMT Assy가 DB에 등록되지 않은 경우, 기타3 알람을 출력.
-                            else:
-                                minCnt = 0
-                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타3', df_input, i, smtAssyName, 0)
-                # MS Code와 연결된 SMT Assy가 등록되지 않았을 경우, 기타1 알람을 출력.
-                else:
-                    minCnt = 0
-                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타1', df_input, i, '미등록', 0)
-            # 최소 수량을 1번이라도 갱신한 경우, 결과컬럼의 값을 minCnt로 대체
-            if minCnt != 9999:
-                df_input[resultCol][i] = minCnt
-            # 갱신하지 않았을 경우, 기존 입력값을 그대로 출력
-            else:
-                df_input[resultCol][i] = df_input[instCol][i]
-            # 사용되는 각 Smt Assy 수량에서 결과값을 빼기위한 로직
-            for j in range(1, rowCnt + 1):
-                if (smtAssyName != '' and smtAssyName != 'nan' and smtAssyName != 'None'):
-                    smtAssyName = str(df_input[f'ROW{str(j)}'][i])
-                    dict_smtCnt[smtAssyName] -= df_input[resultCol][i]
-        return [df_input, dict_smtCnt, alarmDetailNo, df_alarmDetail]
+        if len(df_input) == 0:
+            return [df_input, dict_smtCnt]
+        # 행별 사용 Smt Assy를 코드화
+        array_rowPtr, array_entryPos = smtIncidence.getRowAssy(df_input['MS Code'], ['', 'nan'])
+        array_assyId = smtIncidence.array_assyId[array_entryPos]
+        list_assyName = smtIncidence.list_assyName
+        array_nameValid = ~np.isin(np.array(list_assyName, dtype=object), ['', 'nan', 'None'])
+        array_registered = np.array([assyName in dict_smtCnt for assyName in list_assyName], dtype=bool)
+        array_stock = np.array([dict_smtCnt.get(assyName, 0) for assyName in list_assyName], dtype=object)
+        # 긴급오더 혹은 당일착공 대상일 경우, SMT Assy 잔량에 관계없이 착공 실시.
+        array_urgent = ((df_input['긴급오더'] == '대상') | (df_input['당일착공'] == '대상')).values
+        array_codeValid = (~(df_input['MS Code'].isin(['nan', 'None', '']) & df_input['MS Code'].isin(smtIncidence.list_msCode))).values
+        array_manage = np.ones(len(df_input), dtype=bool)
+        array_bypass = np.zeros(len(df_input), dtype=bool)
+        list_result, list_stock, array_alarmPos, array_alarmCategory, array_alarmAssy, array_alarmShortage, list_missingAssy = smtAllocateKernel(array_rowPtr, array_assyId, array_nameValid, array_registered, array_stock, df_input[instCol].values, array_urgent, array_codeValid, array_manage, array_bypass, isRemain, pd.api.types.is_integer_dtype(df_input[resultCol]))
+        df_input[resultCol] = pd.Series(list_result, index=df_input.index)
+        for assyId in np.flatnonzero(array_registered):
+            dict_smtCnt[list_assyName[assyId]] = list_stock[assyId]
+        # 계산 중 발생한 알람을 순서대로 기록
+        for pos, category, assyId, shortageCnt in zip(array_alarmPos, array_alarmCategory, array_alarmAssy, array_alarmShortage):
+            smtAssyName = '미등록' if assyId < 0 else list_assyName[assyId]
+            self.concatAlarmDetail(alarmDetail, category, df_input, df_input.index[pos], smtAssyName, shortageCnt)
+        return [df_input, dict_smtCnt]
 
     # 검사설비 반영 착공로직
-    def ateReflectInst(self, df_input, isRemain, dict_ate, df_alarmDetail, alarmDetailNo, moduleMaxCnt, limitCtCnt):
+    def ateReflectInst(self, df_input, isRemain, dict_ate, alarmDetail, moduleMaxCnt, limitCtCnt):
         """
         Args:
             df_input(DataFrame)         : 입력 DataFrame
             isRemain(Bool)              : 잔여착공 여부 Flag
             dict_ate(Dict)              : 잔여 검사설비능력 Dict
-            alarmDetailNo(int)          : 알람 번호
-            df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame
+            alarmDetail(AlarmCollector) : 알람 상세 누적 기록
             moduleMaxCnt(int)           : 최대착공량
             limitCtCnt(int)             : CT제한 착공량
         Return:
             return(List)
                 df_input(DataFrame)         : 입력 DataFrame (갱신 후)
                 dict_ate(Dict)              : 잔여 검사설비능력 Dict (갱신 후)
-                alarmDetailNo(int)          : 알람 번호
-                df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame (갱신 후)
                 moduleMaxCnt(int)           : 최대착공량 (갱신 후)
                 limitCtCnt(int)             : CT제한 착공량 (갱신 후)
         """
@@ -349,49 +1747,37 @@ class MainThread(QObject):
                     ateName = ''
                     # 긴급오더 or 당일착공 대상은 검사설비 능력이 부족하여도 강제 착공. 그리고 알람을 기록
                     if (str(df_input['긴급오더'][i]) == '대상') or (str(df_input['당일착공'][i]) == '대상'):
-                        # 대상 검사설비를 한개씩 분할
-                        ateList = list(df_input['INSPECTION_EQUIPMENT'][i])
-                        dict_temp = {}
-                        # 입력되어진 검사설비 시간을 임시 검사설비 딕셔너리에 넣음.
-                        for ate in ateList:
-                            dict_temp[ate] = dict_ate[ate]
-                        # 여유있는 검사설비 순으로 정렬
-                        dict_temp = sorted(dict_temp.items(), key=lambda item: item[1], reverse=True)
-                        # 여유있는 검사설비 순으로 검시시간을 계산하여 넣는다.
-                        for ate in dict_temp:
-                            # 최대 착공량이 0 초과일 경우에만 해당 로직을 실행.
-                            if moduleMaxCnt > 0:
-                                # 일단 가장 여유있는 검사설비와 그 시간을 임시로 가져옴
-                                tempTime = dict_ate[ate[0]]
-                                ateName = ate[0]
-                                # if ate[0] == df_input['INSPECTION_EQUIPMENT'][i][0]:
-                                # 임시 수량 컬럼에 Smt 반영 착공량을 입력
-                                df_input[tempAteCnt][i] = df_input[smtReflectCnt][i]
-                                if df_input[tempAteCnt][i] != 0:
-                                    # 해당 검사설비능력에서 착공분만큼 삭감
-                                    dict_ate[ateName] -= df_input['TotalTime'][i] * df_input[tempAteCnt][i]
-                                    df_input[ateReflectCnt][i] += df_input[tempAteCnt][i]
-                                    # 특수모듈인 경우에는 전체 착공랴에서 빼지 않음
-                                    if df_input['특수대상'][i] != '대상':
-                                        moduleMaxCnt -= df_input[tempAteCnt][i]
-                                    # 임시수량은 초기화
-                                    df_input[tempAteCnt][i] = 0
-                                    # CT사양의 경우 별도 CT제한수량에서도 삭감
-                                    if '/CT' in df_input['MS Code'][i]:
-                                        limitCtCnt -= df_input[tempAteCnt][i]
-                                    break
-                                else:
-                                    break
+                        # 대상 검사설비 (중복 제거, 입력 순서 유지)
+                        ateSet = getAteSet(df_input['INSPECTION_EQUIPMENT'][i])
+                        # 최대 착공량이 0 초과일 경우에만 해당 로직을 실행.
+                        if moduleMaxCnt > 0:
+                            # 가장 여유있는 검사설비와 그 시간을 가져옴 (같은 경우 입력 순서가 빠른 검사설비)
+                            ateName = max(ateSet, key=dict_ate.__getitem__)
+                            tempTime = dict_ate[ateName]
+                            # 임시 수량 컬럼에 Smt 반영 착공량을 입력
+                            df_input[tempAteCnt][i] = df_input[smtReflectCnt][i]
+                            if df_input[tempAteCnt][i] != 0:
+                                # 해당 검사설비능력에서 착공분만큼 삭감
+                                dict_ate[ateName] -= df_input['TotalTime'][i] * df_input[tempAteCnt][i]
+                                df_input[ateReflectCnt][i] += df_input[tempAteCnt][i]
+                                # 특수모듈인 경우에는 전체 착공랴에서 빼지 않음
+                                if df_input['특수대상'][i] != '대상':
+                                    moduleMaxCnt -= df_input[tempAteCnt][i]
+                                # 임시수량은 초기화
+                                df_input[tempAteCnt][i] = 0
+                                # CT사양의 경우 별도 CT제한수량에서도 삭감
+                                if '/CT' in df_input['MS Code'][i]:
+                                    limitCtCnt -= df_input[tempAteCnt][i]
                         # 최대착공량이 0 미만일 경우, 알람 출력
                         if moduleMaxCnt < 0:
-                            df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타2', df_input, i, '-', 0)
+                            self.concatAlarmDetail(alarmDetail, '기타2', df_input, i, '-', 0)
                         # CT제한대수가 0 미만일 경우, 알람 출력
                         if limitCtCnt < 0:
-                            df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타4', df_input, i, '-', 0)
+                            self.concatAlarmDetail(alarmDetail, '기타4', df_input, i, '-', 0)
                             # break
                         # 검사설비능력이 0미만일 경우, 알람 출력
                         if ateName != '' and dict_ate[ateName] < 0:
-                            df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2', df_input, i, '-', math.floor((0 - dict_ate[ateName]) / df_input['TotalTime'][i]))
+                            self.concatAlarmDetail(alarmDetail, '2', df_input, i, '-', math.floor((0 - dict_ate[ateName]) / df_input['TotalTime'][i]))
                             dict_ate[ateName] = 0
                         # 긴급오더 or 당일착공이 아닌 경우는 검사설비 능력을 반영하여 착공 실시
                     else:
@@ -402,16 +1788,15 @@ class MainThread(QObject):
                             limitCtCnt = 0
                         # 첫 착공인지 확인하는 플래그 선언
                         isFirst = True
-                        ateList = list(df_input['INSPECTION_EQUIPMENT'][i])
-                        dict_temp = {}
-                        for ate in ateList:
-                            dict_temp[ate] = dict_ate[ate]
-                        dict_temp = sorted(dict_temp.items(), key=lambda item: item[1], reverse=True)
-                        for ate in dict_temp:
-                            if tempTime <= dict_ate[ate[0]]:
-                                tempTime = dict_ate[ate[0]]
-                                ateName = ate[0]
-                                # if ate[0] == df_input['INSPECTION_EQUIPMENT'][i][0]:
+                        ateSet = getAteSet(df_input['INSPECTION_EQUIPMENT'][i])
+                        maxTime = max(dict_ate[ate] for ate in ateSet)
+                        # 가장 여유있는 검사설비(같은 시간이 여러 개면 입력 순서대로)만 확인
+                        for ate in ateSet:
+                            if dict_ate[ate] != maxTime:
+                                continue
+                            if tempTime <= dict_ate[ate]:
+                                tempTime = dict_ate[ate]
+                                ateName = ate
                                 # 비교리스트에 [Smt반영 착공량], [최대착공량]을 입력
                                 compareList = [df_input[smtReflectCnt][i], moduleMaxCnt]
                                 # LinkageNumber별 첫번째 착공이 아닐 경우(임시수량 있을 경우), [임시수량]도 비교리스트에 입력
@@ -437,27 +1822,27 @@ class MainThread(QObject):
                                     # 검사 설비 능력이 해당 LinkageNumber의 착공수량(임시수량)을 커버 불가능할 경우, 가능한 수량까지를 착공대상으로 선정
                                     elif dict_ate[ateName] >= df_input['TotalTime'][i]:
                                         tempCnt = int(df_input[tempAteCnt][i])
-                                        # 착공수량으로부터 역순으로 Loop문을 실행시켜, 검사설비 능력이 가능한 최대 한도를 확인 후, 그 수량만큼 착공대상으로 선정.
-                                        for j in range(tempCnt, 0, -1):
-                                            if dict_ate[ateName] >= int(df_input['TotalTime'][i]) * j:
-                                                if moduleMaxCnt >= j:
-                                                    df_input[ateReflectCnt][i] = int(df_input[ateReflectCnt][i]) + j
-                                                    dict_ate[ateName] -= int(df_input['TotalTime'][i]) * j
-                                                    df_input[tempAteCnt][i] = tempCnt - j
-                                                    if df_input['특수대상'][i] != '대상':
-                                                        moduleMaxCnt -= j
-                                                    if '/CT' in df_input['MS Code'][i]:
-                                                        limitCtCnt -= j
-                                                    isFirst = False
-                                                    break
+                                        # 검사설비 잔여능력, 임시수량, 최대착공량으로 가능한 최대 한도를 바로 계산 후, 그 수량만큼 착공대상으로 선정.
+                                        j = getAtePartialCnt(dict_ate[ateName], int(df_input['TotalTime'][i]), tempCnt, moduleMaxCnt)
+                                        if self.isDebug:
+                                            self.list_atePartialLog.append([dict_ate[ateName], int(df_input['TotalTime'][i]), tempCnt, moduleMaxCnt, j])
+                                        if j > 0:
+                                            df_input[ateReflectCnt][i] = int(df_input[ateReflectCnt][i]) + j
+                                            dict_ate[ateName] -= int(df_input['TotalTime'][i]) * j
+                                            df_input[tempAteCnt][i] = tempCnt - j
+                                            if df_input['특수대상'][i] != '대상':
+                                                moduleMaxCnt -= j
+                                            if '/CT' in df_input['MS Code'][i]:
+                                                limitCtCnt -= j
+                                            isFirst = False
                                 # else:
                                 #     break
             # CT사양의 최소필요착공량을 착공 못할 경우, 알람을 발생 시킴
             if not isRemain and (df_input[smtReflectCnt][i] > df_input[ateReflectCnt][i]):
                 if '/CT' in df_input['MS Code'][i] and limitCtCnt == 0 and df_input[smtReflectCnt][i] > 0:
-                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타4', df_input, i, '-', df_input[smtReflectCnt][i] - df_input[ateReflectCnt][i])
+                    self.concatAlarmDetail(alarmDetail, '기타4', df_input, i, '-', df_input[smtReflectCnt][i] - df_input[ateReflectCnt][i])
 
-        return [df_input, dict_ate, alarmDetailNo, df_alarmDetail, moduleMaxCnt, limitCtCnt]
+        return [df_input, dict_ate, moduleMaxCnt, limitCtCnt]
 
     def run(self):
         # pandas 경고없애기 옵션 적용
@@ -484,16 +1869,16 @@ class MainThread(QObject):
                 df_emgmscode = pd.DataFrame({'MS Code': emgmscode})
                 df_holdLinkage = pd.DataFrame({'Linkage Number': holdLinkage})
                 df_holdmscode = pd.DataFrame({'MS Code': holdmscode})
-                # 각 Linkage Number 컬럼의 타입을 일치시킴
-                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].astype(np.int64)
-                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].astype(np.int64)
+                # 각 Linkage Number 컬럼을 마스터 파일과 같은 16자리 키로 일치시킴
+                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].map(toLinkageKey)
+                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].map(toLinkageKey)
                 # 긴급오더, 홍딩오더 Join 전 컬럼 추가
                 df_emgLinkage['긴급오더'] = '대상'
                 df_emgmscode['긴급오더'] = '대상'
                 df_holdLinkage['홀딩오더'] = '대상'
                 df_holdmscode['홀딩오더'] = '대상'
                 # 레벨링 리스트 불러오기(멀티프로세싱 적용 후, 분리 예정)
-                df_levelingMain = pd.read_excel(self.list_masterFile[1])
+                df_levelingMain = self.frameStore.get(self.list_masterFile[1], schemaName='LEVELING')
                 # 레벨링 리스트의 착공 당일의 마지막 No를 가져오기 위한 처리
                 df_constDate = df_levelingMain[df_levelingMain['Scheduled Start Date (*)'] == self.constDate]
                 df_constDate = df_constDate[df_constDate['Sequence No'].notnull()]
@@ -508,12 +1893,11 @@ class MainThread(QObject):
                 df_levelingMainUndepSeq = df_levelingMain[df_levelingMain['Sequence No'] == 'Undep']
                 df_levelingMainUncorSeq = df_levelingMain[df_levelingMain['Sequence No'] == 'Uncor']
                 df_levelingMain = pd.concat([df_levelingMainDropSeq, df_levelingMainUndepSeq, df_levelingMainUncorSeq])
-                df_levelingMain['Linkage Number'] = df_levelingMain['Linkage Number'].astype(str)
                 df_levelingMain = df_levelingMain.reset_index(drop=True)
                 df_levelingMain['미착공수주잔'] = df_levelingMain.groupby('Linkage Number')['Linkage Number'].transform('size')
                 # 특수모듈이면서 메인검사장치를 사용하는 모듈의 조건처리
                 df_levelingMain['특수대상'] = ''
-                df_spCondition = pd.read_excel(self.list_masterFile[7])
+                df_spCondition = self.frameStore.get(self.list_masterFile[7])
                 df_ateP = df_spCondition[df_spCondition['검사호기'] == 'P']
                 df_ateP['1차_MAX_그룹'] = df_ateP['1차_MAX_그룹'].fillna(method='ffill')
                 df_ateP['2차_MAX_그룹'] = df_ateP['2차_MAX_그룹'].fillna(method='ffill')
@@ -529,11 +1913,8 @@ class MainThread(QObject):
                     if str(df_ateP['2차_MAX_그룹'][i]) != '-' and str(df_ateP['2차_MAX_그룹'][i]) != '' and str(df_ateP['2차_MAX_그룹'][i]) != 'nan':
                         dict_ateP2ndCnt[df_ateP['2차_MAX_그룹'][i]] = int(df_ateP['2차_MAX'][i])
                 list_ateP = df_ateP['MODEL'].tolist()
-                str_where = ""
-                for list in list_ateP:
-                    str_where += f" OR INSTR(SMT_MS_CODE, '{list}') > 0"
                 if Path(self.list_masterFile[2]).is_file():
-                    df_levelingSp = pd.read_excel(self.list_masterFile[2])
+                    df_levelingSp = self.frameStore.get(self.list_masterFile[2], schemaName='LEVELING')
                     # 미착공 대상만 추출(특수_모듈)
                     df_levelingSpDropSeq = df_levelingSp[df_levelingSp['Sequence No'].isnull()]
                     df_levelingSpUndepSeq = df_levelingSp[df_levelingSp['Sequence No'] == 'Undep']
@@ -541,32 +1922,28 @@ class MainThread(QObject):
                     df_levelingSp = pd.concat([df_levelingSpDropSeq, df_levelingSpUndepSeq, df_levelingSpUncorSeq])
                     df_levelingSp['대표모델6자리'] = df_levelingSp['MS-CODE'].str[:6]
                     df_levelingSp = pd.merge(df_levelingSp, df_ateP, how='right', left_on='대표모델6자리', right_on='MODEL')
-                    df_levelingSp['Linkage Number'] = df_levelingSp['Linkage Number'].astype(str)
                     df_levelingSp = df_levelingSp.reset_index(drop=True)
                     df_levelingSp['미착공수주잔'] = df_levelingSp.groupby('Linkage Number')['Linkage Number'].transform('size')
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 # if self.isDebug:
                 #     df_levelingMain.to_excel('.\\debug\\Main\\flow1.xlsx')
-                df_sosFile = pd.read_excel(self.list_masterFile[0])
-                df_sosFile['Linkage Number'] = df_sosFile['Linkage Number'].astype(str)
+                # 착공 대상 외 모델은 SOS2 파일을 읽을 때 제외하고, 메인/특수(P검사) 레벨링 리스트에 있는 Linkage Number만 가져옴
+                set_linkage = set(df_levelingMain['Linkage Number'])
+                if Path(self.list_masterFile[2]).is_file():
+                    set_linkage |= set(df_levelingSp['Linkage Number'])
+                df_sosFile = self.frameStore.get(self.list_masterFile[0],
+                                                    rowFilter=lambda df: df['Linkage Number'].isin(set_linkage),
+                                                    schemaName='SOS2',
+                                                    excludeMsCode=getSosExcludeMsCode(self.cb_round))
                 if self.isDebug:
                     df_sosFile.to_excel('.\\debug\\Main\\flow2.xlsx')
-                # 착공 대상 외 모델 삭제
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('ZOTHER')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('YZ')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('SF')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('KM')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('TA80')].index)
-                # CT사양은 1차에서만 착공내리도록 처리
-                if self.cb_round != '1차':
-                    df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('CT')].index)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 if self.isDebug:
                     df_sosFile.to_excel('.\\debug\\Main\\flow3.xlsx')
                 # 워킹데이 캘린더 불러오기
-                dfCalendar = pd.read_excel(self.list_masterFile[4])
+                dfCalendar = self.frameStore.get(self.list_masterFile[4], schemaName='CALENDAR')
                 today = datetime.datetime.today().strftime('%Y%m%d')
                 if self.isDebug:
                     today = self.date
@@ -601,9 +1978,6 @@ class MainThread(QObject):
                 df_sosFileMerge['대표모델'] = df_sosFileMerge['MS Code'].str[:9]
                 # 남은 워킹데이 Column 생성
                 df_sosFileMerge['남은 워킹데이'] = 0
-                # 긴급오더, 홀딩오더 Linkage Number Column 타입 일치
-                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].astype(str)
-                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].astype(str)
                 # 긴급오더, 홀딩오더와 위 Sos파일을 Join
                 df_MergeLink = pd.merge(df_sosFileMerge, df_emgLinkage, on='Linkage Number', how='left')
                 df_Mergemscode = pd.merge(df_sosFileMerge, df_emgmscode, on='MS Code', how='left')
@@ -618,12 +1992,12 @@ class MainThread(QObject):
                 df_MergeLink = df_MergeLink.sort_values(by=['Planned Prod. Completion date'], ascending=[True])
                 df_MergeLink = df_MergeLink.reset_index(drop=True)
                 # 남은 워킹데이 체크 및 컬럼 추가
-                for i in df_MergeLink.index:
-                    df_MergeLink['남은 워킹데이'][i] = self.checkWorkDay(dfCalendar, today, df_MergeLink['Planned Prod. Completion date'][i])
-                    if df_MergeLink['남은 워킹데이'][i] < 1:
-                        df_MergeLink['긴급오더'][i] = '대상'
-                    elif df_MergeLink['남은 워킹데이'][i] == 1:
-                        df_MergeLink['당일착공'][i] = '대상'
+                array_workDay, list_missingDate = WorkDayIndex(dfCalendar).getRemainWorkDay(today, df_MergeLink['Planned Prod. Completion date'])
+                for missingDate in list_missingDate:
+                    self.mainReturnWarning.emit(f'FY{today[2:4]}_Calendar.xlsx 파일에 {str(missingDate)} 날짜의 워킹데이 데이터가 없습니다. 대한민국 휴일을 기준으로 근무일을 계산합니다. 이후, 해당 파일에 사력을 추가해주세요')
+                df_MergeLink['남은 워킹데이'] = array_workDay
+                df_MergeLink.loc[df_MergeLink['남은 워킹데이'] < 1, '긴급오더'] = '대상'
+                df_MergeLink.loc[df_MergeLink['남은 워킹데이'] == 1, '당일착공'] = '대상'
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 df_MergeLink['Linkage Number'] = df_MergeLink['Linkage Number'].astype(str)
@@ -643,13 +2017,30 @@ class MainThread(QObject):
                 smtAssyDbSID = parser.get('SMT Assy DB정보', 'SID')
                 smtAssyDbUser = parser.get('SMT Assy DB정보', 'Username')
                 smtAssyDbPw = parser.get('SMT Assy DB정보', 'Password')
-                # 해당 날짜의 Smt Assy 남은 대수 확인
+                # 설정파일 불러오기
+                pdbsDbHost = parser.get('MSCODE별 SMT Assy DB정보', 'Host')
+                pdbsDbPort = parser.getint('MSCODE별 SMT Assy DB정보', 'Port')
+                pdbsDbSID = parser.get('MSCODE별 SMT Assy DB정보', 'SID')
+                pdbsDbUser = parser.get('MSCODE별 SMT Assy DB정보', 'Username')
+                pdbsDbPw = parser.get('MSCODE별 SMT Assy DB정보', 'Password')
+                # DB로부터 메인라인의 MSCode별 사용 Smt Assy 가져옴 (AST, BMS, WEB 모델은 Sql 조건으로 제외)
+                sqlPdbs, dict_bindPdbs = getPdbsSql(['100L1311'], list_ateP)
+                df_pdbs = self.readDB(pdbsDbHost,
+                                        pdbsDbPort,
+                                        pdbsDbSID,
+                                        pdbsDbUser,
+                                        pdbsDbPw,
+                                        sqlPdbs,
+                                        dict_bindPdbs)
+                # 해당 날짜의 Smt Assy 남은 대수 확인 (BOM에 사용되는 Smt Assy만 조회)
+                sqlInven, dict_bindInven = getSmtInvenSql(yesterday, df_pdbs['SMT_SMT_ASSY'].dropna().unique().tolist())
                 df_SmtAssyInven = self.readDB(smtAssyDbHost,
                                                 smtAssyDbPort,
                                                 smtAssyDbSID,
                                                 smtAssyDbUser,
                                                 smtAssyDbPw,
-                                                "SELECT INV_D, PARTS_NO, CURRENT_INV_QTY FROM pdsg0040 where INV_D = TO_DATE(" + str(yesterday) + ",'YYYYMMDD')")
+                                                sqlInven,
+                                                dict_bindInven)
                 df_SmtAssyInven['현재수량'] = 0
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
@@ -659,13 +2050,13 @@ class MainThread(QObject):
                 if Path(self.list_masterFile[5]).is_file() or Path(self.list_masterFile[14]).is_file() or Path(self.list_masterFile[15]).is_file():
                     df_secOrderList = pd.DataFrame(columns=['ASSY NO', '대수', 'SMT STORE ADDRESS'])
                     if Path(self.list_masterFile[5]).is_file():
-                        df_secOrderMainList = pd.read_excel(self.list_masterFile[5], skiprows=5)
+                        df_secOrderMainList = self.frameStore.get(self.list_masterFile[5], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderMainList])
                     if Path(self.list_masterFile[14]).is_file():
-                        df_secOrderPowerList = pd.read_excel(self.list_masterFile[14], skiprows=5)
+                        df_secOrderPowerList = self.frameStore.get(self.list_masterFile[14], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderPowerList])
                     if Path(self.list_masterFile[15]).is_file():
-                        df_secOrderSpList = pd.read_excel(self.list_masterFile[15], skiprows=5)
+                        df_secOrderSpList = self.frameStore.get(self.list_masterFile[15], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderSpList])
                     df_joinSmt = pd.merge(df_secOrderList, df_SmtAssyInven, how='right', left_on='ASSY NO', right_on='PARTS_NO')
                     df_joinSmt['대수'] = df_joinSmt['대수'].fillna(0)
@@ -691,62 +2082,33 @@ class MainThread(QObject):
                 fam3PdTimeDbUser = parser.get('FAM3공수계산DB 정보', 'Username')
                 fam3PdTimeDbPw = parser.get('FAM3공수계산DB 정보', 'Password')
                 # 검사시간DB를 가져옴(공수계산PRG용 DB)
-                df_productTime = self.readDB(fam3PdTimeDbHost, fam3PdTimeDbPort, fam3PdTimeDbSID, fam3PdTimeDbUser, fam3PdTimeDbPw, 'SELECT * FROM FAM3_PRODUCT_TIME_TB')
-                # 전체 검사시간을 계산
-                df_productTime['TotalTime'] = (df_productTime['M_FUNCTION_CHECK'].apply(self.getSec) + df_productTime['A_FUNCTION_CHECK'].apply(self.getSec))
-                # 대표모델 컬럼생성 및 중복 제거
-                df_productTime['대표모델'] = df_productTime['MODEL'].str[:9]
-                df_productTime = df_productTime.drop_duplicates(['대표모델'])
-                df_productTime = df_productTime.reset_index(drop=True)
+                # 전체 검사시간, 대표모델 중복 제거, 검사설비 정리까지 된 결과를 가져옴 (테이블 변경이 없으면 로컬 스냅샷 사용)
+                df_productTime = loadProductTime(fam3PdTimeDbHost, fam3PdTimeDbPort, fam3PdTimeDbSID, fam3PdTimeDbUser, fam3PdTimeDbPw)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 if self.isDebug:
                     df_productTime.to_excel('.\\debug\\Main\\flow7.xlsx')
-                # 설정파일 불러오기
-                pdbsDbHost = parser.get('MSCODE별 SMT Assy DB정보', 'Host')
-                pdbsDbPort = parser.getint('MSCODE별 SMT Assy DB정보', 'Port')
-                pdbsDbSID = parser.get('MSCODE별 SMT Assy DB정보', 'SID')
-                pdbsDbUser = parser.get('MSCODE별 SMT Assy DB정보', 'Username')
-                pdbsDbPw = parser.get('MSCODE별 SMT Assy DB정보', 'Password')
-                # DB로부터 메인라인의 MSCode별 사용 Smt Assy 가져옴
-                df_pdbs = self.readDB(pdbsDbHost,
-                                        pdbsDbPort,
-                                        pdbsDbSID,
-                                        pdbsDbUser,
-                                        pdbsDbPw,
-                                        "SELECT SMT_MS_CODE, SMT_SMT_ASSY, SMT_CRP_GR_NO FROM sap.pdbs0010 WHERE SMT_CRP_GR_NO = '100L1311'" + str_where)
-                # 불필요한 데이터 삭제
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('AST')]
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('BMS')]
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('WEB')]
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 if self.isDebug:
                     df_pdbs.to_excel('.\\debug\\Main\\flow7-1.xlsx')
-                # 사용 Smt Assy를 병렬화
-                gb = df_pdbs.groupby('SMT_MS_CODE')
-                df_temp = pd.DataFrame([df_pdbs.loc[gb.groups[n], 'SMT_SMT_ASSY'].values for n in gb.groups], index=gb.groups.keys())
-                df_temp.columns = ['ROW' + str(i + 1) for i in df_temp.columns]
-                rowNo = len(df_temp.columns)
-                df_temp = df_temp.reset_index()
-                df_temp.rename(columns={'index': 'SMT_MS_CODE'}, inplace=True)
+                # MS Code별 사용 Smt Assy 연결 구조 생성
+                smtIncidence = SmtAssyIncidence(df_pdbs)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 if self.isDebug:
-                    df_temp.to_excel('.\\debug\\Main\\flow7-2.xlsx')
+                    smtIncidence.toFrame().to_excel('.\\debug\\Main\\flow7-2.xlsx')
                 # 검사설비를 List화
                 # df_ATEList = df_productTime.copy()
                 # df_ATEList = df_ATEList.drop_duplicates(['INSPECTION_EQUIPMENT'])
                 # df_ATEList = df_ATEList.reset_index(drop=True)
                 # df_ATEList['INSPECTION_EQUIPMENT'] = df_ATEList['INSPECTION_EQUIPMENT'].apply(self.delBackslash)
                 # df_ATEList['INSPECTION_EQUIPMENT'] = df_ATEList['INSPECTION_EQUIPMENT'].str.strip()
-                df_productTime['INSPECTION_EQUIPMENT'] = df_productTime['INSPECTION_EQUIPMENT'].apply(self.delBackslash)
-                df_productTime['INSPECTION_EQUIPMENT'] = df_productTime['INSPECTION_EQUIPMENT'].str.strip()
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 # if self.isDebug:
                 #     df_ATEList.to_excel('.\\debug\\Main\\flow8.xlsx')
-                df_ATEList = pd.read_excel(self.list_masterFile[12])
+                df_ATEList = self.frameStore.get(self.list_masterFile[12])
                 dict_ate = {}
                 list_priorityAte = []
                 # 각 검사설비를 Key로 검사시간을 Dict화
@@ -757,8 +2119,12 @@ class MainThread(QObject):
                 # 대표모델 별 검사시간 및 검사설비를 Join
                 df_sosAddMainModel = pd.merge(df_MergeLink, df_productTime[['대표모델', 'TotalTime', 'INSPECTION_EQUIPMENT']], on='대표모델', how='left')
                 df_sosAddMainModel = df_sosAddMainModel[~df_sosAddMainModel['INSPECTION_EQUIPMENT'].str.contains('None')]
-                # 모델별 사용 Smt Assy를 Join
-                df_addSmtAssy = pd.merge(df_sosAddMainModel, df_temp, left_on='MS Code', right_on='SMT_MS_CODE', how='left')
+                # 검사설비를 비트마스크(검사설비 판단용)와 정수코드(정렬/그룹용, 문자열 순서와 동일)로 한번만 변환
+                dict_ateBit = getAteBit(df_ATEList['검사호기 분류'])
+                df_sosAddMainModel['검사설비Mask'] = getAteMask(df_sosAddMainModel['INSPECTION_EQUIPMENT'], dict_ateBit)
+                df_sosAddMainModel['검사설비Code'] = pd.factorize(df_sosAddMainModel['INSPECTION_EQUIPMENT'], sort=True)[0]
+                # 모델별 사용 Smt Assy는 smtIncidence에서 MS Code로 조회
+                df_addSmtAssy = df_sosAddMainModel.copy()
                 df_addSmtAssy = df_addSmtAssy.reset_index(drop=True)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
@@ -807,23 +2173,9 @@ class MainThread(QObject):
                 df_flow9 = df_addSmtAssy.copy()
                 if self.isDebug:
                     df_addSmtAssy.to_excel('.\\debug\\Main\\flow9.xlsx')
-                df_addSmtAssyCopy = pd.DataFrame(columns=df_addSmtAssy.columns)
-                # 검사설비능력 최적화를 위하여 미착공수주잔을 20대씩 분할 시킴. (ex. 83대 일 경우, Row를 20, 20, 20, 20, 3으로 5분할)
-                for i in df_addSmtAssy.index:
-                    div = df_addSmtAssy['미착공수주잔'][i] // 20
-                    mod = df_addSmtAssy['미착공수주잔'][i] % 20
-                    df_temp = pd.DataFrame(columns=df_addSmtAssy.columns)
-                    for j in range(0, div + 1):
-                        if j != div:
-                            df_temp = df_temp.append(df_addSmtAssy.iloc[i])
-                            df_temp = df_temp.reset_index(drop=True)
-                            df_temp['미착공수주잔'][j] = 20
-                        elif mod > 0:
-                            df_temp = df_temp.append(df_addSmtAssy.iloc[i])
-                            df_temp = df_temp.reset_index(drop=True)
-                            df_temp['미착공수주잔'][j] = mod
-                    df_addSmtAssyCopy = pd.concat([df_addSmtAssyCopy, df_temp])
-                df_addSmtAssy = df_addSmtAssyCopy.reset_index(drop=True)
+                # 검사설비능력 최적화를 위하여 미착공수주잔을 분할 단위(기본 20대)씩 분할 시킴. (ex. 83대 일 경우, Row를 20, 20, 20, 20, 3으로 5분할)
+                chunkSize = parser.getint('착공 설정', 'ChunkSize', fallback=20)
+                df_addSmtAssy = splitChunk(df_addSmtAssy, '미착공수주잔', chunkSize)
                 if self.isDebug:
                     df_addSmtAssy.to_excel('.\\debug\\Main\\flow9-1.xlsx')
                 dict_minContCopy = dict_minContCnt.copy()
@@ -853,15 +2205,14 @@ class MainThread(QObject):
                     df_addSmtAssy.to_excel('.\\debug\\Main\\flow10.xlsx')
                 df_addSmtAssy['SMT반영_착공량'] = 0
                 # 알람 상세 DataFrame 생성
-                df_alarmDetail = pd.DataFrame(columns=["No.", "분류", "L/N", "MS CODE", "SMT ASSY", "수주수량", "부족수량", "검사호기", "대상 검사시간(초)", "필요시간(초)", "완성예정일"])
-                alarmDetailNo = 1
+                alarmDetail = AlarmCollector(["No.", "분류", "L/N", "MS CODE", "SMT ASSY", "수주수량", "부족수량", "검사호기", "대상 검사시간(초)", "필요시간(초)", "완성예정일"])
                 # 최소착공량에 대해 Smt적용 착공량 계산
-                df_addSmtAssy, dict_smtCnt, alarmDetailNo, df_alarmDetail = self.smtReflectInst(df_addSmtAssy, False, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo)
+                df_addSmtAssy, dict_smtCnt = self.smtReflectInst(df_addSmtAssy, False, dict_smtCnt, alarmDetail, smtIncidence)
                 if self.isDebug:
-                    df_alarmDetail.to_excel('.\\debug\\Main\\df_alarmDetail.xlsx')
+                    alarmDetail.toFrame().to_excel('.\\debug\\Main\\df_alarmDetail.xlsx')
                 # 잔여 착공량에 대해 Smt적용 착공량 계산
                 df_addSmtAssy['SMT반영_착공량_잔여'] = 0
-                df_addSmtAssy, dict_smtCnt, alarmDetailNo, df_alarmDetail = self.smtReflectInst(df_addSmtAssy, True, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo)
+                df_addSmtAssy, dict_smtCnt = self.smtReflectInst(df_addSmtAssy, True, dict_smtCnt, alarmDetail, smtIncidence)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 if self.isDebug:
@@ -877,41 +2228,40 @@ class MainThread(QObject):
                 df_unPriority = pd.DataFrame(columns=df_addSmtAssy.columns)
                 # 우선사용 검사설비 대상을 찾아 우선사용/비사용 데이터 프레임으로 분할
                 if len(list_priorityAte) > 0:
-                    for ate in list_priorityAte:
-                        df_priority = pd.concat([df_priority, df_addSmtAssy[df_addSmtAssy['INSPECTION_EQUIPMENT'].str.contains(ate)]])
-                        df_priority = pd.concat([df_priority, df_addSmtAssy[df_addSmtAssy['긴급오더'].notnull()]])
-                        df_priority = pd.concat([df_priority, df_addSmtAssy[df_addSmtAssy['당일착공'].str.contains('대상')]])
-                        if len(df_unPriority) > 0:
-                            df_unPriority = pd.merge(df_unPriority, df_addSmtAssy[~df_addSmtAssy['INSPECTION_EQUIPMENT'].str.contains(ate)], how='inner')
-                            df_unPriority = df_unPriority[df_unPriority['긴급오더'].isnull()]
-                            df_unPriority = df_unPriority[~df_unPriority['당일착공'].str.contains('대상')]
-                            df_unPriority = df_unPriority.drop_duplicates(['index'])
-                        else:
-                            df_unPriority = df_addSmtAssy[~df_addSmtAssy['INSPECTION_EQUIPMENT'].str.contains(ate)]
-                            df_unPriority = df_unPriority[df_unPriority['긴급오더'].isnull()]
-                            df_unPriority = df_unPriority[~df_unPriority['당일착공'].str.contains('대상')]
-                            df_unPriority = df_unPriority.drop_duplicates(['index'])
-                        df_priority = df_priority.drop_duplicates(['index'])
+                    array_ateMask = df_addSmtAssy['검사설비Mask'].values
+                    # 우선사용 순서 : 첫번째 우선사용 검사설비 > 긴급오더 > 당일착공 > 두번째 이후 우선사용 검사설비 (같은 순서 안에서는 기존 순서 유지)
+                    array_priorityNo = np.full(len(df_addSmtAssy), np.inf)
+                    for ateNo in range(len(list_priorityAte) - 1, 0, -1):
+                        array_priorityNo[(array_ateMask & dict_ateBit.get(list_priorityAte[ateNo], 0)) != 0] = 3 * ateNo
+                    array_priorityNo[df_addSmtAssy['당일착공'].str.contains('대상', na=False).values] = 2
+                    array_priorityNo[df_addSmtAssy['긴급오더'].notnull().values] = 1
+                    array_priorityNo[(array_ateMask & dict_ateBit.get(list_priorityAte[0], 0)) != 0] = 0
+                    array_isPriority = np.isfinite(array_priorityNo)
+                    array_order = np.flatnonzero(array_isPriority)[np.argsort(array_priorityNo[array_isPriority], kind='stable')]
+                    df_priority = pd.concat([df_priority, df_addSmtAssy.iloc[array_order]])
+                    df_unPriority = df_addSmtAssy[~array_isPriority]
                 else:
                     df_unPriority = df_addSmtAssy.copy()
                 if self.isDebug:
                     df_priority.to_excel('.\\debug\\Main\\flow11-1.xlsx')
                     df_unPriority.to_excel('.\\debug\\Main\\flow11-2.xlsx')
                 # CT제한 조건표를 불러오기
-                df_limitCtCond = pd.read_excel(self.list_masterFile[13])
+                df_limitCtCond = self.frameStore.get(self.list_masterFile[13])
                 limitCtCnt = df_limitCtCond[df_limitCtCond['상세구분'] == 'MAIN']['허용수량'].values[0]
                 # 설비능력 반영 착공량 계산
                 # print(df_priority.head())
                 # print(df_unPriority.head())
-                df_priority, dict_ate, alarmDetailNo, df_alarmDetail, self.moduleMaxCnt, limitCtCnt = self.ateReflectInst(df_priority, False, dict_ate, df_alarmDetail, alarmDetailNo, self.moduleMaxCnt, limitCtCnt)
+                df_priority, dict_ate, self.moduleMaxCnt, limitCtCnt = self.ateReflectInst(df_priority, False, dict_ate, alarmDetail, self.moduleMaxCnt, limitCtCnt)
                 # if self.isDebug:
                 #     df_priority.to_excel('.\\debug\\Main\\flow11-3.xlsx')
                 # 잔여 착공량에 대해 설비능력 반영 착공량 계산
-                df_priority, dict_ate, alarmDetailNo, df_alarmDetail, self.moduleMaxCnt, limitCtCnt = self.ateReflectInst(df_priority, True, dict_ate, df_alarmDetail, alarmDetailNo, self.moduleMaxCnt, limitCtCnt)
+                df_priority, dict_ate, self.moduleMaxCnt, limitCtCnt = self.ateReflectInst(df_priority, True, dict_ate, alarmDetail, self.moduleMaxCnt, limitCtCnt)
                 # 설비능력 반영 착공량 계산
-                df_unPriority, dict_ate, alarmDetailNo, df_alarmDetail, self.moduleMaxCnt, limitCtCnt = self.ateReflectInst(df_unPriority, False, dict_ate, df_alarmDetail, alarmDetailNo, self.moduleMaxCnt, limitCtCnt)
+                df_unPriority, dict_ate, self.moduleMaxCnt, limitCtCnt = self.ateReflectInst(df_unPriority, False, dict_ate, alarmDetail, self.moduleMaxCnt, limitCtCnt)
                 # 잔여 착공량에 대해 설비능력 반영 착공량 계산
-                df_unPriority, dict_ate, alarmDetailNo, df_alarmDetail, self.moduleMaxCnt, limitCtCnt = self.ateReflectInst(df_unPriority, True, dict_ate, df_alarmDetail, alarmDetailNo, self.moduleMaxCnt, limitCtCnt)
+                df_unPriority, dict_ate, self.moduleMaxCnt, limitCtCnt = self.ateReflectInst(df_unPriority, True, dict_ate, alarmDetail, self.moduleMaxCnt, limitCtCnt)
+                if self.isDebug:
+                    pd.DataFrame(self.list_atePartialLog, columns=['검사설비잔여능력', '검사시간', '임시수량', '최대착공량', '착공수량']).to_excel('.\\debug\\Main\\ate_partial.xlsx', index=False)
                 # 검사설비 우선사용/비사용 데이터프레임을 다시 통합.
                 df_addSmtAssy = pd.concat([df_priority, df_unPriority])
                 # 잔여 검사설비능력 출력을 위하여 데이터프레임 선언
@@ -934,9 +2284,10 @@ class MainThread(QObject):
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 df_addSmtAssy = df_addSmtAssy.reset_index(drop=True)
+                # 누적된 알람 상세 기록을 DataFrame으로 변환
+                df_alarmDetail = alarmDetail.toFrame()
                 if self.isDebug:
                     df_addSmtAssy.to_excel('.\\debug\\Main\\flow12.xlsx')
-                    df_alarmDetail = df_alarmDetail.reset_index(drop=True)
                     df_alarmDetail.to_excel('.\\debug\\Main\\df_alarmDetail.xlsx')
                 # 알람 상세 결과에서 각 항목별로 요약
                 if len(df_alarmDetail) > 0:
@@ -1027,14 +2378,8 @@ class MainThread(QObject):
                         df_alarmDetail.to_excel(writer, sheet_name='상세', index=True)
                         df_alarmExplain.to_excel(writer, sheet_name='설명', index=False)
                 addColumnList = ['평준화_적용_착공량', '잔여_착공량', 'SMT반영_착공량', 'SMT반영_착공량_잔여', '설비능력반영_착공량', '설비능력반영_착공량_잔여']
-                # 20개씩 분할되었던 Row를 하나로 통합하는 작업 실시
-                for column in addColumnList:
-                    df_group = df_addSmtAssy.groupby('Linkage Number')[column].sum()
-                    df_group = df_group.reset_index()
-                    df_group.columns = ['Linkage Number', column]
-                    df_flow9 = pd.merge(df_flow9, df_group[['Linkage Number', column]], on='Linkage Number', how='left')
-                    df_flow9[column] = df_flow9[column].fillna(0)
-                df_addSmtAssy = df_flow9.copy()
+                # 분할되었던 Row를 분할 전 Row 기준으로 하나로 통합하는 작업 실시
+                df_addSmtAssy = mergeChunk(df_flow9, df_addSmtAssy, addColumnList)
                 df_addSmtAssy = df_addSmtAssy.sort_values(by=['우선착공', '긴급오더', '당일착공', 'Planned Prod. Completion date', '설비능력반영_착공량', '설비능력반영_착공량_잔여'], ascending=[False, False, False, True, False, False])
                 df_addSmtAssy = df_addSmtAssy.reset_index(drop=True)
                 df_addSmtAssy['MODEL'] = df_addSmtAssy['MS Code'].str[:6]
@@ -1044,24 +2389,10 @@ class MainThread(QObject):
                 df_addSmtAssy['총착공량'] = df_addSmtAssy['설비능력반영_착공량'] + df_addSmtAssy['설비능력반영_착공량_잔여']
                 df_addSmtAssy = df_addSmtAssy[df_addSmtAssy['총착공량'] != 0]
                 # 홀딩리스트 파일 불러오기
-                df_holdingList = pd.read_excel(self.list_masterFile[17])
+                df_holdingList = self.frameStore.get(self.list_masterFile[17])
                 # 홀딩리스트와 비교하여 조건에 해당하는 경우, 알람 메시지 출력
-                for i in df_holdingList.index:
-                    message = ""
-                    if len(df_addSmtAssy[df_addSmtAssy['MODEL'] == df_holdingList['MODEL'][i]]['총착공량'].values) > 0:
-                        totalCnt = 0
-                        for cnt in df_addSmtAssy[df_addSmtAssy['MODEL'] == df_holdingList['MODEL'][i]]['총착공량'].values:
-                            totalCnt += cnt
-                        message = f"{df_holdingList['MODEL'][i]} {int(totalCnt)}대 {df_holdingList['REMARK'][i]}"
-                    if len(df_addSmtAssy[df_addSmtAssy['Linkage Number'] == df_holdingList['LINKAGENO'][i]]['총착공량'].values) > 0:
-                        message = f"{df_holdingList['LINKAGENO'][i]} {int(df_addSmtAssy[df_addSmtAssy['Linkage Number'] == df_holdingList['LINKAGENO'][i]]['총착공량'].values[0])}대 {df_holdingList['REMARK'][i]}"
-                    if len(df_addSmtAssy[df_addSmtAssy['MS Code'] == df_holdingList['MS-CODE'][i]]['총착공량'].values) > 0:
-                        totalCnt = 0
-                        for cnt in df_addSmtAssy[df_addSmtAssy['MS Code'] == df_holdingList['MS-CODE'][i]]['총착공량'].values:
-                            totalCnt += cnt
-                        message = f"{df_holdingList['MS-CODE'][i]} {int(totalCnt)}대 {df_holdingList['REMARK'][i]}"
-                    if len(message) > 0:
-                        self.mainReturnWarning.emit(message)
+                for message in getHoldingMessage(df_holdingList, df_addSmtAssy):
+                    self.mainReturnWarning.emit(message)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 if self.isDebug:
@@ -1080,22 +2411,13 @@ class MainThread(QObject):
                 self.mainReturnPb.emit(progress)
                 if self.isDebug:
                     df_mergeOrder.to_excel('.\\debug\\Main\\flow14.xlsx')
-                df_mergeOrderResult = pd.DataFrame().reindex_like(df_mergeOrder)
-                df_mergeOrderResult = df_mergeOrderResult[0:0]
-                # 총착공량 만큼 개별화
-                for i in df_addSmtAssy.index:
-                    for j in df_mergeOrder.index:
-                        if df_addSmtAssy['Linkage Number'][i] == df_mergeOrder['Linkage Number'][j]:
-                            if j > 0:
-                                if df_mergeOrder['Linkage Number'][j] != df_mergeOrder['Linkage Number'][j - 1]:
-                                    orderCnt = int(df_addSmtAssy['총착공량'][i])
-                            else:
-                                orderCnt = int(df_addSmtAssy['총착공량'][i])
-                            if orderCnt > 0:
-                                df_mergeOrderResult = df_mergeOrderResult.append(df_mergeOrder.iloc[j])
-                                orderCnt -= 1
+                # 총착공량 만큼 구간 단위로 압축. 사이클링은 필요한 컬럼만 가진 1대 단위 DataFrame으로 진행하고, 레벨링 리스트 전체 컬럼은 결과 작성 직전에 전개
+                df_orderRun = encodeOrderRun(df_addSmtAssy, df_mergeOrder)
+                df_runKey = df_mergeOrder[['MS Code', '검사설비Code', '긴급오더']].iloc[df_orderRun['원본Pos'].values].reset_index(drop=True)
+                df_orderRun = pd.concat([df_orderRun, df_runKey], axis=1)
+                df_mergeOrderResult = expandOrderRun(df_orderRun)
                 # 사이클링을 위해 검사설비별로 정리
-                df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['INSPECTION_EQUIPMENT'], ascending=[False])
+                df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['검사설비Code'], ascending=[False], kind='stable')
                 df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
@@ -1105,11 +2427,11 @@ class MainThread(QObject):
                 df_unCt = df_mergeOrderResult[df_mergeOrderResult['MS Code'].str.contains('/CT')]
                 df_mergeOrderResult = df_mergeOrderResult[~df_mergeOrderResult['MS Code'].str.contains('/CT')]
                 df_cycleCopy = df_mergeOrderResult[df_mergeOrderResult['긴급오더'].isnull()]
-                df_cycleCopy['검사장치Cnt'] = df_cycleCopy.groupby('INSPECTION_EQUIPMENT')['INSPECTION_EQUIPMENT'].transform('size')
+                df_cycleCopy['검사장치Cnt'] = df_cycleCopy.groupby('검사설비Code')['검사설비Code'].transform('size')
                 df_cycleCopy = df_cycleCopy.sort_values(by=['검사장치Cnt'], ascending=[False])
                 df_cycleCopy = df_cycleCopy.reset_index(drop=True)
                 # 긴급오더 포함한 Df와 병합
-                df_mergeOrderResult = pd.merge(df_mergeOrderResult, df_cycleCopy[['Planned Order', '검사장치Cnt']], on='Planned Order', how='left')
+                df_mergeOrderResult = pd.merge(df_mergeOrderResult, df_cycleCopy[['원본Pos', '검사장치Cnt']], on='원본Pos', how='left')
                 df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['검사장치Cnt'], ascending=[False])
                 df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
                 progress += round(maxPb / 21)
@@ -1118,47 +2440,23 @@ class MainThread(QObject):
                     df_mergeOrderResult.to_excel('.\\debug\\Main\\flow15-1.xlsx')
                 # 최대 사이클 번호 체크
                 maxCycle = float(df_cycleCopy['검사장치Cnt'][0])
-                cycleGr = 1.0
-                df_mergeOrderResult['사이클그룹'] = 0
-                # 각 검사장치별로 사이클 그룹을 작성하고, 최대 사이클과 비교하여 각 사이클그룹에서 배수처리
-                for i in df_mergeOrderResult.index:
-                    if df_mergeOrderResult['긴급오더'][i] != '대상':
-                        multiCnt = maxCycle / df_mergeOrderResult['검사장치Cnt'][i]
-                        if i == 0:
-                            df_mergeOrderResult['사이클그룹'][i] = cycleGr
-                        else:
-                            if df_mergeOrderResult['INSPECTION_EQUIPMENT'][i] != df_mergeOrderResult['INSPECTION_EQUIPMENT'][i - 1]:
-                                if i == 1:
-                                    cycleGr = 2.0
-                                else:
-                                    cycleGr = 1.0
-                            df_mergeOrderResult['사이클그룹'][i] = cycleGr * multiCnt
-                        cycleGr += 1.0
-                    if cycleGr >= maxCycle:
-                        cycleGr = 1.0
-                # 배정된 사이클 그룹 순으로 정렬
-                df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['사이클그룹'], ascending=[True])
-                df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
+                # 각 검사장치별로 사이클 그룹을 작성하고, 최대 사이클과 비교하여 각 사이클그룹에서 배수처리한 뒤 사이클그룹 순으로 정렬
+                df_mergeOrderResult = cycleSequence(df_mergeOrderResult, '검사설비Code', '검사장치Cnt', maxCycle)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
                 if self.isDebug:
                     df_mergeOrderResult.to_excel('.\\debug\\Main\\flow16.xlsx')
                 df_mergeOrderResult = df_mergeOrderResult.reset_index()
                 # 연속으로 같은 검사설비가 오지 않도록 순서를 재조정
-                for i in df_mergeOrderResult.index:
-                    if df_mergeOrderResult['긴급오더'][i] != '대상':
-                        if (i != 0 and (df_mergeOrderResult['INSPECTION_EQUIPMENT'][i] == df_mergeOrderResult['INSPECTION_EQUIPMENT'][i - 1])):
-                            for j in df_mergeOrderResult.index:
-                                if df_mergeOrderResult['긴급오더'][j] != '대상':
-                                    if ((j != 0 and j < len(df_mergeOrderResult) - 1) and (df_mergeOrderResult['INSPECTION_EQUIPMENT'][i] != df_mergeOrderResult['INSPECTION_EQUIPMENT'][j + 1]) and (df_mergeOrderResult['INSPECTION_EQUIPMENT'][i] != df_mergeOrderResult['INSPECTION_EQUIPMENT'][j])):
-                                        df_mergeOrderResult['index'][i] = (float(df_mergeOrderResult['index'][j]) + float(df_mergeOrderResult['index'][j + 1])) / 2
-                                        df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['index'], ascending=[True])
-                                        df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
-                                        break
+                df_mergeOrderResult, conflictCnt = spreadAdjacent(df_mergeOrderResult, '검사설비Code')
+                if conflictCnt > 0:
+                    self.mainReturnWarning.emit(f'같은 검사설비가 연속으로 배치된 곳이 [{conflictCnt}건] 남았습니다. 확인해주세요.')
                 df_unCt['index'] = 0
                 df_unCt['사이클그룹'] = 0
                 # CT대상인 모델과 비대상 모델을 다시 병합. (CT는 사이클그룹이 가장최상위)
                 df_mergeOrderResult = pd.concat([df_unCt, df_mergeOrderResult])
+                # 정해진 순서대로 레벨링 리스트 전체 컬럼을 전개
+                df_mergeOrderResult = df_mergeOrder.iloc[df_mergeOrderResult['원본Pos'].values]
                 df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
                 progress += round(maxPb / 21)
                 self.mainReturnPb.emit(progress)
@@ -1241,7 +2539,7 @@ class PowerThread(QObject):
     powerReturnEmgLinkage = pyqtSignal(dict)
     powerReturnEmgMscode = pyqtSignal(dict)
 
-    def __init__(self, debugFlag, date, constDate, list_masterFile, moduleMaxCnt, emgHoldList, cb_round, df_etcOrderInput):
+    def __init__(self, debugFlag, date, constDate, list_masterFile, moduleMaxCnt, emgHoldList, cb_round, df_etcOrderInput, frameStore):
         super().__init__()
         self.isDebug = debugFlag
         self.date = date
@@ -1251,47 +2549,16 @@ class PowerThread(QObject):
         self.emgHoldList = emgHoldList
         self.cb_round = cb_round
         self.df_etcOrderInput = df_etcOrderInput
-
-    # 워킹데이 체크 내부함수
-    def checkWorkDay(self, df, today, compDate):
-        dtToday = pd.to_datetime(datetime.datetime.strptime(today, '%Y%m%d'))
-        dtComp = pd.to_datetime(compDate, unit='s')
-        workDay = 0
-        if len(df.index[(df['Date'] == dtComp)].tolist()) > 0:
-            index = int(df.index[(df['Date'] == dtComp)].tolist()[0])
-            # 위에서 찾은 완성지정일로부터 프로그램 구동 당일까지 워킹데이를 계산.
-            while dtToday > pd.to_datetime(df['Date'][index], unit='s'):
-                if df['WorkingDay'][index] == 1:
-                    workDay -= 1
-                index += 1
-            # 프로그램 구동 당일 ~ 완성지정일 까지의 워킹데이를 계산
-            for i in df.index:
-                dt = pd.to_datetime(df['Date'][i], unit='s')
-                if dtToday < dt and dt <= dtComp:
-                    if df['WorkingDay'][i] == 1:
-                        workDay += 1
-        else:
-            self.powerReturnWarning.emit(f'FY{today[2:4]}_Calendar.xlsx 파일에 {str(dtComp.date())} 날짜의 워킹데이 데이터가 없습니다. 대한민국 휴일을 기준으로 근무일을 계산합니다. 이후, 해당 파일에 사력을 추가해주세요')
-            workDay = np.busday_count(begindates=dtToday.date(), enddates=dtComp.date())
-        return workDay
+        self.frameStore = frameStore
 
     # 콤마 삭제용 내부함수
     def delComma(self, value):
         return str(value).split('.')[0]
 
     # 디비 불러오기 공통내부함수
-    def readDB(self, ip, port, sid, userName, password, sql):
-        location = r'.\\instantclient_21_7'
-        os.environ["PATH"] = location + ";" + os.environ["PATH"]
-        dsn = cx_Oracle.makedsn(ip, port, sid)
-        db = cx_Oracle.connect(userName, password, dsn)
-        cursor = db.cursor()
-        cursor.execute(sql)
-        out_data = cursor.fetchall()
-        df_oracle = pd.DataFrame(out_data)
-        col_names = [row[0] for row in cursor.description]
-        df_oracle.columns = col_names
-        return df_oracle
+    def readDB(self, ip, port, sid, userName, password, sql, dict_bind=None):
+        # 설정된 데이터 소스(Oracle 세션풀 또는 오프라인 SQLite)로 조회
+        return getDataSource().readDB(ip, port, sid, userName, password, sql, dict_bind)
 
     # 생산시간 합계용 내부함수
     def getSec(self, time_str):
@@ -1302,219 +2569,134 @@ class PowerThread(QObject):
         else:
             return 0
 
-    def concatAlarmDetail(self, df_target, no, category, df_data, index, smtAssy, shortageCnt):
+    def concatAlarmDetail(self, alarmDetail, category, df_data, index, smtAssy, shortageCnt):
         """
         Args:
-            df_target(DataFrame)    : 알람상세내역 DataFrame
-            no(int)                 : 알람 번호
-            category(str)           : 알람 분류
-            df_data(DataFrame)      : 원본 DataFrame
-            index(int)              : 원본 DataFrame의 인덱스
-            smtAssy(str)            : Smt Assy 이름
-            shortageCnt(int)        : 부족 수량
-        Return:
-            return(DataFrame)       : 알람상세 Merge결과 DataFrame
+            alarmDetail(AlarmCollector) : 알람상세내역 누적 기록
+            category(str)               : 알람 분류
+            df_data(DataFrame)          : 원본 DataFrame
+            index(int)                  : 원본 DataFrame의 인덱스
+            smtAssy(str)                : Smt Assy 이름
+            shortageCnt(int)            : 부족 수량
         """
-        df_result = pd.DataFrame()
         if category == '1':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": smtAssy,
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif '2-' in category:
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": '-',
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '-',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타1':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": '미등록',
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": 0,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '미등록',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": 0,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타2':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": '-',
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '-',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타3':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": smtAssy,
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": 0,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": 0,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타4':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": smtAssy,
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
-        return [df_result, no + 1]
-
-    def smtReflectInst(self, df_input, isRemain, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo):
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
+
+    def smtReflectInst(self, df_input, isRemain, dict_smtCnt, alarmDetail, smtIncidence):
         """
         Args:
             df_input(DataFrame)         : 입력 DataFrame
             isRemain(Bool)              : 잔여착공 여부 Flag
             dict_smtCnt(Dict)           : Smt잔여량 Dict
-            alarmDetailNo(int)          : 알람 번호
-            df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame
-            rowNo(int)                  : 사용 Smt Assy 갯수
+            alarmDetail(AlarmCollector) : 알람 상세 누적 기록
+            smtIncidence(SmtAssyIncidence) : MS Code별 사용 Smt Assy 연결 구조
         Return:
             return(List)
                 df_input(DataFrame)         : 입력 DataFrame (갱신 후)
                 dict_smtCnt(Dict)           : Smt잔여량 Dict (갱신 후)
-                alarmDetailNo(int)          : 알람 번호
-                df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame (갱신 후)
         """
         instCol = '평준화_적용_착공량'
         resultCol = 'SMT반영_착공량'
         if isRemain:
             instCol = '잔여_착공량'
             resultCol = 'SMT반영_착공량_잔여'
-        # 행별로 확인
-        for i in df_input.index:
-            # BU는 SMT Assy를 확인하지 않음.
-            if df_input['MS Code'][i][:4] == 'F3BU':
-                df_input[resultCol][i] = df_input[instCol][i]
-            else:
-                # 사용 Smt Assy 개수 확인
-                for j in range(1, rowNo):
-                    if j == 1:
-                        rowCnt = 1
-                    if (str(df_input[f'ROW{str(j)}'][i]) != '' and str(df_input[f'ROW{str(j)}'][i]) != 'nan'):
-                        rowCnt = j
-                    else:
-                        break
-                if rowNo == 1:
-                    rowCnt = 1
-                minCnt = 9999
-                # 각 SmtAssy 별로 착공 가능 대수 확인
-                for j in range(1, rowCnt + 1):
-                    smtAssyName = str(df_input[f'ROW{str(j)}'][i])
-                    if (df_input['SMT_MS_CODE'][i] != 'nan' and df_input['SMT_MS_CODE'][i] != 'None' and df_input['SMT_MS_CODE'][i] != ''):
-                        if (smtAssyName != '' and smtAssyName != 'nan' and smtAssyName != 'None'):
-                            # 긴급오더 혹은 당일착공 대상일 경우, SMT Assy 잔량에 관계없이 착공 실시.
-
-                            if (df_input['긴급오더'][i] == '대상' or df_input['당일착공'][i] == '대상' and not isRemain):
-                                # MS Code와 연결된 SMT Assy가 있을 경우, 정상적으로 로직을 실행
-                                if smtAssyName in dict_smtCnt:
-                                    if dict_smtCnt[smtAssyName] < 0:
-                                        diffCnt = df_input['미착공수주잔'][i]
-                                        if dict_smtCnt[smtAssyName] + df_input['미착공수주잔'][i] > 0:
-                                            diffCnt = 0 - dict_smtCnt[smtAssyName]
-                                        # SMT Assy가 부족할 경우에는 분류1 알람을 발생.
-                                        if not isRemain:
-                                            if dict_smtCnt[smtAssyName] > 0:
-                                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '1', df_input, i, smtAssyName, diffCnt)
-                                # SMT Assy가 DB에 등록되지 않은 경우, 기타3 알람을 출력.
-                                else:
-                                    minCnt = 0
-                                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타3', df_input, i, smtAssyName, 0)
-                            # 긴급오더 혹은 당일착공 대상이 아닐 경우, SMT Assy 잔량을 확인 후, SMT Assy 잔량이 부족할 경우, 부족한 양만큼 착공.
-                            else:
-                                # 사용하는 SmtAssy가 이미 등록된 SmtAssy일 경우의 로직
-                                if smtAssyName in dict_smtCnt:
-                                    # 최소필요착공량보다 SmtAssy 수량이 여유 있는 경우, 그대로 착공
-                                    if dict_smtCnt[smtAssyName] >= df_input[instCol][i]:
-                                        # 사용하는 SmtAssy가 다수 일 경우를 고려하여 최소수량 확인
-                                        if minCnt > df_input[instCol][i]:
-                                            minCnt = df_input[instCol][i]
-                                    # SmtAssy 수량의 여유가 없는 경우
-                                    else:
-                                        # 최소수량과 SmtAssy수량을 다시 비교
-                                        if dict_smtCnt[smtAssyName] > 0:
-                                            if minCnt > dict_smtCnt[smtAssyName]:
-                                                minCnt = dict_smtCnt[smtAssyName]
-                                        # SmtAssy수량이 0개 인 경우, 최소수량을 0으로 전환
-                                        else:
-                                            minCnt = 0
-                                        # 최소착공필요량 전체에 비해 SmtAssy수량이 부족한 경우, 알람을 출력.
-                                        if not isRemain:
-                                            if dict_smtCnt[smtAssyName] > 0:
-                                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail,
-                                                                                                        alarmDetailNo,
-                                                                                                        '1',
-                                                                                                        df_input,
-                                                                                                        i,
-                                                                                                        smtAssyName,
-                                                                                                        df_input[instCol][i] - dict_smtCnt[smtAssyName])
-                                # SMT Assy가 DB에 등록되지 않은 경우, 기타3 알람을 출력.
-                                else:
-                                    minCnt = 0
-                                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타3', df_input, i, smtAssyName, 0)
-                    # MS Code와 연결된 SMT Assy가 등록되지 않았을 경우, 기타1 알람을 출력.
-                    else:
-                        minCnt = 0
-                        df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타1', df_input, i, '미등록', 0)
-                # 최소 수량을 1번이라도 갱신한 경우, 결과컬럼의 값을 minCnt로 대체
-                if minCnt != 9999:
-                    df_input[resultCol][i] = minCnt
-                # 갱신하지 않았을 경우, 기존 입력값을 그대로 출력
-                else:
-                    df_input[resultCol][i] = df_input[instCol][i]
-                # 사용되는 각 Smt Assy 수량에서 결과값을 빼기위한 로직
-                for j in range(1, rowCnt + 1):
-                    if (smtAssyName != '' and smtAssyName != 'nan' and smtAssyName != 'None'):
-                        smtAssyName = str(df_input[f'ROW{str(j)}'][i])
-                        if smtAssyName in dict_smtCnt:
-                            dict_smtCnt[smtAssyName] -= df_input[resultCol][i]
-        return [df_input, dict_smtCnt, alarmDetailNo, df_alarmDetail]
-
-    def ratioReflectInst(self, df_input, isRemain, dict_ratioCnt, dict_maxCnt, alarmDetailNo, df_alarmDetail, limitCtCnt, dict_alarmRatioCnt, dict_alarmMaxCnt):
+        if len(df_input) == 0:
+            return [df_input, dict_smtCnt]
+        # 행별 사용 Smt Assy를 코드화
+        array_rowPtr, array_entryPos = smtIncidence.getRowAssy(df_input['MS Code'], ['', 'nan'])
+        array_assyId = smtIncidence.array_assyId[array_entryPos]
+        list_assyName = smtIncidence.list_assyName
+        array_nameValid = ~np.isin(np.array(list_assyName, dtype=object), ['', 'nan', 'None'])
+        array_registered = np.array([assyName in dict_smtCnt for assyName in list_assyName], dtype=bool)
+        array_stock = np.array([dict_smtCnt.get(assyName, 0) for assyName in list_assyName], dtype=object)
+        # 긴급오더 혹은 당일착공(최소착공량 계산 시에만) 대상일 경우, SMT Assy 잔량에 관계없이 착공 실시.
+        array_urgent = ((df_input['긴급오더'] == '대상') | ((df_input['당일착공'] == '대상') & (not isRemain))).values
+        array_codeValid = (~(df_input['MS Code'].isin(['nan', 'None', '']) & df_input['MS Code'].isin(smtIncidence.list_msCode))).values
+        array_manage = np.ones(len(df_input), dtype=bool)
+        # BU는 SMT Assy를 확인하지 않음.
+        array_bypass = (df_input['MS Code'].str[:4] == 'F3BU').values
+        list_result, list_stock, array_alarmPos, array_alarmCategory, array_alarmAssy, array_alarmShortage, list_missingAssy = smtAllocateKernel(array_rowPtr, array_assyId, array_nameValid, array_registered, array_stock, df_input[instCol].values, array_urgent, array_codeValid, array_manage, array_bypass, isRemain, pd.api.types.is_integer_dtype(df_input[resultCol]))
+        df_input[resultCol] = pd.Series(list_result, index=df_input.index)
+        for assyId in np.flatnonzero(array_registered):
+            dict_smtCnt[list_assyName[assyId]] = list_stock[assyId]
+        # 계산 중 발생한 알람을 순서대로 기록
+        for pos, category, assyId, shortageCnt in zip(array_alarmPos, array_alarmCategory, array_alarmAssy, array_alarmShortage):
+            smtAssyName = '미등록' if assyId < 0 else list_assyName[assyId]
+            self.concatAlarmDetail(alarmDetail, category, df_input, df_input.index[pos], smtAssyName, shortageCnt)
+        return [df_input, dict_smtCnt]
+
+    def ratioReflectInst(self, df_input, isRemain, dict_ratioCnt, dict_maxCnt, alarmDetail, limitCtCnt, dict_alarmRatioCnt, dict_alarmMaxCnt):
         """
         Args:
             df_input(DataFrame)         : 입력 DataFrame
             isRemain(Bool)              : 잔여착공 여부 Flag
             dict_ratioCnt(Dict)         : 그룹별 제한비율 딕셔너리
             dict_maxCnt(Dict)           : 대표모델별 제한대수 딕셔너리
-            alarmDetailNo(int)          : 알람 기록용 번호
-            df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame
+            alarmDetail(AlarmCollector) : 알람 상세 누적 기록
             limitCtCnt(int)             : CT 제한대수
             dict_alarmRatioCnt(Dict)    : 알람 출력용 제한비율 딕셔너리
             dict_alarmMaxCnt(int)       : 알람 출력용 대표모델별 제한대수 딕셔너리
@@ -1523,8 +2705,6 @@ class PowerThread(QObject):
                 df_input(DataFrame)         : 입력 DataFrame (갱신 후)
                 dict_ratioCnt(Dict)         : 그룹별 제한비율 딕셔너리 (갱신 후)
                 dict_maxCnt(Dict)           : 대표모델별 제한대수 딕셔너리 (갱신 후)
-                alarmDetailNo(int)          : 알람 기록용 번호 (갱신 후)
-                df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame (갱신 후)
                 limitCtCnt(int)             : CT 제한대수 (갱신 후)
                 dict_alarmRatioCnt(Dict)    : 알람 출력용 제한비율 딕셔너리 (갱신 후)
                 dict_alarmMaxCnt(int)       : 알람 출력용 대표모델별 제한대수 딕셔너리 (갱신 후)
@@ -1556,17 +2736,17 @@ class PowerThread(QObject):
                             limitCtCnt -= df_input[resultCol2][i]
                             # CT제한대수가 0 미만일 경우, 기타4 알람 기록
                             if limitCtCnt < 0:
-                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타4', df_input, i, '-', 0 - limitCtCnt)
+                                self.concatAlarmDetail(alarmDetail, '기타4', df_input, i, '-', 0 - limitCtCnt)
                         # 비율제한이 0 미만일 경우, 2-1 알람 기록
                         if dict_ratioCnt[str(df_input['상세구분'][i])] < 0:
-                            df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2-1', df_input, i, '-', 0 - (dict_ratioCnt[str(df_input['상세구분'][i])]))
+                            self.concatAlarmDetail(alarmDetail, '2-1', df_input, i, '-', 0 - (dict_ratioCnt[str(df_input['상세구분'][i])]))
                         # 모델별 제한대수가 0 미만일 경우, 2-2 알람 기록
                         if str(df_input['MAX대수'][i]) != '' and str(df_input['MAX대수'][i]) != 'nan' and str(df_input['MAX대수'][i]) != '-':
                             if dict_maxCnt[str(df_input['MODEL'][i])] < 0:
-                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2-2', df_input, i, '-', 0 - dict_maxCnt[str(df_input['MODEL'][i])])
+                                self.concatAlarmDetail(alarmDetail, '2-2', df_input, i, '-', 0 - dict_maxCnt[str(df_input['MODEL'][i])])
                         # 최대 착공량이 0 미만일 경우, 기타2 알람 기록
                         if self.moduleMaxCnt < 0:
-                            df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타2', df_input, i, '-', 0 - self.moduleMaxCnt)
+                            self.concatAlarmDetail(alarmDetail, '기타2', df_input, i, '-', 0 - self.moduleMaxCnt)
                     # 긴급오더 아닌 경우의 로직
                     else:
                         # 리스트에 [SMT반영 착공량], [최대 착공량], [비율제한대수] 를 입력
@@ -1583,13 +2763,13 @@ class PowerThread(QObject):
                         # 최소필요착공량 대상이며 착공 불가능한 상황인 경우, 상황에 맞는 알람을 출력
                         if not isRemain and df_input[instCol][i] > 0 and (df_input[instCol][i] != df_input[resultCol1][i]):
                             if df_input[instCol][i] > dict_alarmRatioCnt[str(df_input['상세구분'][i])]:
-                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2-1', df_input, i, '-', df_input[instCol][i] - dict_alarmRatioCnt[str(df_input['상세구분'][i])])
+                                self.concatAlarmDetail(alarmDetail, '2-1', df_input, i, '-', df_input[instCol][i] - dict_alarmRatioCnt[str(df_input['상세구분'][i])])
                             if str(df_input['MAX대수'][i]) != '' and str(df_input['MAX대수'][i]) != 'nan' and str(df_input['MAX대수'][i]) != '-':
                                 if df_input[instCol][i] > dict_alarmMaxCnt[str(df_input['MODEL'][i])]:
-                                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2-2', df_input, i, '-', df_input[instCol][i] - dict_alarmMaxCnt[str(df_input['MODEL'][i])])
+                                    self.concatAlarmDetail(alarmDetail, '2-2', df_input, i, '-', df_input[instCol][i] - dict_alarmMaxCnt[str(df_input['MODEL'][i])])
                             if '/CT' in df_input['MS Code'][i]:
                                 if df_input[instCol][i] > limitCtCnt:
-                                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타4', df_input, i, '-', df_input[instCol][i] - df_input[resultCol1][i])
+                                    self.concatAlarmDetail(alarmDetail, '기타4', df_input, i, '-', df_input[instCol][i] - df_input[resultCol1][i])
                         # 각 조건에 맞는 딕셔너리에서 차감
                         if str(df_input['MAX대수'][i]) != '' and str(df_input['MAX대수'][i]) != 'nan' and str(df_input['MAX대수'][i]) != '-':
                             dict_maxCnt[str(df_input['MODEL'][i])] -= df_input[resultCol2][i]
@@ -1610,7 +2790,7 @@ class PowerThread(QObject):
                         if dict_maxCnt[str(df_input['MODEL'][i])] < 0:
                             dict_maxCnt[str(df_input['MODEL'][i])] = 0
 
-        return [df_input, dict_ratioCnt, dict_maxCnt, alarmDetailNo, df_alarmDetail, limitCtCnt, dict_alarmRatioCnt, dict_alarmMaxCnt]
+        return [df_input, dict_ratioCnt, dict_maxCnt, limitCtCnt, dict_alarmRatioCnt, dict_alarmMaxCnt]
 
     def run(self):
         # pandas 경고없애기 옵션 적용
@@ -1632,16 +2812,16 @@ class PowerThread(QObject):
                 df_emgmscode = pd.DataFrame({'MS Code': emgmscode})
                 df_holdLinkage = pd.DataFrame({'Linkage Number': holdLinkage})
                 df_holdmscode = pd.DataFrame({'MS Code': holdmscode})
-                # 각 Linkage Number 컬럼의 타입을 일치시킴
-                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].astype(np.int64)
-                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].astype(np.int64)
+                # 각 Linkage Number 컬럼을 마스터 파일과 같은 16자리 키로 일치시킴
+                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].map(toLinkageKey)
+                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].map(toLinkageKey)
                 # 긴급오더, 홍딩오더 Join 전 컬럼 추가
                 df_emgLinkage['긴급오더'] = '대상'
                 df_emgmscode['긴급오더'] = '대상'
                 df_holdLinkage['홀딩오더'] = '대상'
                 df_holdmscode['홀딩오더'] = '대상'
                 # 레벨링 리스트 불러오기(멀티프로세싱 적용 후, 분리 예정)
-                df_levelingPower = pd.read_excel(self.list_masterFile[3])
+                df_levelingPower = self.frameStore.get(self.list_masterFile[3], schemaName='LEVELING')
                 # 레벨링 리스트의 착공 당일의 마지막 No를 가져오기 위한 처리
                 df_constDate = df_levelingPower[df_levelingPower['Scheduled Start Date (*)'] == self.constDate]
                 df_constDate = df_constDate[df_constDate['Sequence No'].notnull()]
@@ -1656,35 +2836,29 @@ class PowerThread(QObject):
                 df_levelingPowerUndepSeq = df_levelingPower[df_levelingPower['Sequence No'] == 'Undep']
                 df_levelingPowerUncorSeq = df_levelingPower[df_levelingPower['Sequence No'] == 'Uncor']
                 df_levelingPower = pd.concat([df_levelingPowerDropSeq, df_levelingPowerUndepSeq, df_levelingPowerUncorSeq])
-                df_levelingPower['Linkage Number'] = df_levelingPower['Linkage Number'].astype(str)
                 df_levelingPower = df_levelingPower.reset_index(drop=True)
                 df_levelingPower['미착공수주잔'] = df_levelingPower.groupby('Linkage Number')['Linkage Number'].transform('size')
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
                 if self.isDebug:
                     df_levelingPower.to_excel('.\\debug\\Power\\flow1.xlsx')
-                df_sosFile = pd.read_excel(self.list_masterFile[0])
-                df_sosFile['Linkage Number'] = df_sosFile['Linkage Number'].astype(str)
+                # 착공 대상 외 모델은 SOS2 파일을 읽을 때 제외하고, 전원 레벨링 리스트에 있는 Linkage Number만 가져옴
+                set_linkage = set(df_levelingPower['Linkage Number'])
+                df_sosFile = self.frameStore.get(self.list_masterFile[0],
+                                                    rowFilter=lambda df: df['Linkage Number'].isin(set_linkage),
+                                                    schemaName='SOS2',
+                                                    excludeMsCode=getSosExcludeMsCode(self.cb_round))
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
                 if self.isDebug:
                     df_sosFile.to_excel('.\\debug\\Power\\flow2.xlsx')
-                # 착공 대상 외 모델 삭제
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('ZOTHER')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('YZ')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('SF')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('KM')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('TA80')].index)
-                # df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('CT')].index)
-                if self.cb_round != '1차':
-                    df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('CT')].index)
                 df_sosFile = df_sosFile.reset_index(drop=True)
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
                 # if self.isDebug:
                 #     df_sosFile.to_excel('.\\debug\\Power\\flow3.xlsx')
                 # 워킹데이 캘린더 불러오기
-                dfCalendar = pd.read_excel(self.list_masterFile[4])
+                dfCalendar = self.frameStore.get(self.list_masterFile[4], schemaName='CALENDAR')
                 today = datetime.datetime.today().strftime('%Y%m%d')
                 if self.isDebug:
                     today = self.date
@@ -1701,9 +2875,6 @@ class PowerThread(QObject):
                 # 남은 워킹데이 Column 생성
                 df_sosFileMerge['남은 워킹데이'] = 0
                 df_sosFileMerge['당일착공'] = ''
-                # 긴급오더, 홀딩오더 Linkage Number Column 타입 일치
-                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].astype(str)
-                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].astype(str)
                 # 긴급오더, 홀딩오더와 위 Sos파일을 Join
                 df_MergeLink = pd.merge(df_sosFileMerge, df_emgLinkage, on='Linkage Number', how='left')
                 df_Mergemscode = pd.merge(df_sosFileMerge, df_emgmscode, on='MS Code', how='left')
@@ -1717,12 +2888,12 @@ class PowerThread(QObject):
                 df_MergeLink = df_MergeLink.sort_values(by=['Planned Prod. Completion date'], ascending=[True])
                 df_MergeLink = df_MergeLink.reset_index(drop=True)
                 # 남은 워킹데이 체크 및 컬럼 추가
-                for i in df_MergeLink.index:
-                    df_MergeLink['남은 워킹데이'][i] = self.checkWorkDay(dfCalendar, today, df_MergeLink['Planned Prod. Completion date'][i])
-                    if df_MergeLink['남은 워킹데이'][i] < 1:
-                        df_MergeLink['긴급오더'][i] = '대상'
-                    elif df_MergeLink['남은 워킹데이'][i] == 1:
-                        df_MergeLink['당일착공'][i] = '대상'
+                array_workDay, list_missingDate = WorkDayIndex(dfCalendar).getRemainWorkDay(today, df_MergeLink['Planned Prod. Completion date'])
+                for missingDate in list_missingDate:
+                    self.powerReturnWarning.emit(f'FY{today[2:4]}_Calendar.xlsx 파일에 {str(missingDate)} 날짜의 워킹데이 데이터가 없습니다. 대한민국 휴일을 기준으로 근무일을 계산합니다. 이후, 해당 파일에 사력을 추가해주세요')
+                df_MergeLink['남은 워킹데이'] = array_workDay
+                df_MergeLink.loc[df_MergeLink['남은 워킹데이'] < 1, '긴급오더'] = '대상'
+                df_MergeLink.loc[df_MergeLink['남은 워킹데이'] == 1, '당일착공'] = '대상'
                 df_MergeLink['Linkage Number'] = df_MergeLink['Linkage Number'].astype(str)
                 # 홀딩오더는 제외
                 df_MergeLink = df_MergeLink[df_MergeLink['홀딩오더'].isnull()]
@@ -1742,13 +2913,30 @@ class PowerThread(QObject):
                 smtAssyDbSID = parser.get('SMT Assy DB정보', 'SID')
                 smtAssyDbUser = parser.get('SMT Assy DB정보', 'Username')
                 smtAssyDbPw = parser.get('SMT Assy DB정보', 'Password')
-                # 해당 날짜의 Smt Assy 남은 대수 확인
+                # 설정파일 불러오기
+                pdbsDbHost = parser.get('MSCODE별 SMT Assy DB정보', 'Host')
+                pdbsDbPort = parser.getint('MSCODE별 SMT Assy DB정보', 'Port')
+                pdbsDbSID = parser.get('MSCODE별 SMT Assy DB정보', 'SID')
+                pdbsDbUser = parser.get('MSCODE별 SMT Assy DB정보', 'Username')
+                pdbsDbPw = parser.get('MSCODE별 SMT Assy DB정보', 'Password')
+                # DB로부터 메인라인의 MSCode별 사용 Smt Assy 가져옴 (AST, BMS, WEB 모델은 Sql 조건으로 제외)
+                sqlPdbs, dict_bindPdbs = getPdbsSql(['100L1313'])
+                df_pdbs = self.readDB(pdbsDbHost,
+                                        pdbsDbPort,
+                                        pdbsDbSID,
+                                        pdbsDbUser,
+                                        pdbsDbPw,
+                                        sqlPdbs,
+                                        dict_bindPdbs)
+                # 해당 날짜의 Smt Assy 남은 대수 확인 (BOM에 사용되는 Smt Assy만 조회)
+                sqlInven, dict_bindInven = getSmtInvenSql(yesterday, df_pdbs['SMT_SMT_ASSY'].dropna().unique().tolist())
                 df_SmtAssyInven = self.readDB(smtAssyDbHost,
                                                 smtAssyDbPort,
                                                 smtAssyDbSID,
                                                 smtAssyDbUser,
                                                 smtAssyDbPw,
-                                                "SELECT INV_D, PARTS_NO, CURRENT_INV_QTY FROM pdsg0040 where INV_D = TO_DATE(" + str(yesterday) + ",'YYYYMMDD')")
+                                                sqlInven,
+                                                dict_bindInven)
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
                 if self.isDebug:
@@ -1757,13 +2945,13 @@ class PowerThread(QObject):
                 if Path(self.list_masterFile[5]).is_file() or Path(self.list_masterFile[14]).is_file() or Path(self.list_masterFile[15]).is_file():
                     df_secOrderList = pd.DataFrame(columns=['ASSY NO', '대수', 'SMT STORE ADDRESS'])
                     if Path(self.list_masterFile[5]).is_file():
-                        df_secOrderMainList = pd.read_excel(self.list_masterFile[5], skiprows=5)
+                        df_secOrderMainList = self.frameStore.get(self.list_masterFile[5], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderMainList])
                     if Path(self.list_masterFile[14]).is_file():
-                        df_secOrderPowerList = pd.read_excel(self.list_masterFile[14], skiprows=5)
+                        df_secOrderPowerList = self.frameStore.get(self.list_masterFile[14], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderPowerList])
                     if Path(self.list_masterFile[15]).is_file():
-                        df_secOrderSpList = pd.read_excel(self.list_masterFile[15], skiprows=5)
+                        df_secOrderSpList = self.frameStore.get(self.list_masterFile[15], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderSpList])
                     df_joinSmt = pd.merge(df_secOrderList, df_SmtAssyInven, how='right', left_on='ASSY NO', right_on='PARTS_NO')
                     df_joinSmt['대수'] = df_joinSmt['대수'].fillna(0)
@@ -1783,36 +2971,14 @@ class PowerThread(QObject):
                         df_joinSmt['현재수량'][i] = 0
                     dict_smtCnt[df_joinSmt['PARTS_NO'][i]] = df_joinSmt['현재수량'][i]
                 df_sosAddPowerModel = df_MergeLink
-                # 설정파일 불러오기
-                pdbsDbHost = parser.get('MSCODE별 SMT Assy DB정보', 'Host')
-                pdbsDbPort = parser.getint('MSCODE별 SMT Assy DB정보', 'Port')
-                pdbsDbSID = parser.get('MSCODE별 SMT Assy DB정보', 'SID')
-                pdbsDbUser = parser.get('MSCODE별 SMT Assy DB정보', 'Username')
-                pdbsDbPw = parser.get('MSCODE별 SMT Assy DB정보', 'Password')
-                # DB로부터 메인라인의 MSCode별 사용 Smt Assy 가져옴
-                df_pdbs = self.readDB(pdbsDbHost,
-                                        pdbsDbPort,
-                                        pdbsDbSID,
-                                        pdbsDbUser,
-                                        pdbsDbPw,
-                                        "SELECT SMT_MS_CODE, SMT_SMT_ASSY, SMT_CRP_GR_NO FROM sap.pdbs0010 WHERE SMT_CRP_GR_NO = '100L1313'")
-                # 불필요한 데이터 삭제
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('AST')]
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('BMS')]
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('WEB')]
-                # 사용 Smt Assy를 병렬화
-                gb = df_pdbs.groupby('SMT_MS_CODE')
-                df_temp = pd.DataFrame([df_pdbs.loc[gb.groups[n], 'SMT_SMT_ASSY'].values for n in gb.groups], index=gb.groups.keys())
-                df_temp.columns = ['ROW' + str(i + 1) for i in df_temp.columns]
-                rowNo = len(df_temp.columns)
-                df_temp = df_temp.reset_index()
-                df_temp.rename(columns={'index': 'SMT_MS_CODE'}, inplace=True)
+                # MS Code별 사용 Smt Assy 연결 구조 생성
+                smtIncidence = SmtAssyIncidence(df_pdbs)
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
                 if self.isDebug:
-                    df_temp.to_excel('.\\debug\\Power\\flow6-1.xlsx')
-                # 모델별 사용 Smt Assy를 Join
-                df_addSmtAssy = pd.merge(df_sosAddPowerModel, df_temp, left_on='MS Code', right_on='SMT_MS_CODE', how='left')
+                    smtIncidence.toFrame().to_excel('.\\debug\\Power\\flow6-1.xlsx')
+                # 모델별 사용 Smt Assy는 smtIncidence에서 MS Code로 조회
+                df_addSmtAssy = df_sosAddPowerModel.copy()
                 df_addSmtAssy = df_addSmtAssy.drop_duplicates(['Linkage Number'])
                 df_addSmtAssy = df_addSmtAssy.reset_index(drop=True)
                 progress += round(maxPb / 20)
@@ -1882,15 +3048,14 @@ class PowerThread(QObject):
                 df_addSmtAssyPower = df_addSmtAssy
                 df_addSmtAssyPower['SMT반영_착공량'] = 0
                 # 알람 상세 DataFrame 생성
-                df_alarmDetail = pd.DataFrame(columns=["No.", "분류", "L/N", "MS CODE", "SMT ASSY", "수주수량", "부족수량", "검사호기", "대상 검사시간(초)", "필요시간(초)", "완성예정일"])
-                alarmDetailNo = 1
+                alarmDetail = AlarmCollector(["No.", "분류", "L/N", "MS CODE", "SMT ASSY", "수주수량", "부족수량", "검사호기", "대상 검사시간(초)", "필요시간(초)", "완성예정일"])
                 # 최소착공량에 대해 Smt적용 착공량 계산
-                df_addSmtAssy, dict_smtCnt, alarmDetailNo, df_alarmDetail = self.smtReflectInst(df_addSmtAssy, False, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo)
+                df_addSmtAssy, dict_smtCnt = self.smtReflectInst(df_addSmtAssy, False, dict_smtCnt, alarmDetail, smtIncidence)
                 if self.isDebug:
-                    df_alarmDetail.to_excel('.\\debug\\Power\\df_alarmDetail.xlsx')
+                    alarmDetail.toFrame().to_excel('.\\debug\\Power\\df_alarmDetail.xlsx')
                 # 잔여 착공량에 대해 Smt적용 착공량 계산
                 df_addSmtAssy['SMT반영_착공량_잔여'] = 0
-                df_addSmtAssy, dict_smtCnt, alarmDetailNo, df_alarmDetail = self.smtReflectInst(df_addSmtAssy, True, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo)
+                df_addSmtAssy, dict_smtCnt = self.smtReflectInst(df_addSmtAssy, True, dict_smtCnt, alarmDetail, smtIncidence)
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
                 if self.isDebug:
@@ -1899,7 +3064,7 @@ class PowerThread(QObject):
                 df_addSmtAssyPower['Linkage Number'] = df_addSmtAssyPower['Linkage Number'].astype(str)
                 df_addSmtAssyPower['MODEL'] = df_addSmtAssyPower['MS Code'].str[:6]
                 # 전원 조건표 불러오기
-                df_powerCondition = pd.read_excel(self.list_masterFile[6])
+                df_powerCondition = self.frameStore.get(self.list_masterFile[6])
                 df_powerCondition['상세구분'] = df_powerCondition['상세구분'].fillna(method='ffill')
                 df_powerCondition['최대허용비율'] = df_powerCondition['최대허용비율'].fillna(method='ffill')
                 df_mergeCondition = pd.merge(df_addSmtAssyPower, df_powerCondition, on='MODEL', how='left')
@@ -1927,33 +3092,32 @@ class PowerThread(QObject):
                         dict_maxCnt[str(df_powerCondition['MODEL'][i])] = round(float(df_powerCondition['최대허용비율'][i]) * self.moduleMaxCnt * float(df_powerCondition['MAX대수'][i]))
                         dict_alarmMaxCnt[str(df_powerCondition['MODEL'][i])] = round(float(df_powerCondition['최대허용비율'][i]) * alaramMaxCnt * float(df_powerCondition['MAX대수'][i]))
                 # CT제한 조건표 불러오기
-                df_limitCtCond = pd.read_excel(self.list_masterFile[13])
+                df_limitCtCond = self.frameStore.get(self.list_masterFile[13])
                 limitCtCnt = df_limitCtCond[df_limitCtCond['상세구분'] == 'POWER']['허용수량'].values[0]
                 # 비율제한 적용 (최소필요착공량)
-                df_mergeCondition, dict_ratioCnt, dict_maxCnt, alarmDetailNo, df_alarmDetail, limitCtCnt, dict_alarmRatioCnt, dict_alarmMaxCnt = self.ratioReflectInst(df_mergeCondition,
-                                                                                                                                                                        False,
-                                                                                                                                                                        dict_ratioCnt,
-                                                                                                                                                                        dict_maxCnt,
-                                                                                                                                                                        alarmDetailNo,
-                                                                                                                                                                        df_alarmDetail,
-                                                                                                                                                                        limitCtCnt,
-                                                                                                                                                                        dict_alarmRatioCnt,
-                                                                                                                                                                        dict_alarmMaxCnt)
+                df_mergeCondition, dict_ratioCnt, dict_maxCnt, limitCtCnt, dict_alarmRatioCnt, dict_alarmMaxCnt = self.ratioReflectInst(df_mergeCondition,
+                                                                                                                                        False,
+                                                                                                                                        dict_ratioCnt,
+                                                                                                                                        dict_maxCnt,
+                                                                                                                                        alarmDetail,
+                                                                                                                                        limitCtCnt,
+                                                                                                                                        dict_alarmRatioCnt,
+                                                                                                                                        dict_alarmMaxCnt)
                 # 비율제한 적용 (여유분)
-                df_mergeCondition, dict_ratioCnt, dict_maxCnt, alarmDetailNo, df_alarmDetail, limitCtCnt, dict_alarmRatioCnt, dict_alarmMaxCnt = self.ratioReflectInst(df_mergeCondition,
-                                                                                                                                                                        True,
-                                                                                                                                                                        dict_ratioCnt,
-                                                                                                                                                                        dict_maxCnt,
-                                                                                                                                                                        alarmDetailNo,
-                                                                                                                                                                        df_alarmDetail,
-                                                                                                                                                                        limitCtCnt,
-                                                                                                                                                                        dict_alarmRatioCnt,
-                                                                                                                                                                        dict_alarmMaxCnt)
+                df_mergeCondition, dict_ratioCnt, dict_maxCnt, limitCtCnt, dict_alarmRatioCnt, dict_alarmMaxCnt = self.ratioReflectInst(df_mergeCondition,
+                                                                                                                                        True,
+                                                                                                                                        dict_ratioCnt,
+                                                                                                                                        dict_maxCnt,
+                                                                                                                                        alarmDetail,
+                                                                                                                                        limitCtCnt,
+                                                                                                                                        dict_alarmRatioCnt,
+                                                                                                                                        dict_alarmMaxCnt)
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
+                # 누적된 알람 상세 기록을 DataFrame으로 변환
+                df_alarmDetail = alarmDetail.toFrame()
                 if self.isDebug:
                     df_mergeCondition.to_excel('.\\debug\\Power\\flow12.xlsx')
-                    df_alarmDetail = df_alarmDetail.reset_index(drop=True)
                     df_alarmDetail.to_excel('.\\debug\\Power\\df_alarmDetail.xlsx')
                 # 알람 상세 결과에서 각 항목별로 요약
                 # 분류1 요약
@@ -2059,24 +3223,10 @@ class PowerThread(QObject):
                 df_mergeCondition = df_mergeCondition[df_mergeCondition['총착공량'] != 0]
                 df_mergeCondition['MODEL'] = df_mergeCondition['MS Code'].str[:6]
                 # 홀딩리스트 불러오기
-                df_holdingList = pd.read_excel(self.list_masterFile[17])
+                df_holdingList = self.frameStore.get(self.list_masterFile[17])
                 # 홀딩리스트와 비교하여 조건에 해당하는 경우, 알람 메시지 출력
-                for i in df_holdingList.index:
-                    message = ""
-                    if len(df_mergeCondition[df_mergeCondition['MODEL'] == df_holdingList['MODEL'][i]]['총착공량'].values) > 0:
-                        totalCnt = 0
-                        for cnt in df_mergeCondition[df_mergeCondition['MODEL'] == df_holdingList['MODEL'][i]]['총착공량'].values:
-                            totalCnt += cnt
-                        message = f"{df_holdingList['MODEL'][i]} {int(totalCnt)}대 {df_holdingList['REMARK'][i]}"
-                    if len(df_mergeCondition[df_mergeCondition['Linkage Number'] == df_holdingList['LINKAGENO'][i]]['총착공량'].values) > 0:
-                        message = f"{df_holdingList['LINKAGENO'][i]} {int(df_mergeCondition[df_mergeCondition['Linkage Number'] == df_holdingList['LINKAGENO'][i]]['총착공량'].values[0])}대 {df_holdingList['REMARK'][i]}"
-                    if len(df_mergeCondition[df_mergeCondition['MS Code'] == df_holdingList['MS-CODE'][i]]['총착공량'].values) > 0:
-                        totalCnt = 0
-                        for cnt in df_mergeCondition[df_mergeCondition['MS Code'] == df_holdingList['MS-CODE'][i]]['총착공량'].values:
-                            totalCnt += cnt
-                        message = f"{df_holdingList['MS-CODE'][i]} {int(totalCnt)}대 {df_holdingList['REMARK'][i]}"
-                    if len(message) > 0:
-                        self.powerReturnWarning.emit(message)
+                for message in getHoldingMessage(df_holdingList, df_mergeCondition):
+                    self.powerReturnWarning.emit(message)
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
                 if self.isDebug:
@@ -2092,20 +3242,8 @@ class PowerThread(QObject):
                 self.powerReturnPb.emit(progress)
                 if self.isDebug:
                     df_mergeOrder.to_excel('.\\debug\\Power\\flow14.xlsx')
-                df_mergeOrderResult = pd.DataFrame().reindex_like(df_mergeOrder)
-                df_mergeOrderResult = df_mergeOrderResult[0:0]
                 # 총착공량 만큼 개별화
-                for i in df_mergeCondition.index:
-                    for j in df_mergeOrder.index:
-                        if df_mergeCondition['Linkage Number'][i] == df_mergeOrder['Linkage Number'][j]:
-                            if j > 0:
-                                if df_mergeOrder['Linkage Number'][j] != df_mergeOrder['Linkage Number'][j - 1]:
-                                    orderCnt = int(df_mergeCondition['총착공량'][i])
-                            else:
-                                orderCnt = int(df_mergeCondition['총착공량'][i])
-                            if orderCnt > 0:
-                                df_mergeOrderResult = df_mergeOrderResult.append(df_mergeOrder.iloc[j])
-                                orderCnt -= 1
+                df_mergeOrderResult = explodeOrder(df_mergeCondition, df_mergeOrder)
                 # 사이클링을 위해 검사설비별로 정리
                 df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['MODEL'], ascending=[False])
                 df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
@@ -2177,43 +3315,17 @@ class PowerThread(QObject):
                     df_mergeOrderResult.to_excel('.\\debug\\Power\\flow15-1.xlsx')
                 # 최대 사이클 번호 체크
                 maxCycle = float(df_cycleCopy['ModelCnt'][0])
-                cycleGr = 1.0
-                df_mergeOrderResult['사이클그룹'] = 0
-                # 각 검사장치별로 사이클 그룹을 작성하고, 최대 사이클과 비교하여 각 사이클그룹에서 배수처리
-                for i in df_mergeOrderResult.index:
-                    if df_mergeOrderResult['긴급오더'][i] != '대상':
-                        multiCnt = maxCycle / df_mergeOrderResult['ModelCnt'][i]
-                        if i == 0:
-                            df_mergeOrderResult['사이클그룹'][i] = cycleGr
-                        else:
-                            if df_mergeOrderResult['상세구분'][i] != df_mergeOrderResult['상세구분'][i - 1]:
-                                if i == 1:
-                                    cycleGr = 2.0
-                                else:
-                                    cycleGr = 1.0
-                            df_mergeOrderResult['사이클그룹'][i] = cycleGr * multiCnt
-                        cycleGr += 1.0
-                    if cycleGr >= maxCycle:
-                        cycleGr = 1.0
-                # 배정된 사이클 그룹 순으로 정렬
-                df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['사이클그룹', 'index'], ascending=[True, True])
-                df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
+                # 각 상세구분별로 사이클 그룹을 작성하고, 최대 사이클과 비교하여 각 사이클그룹에서 배수처리한 뒤 사이클그룹 순으로 정렬
+                df_mergeOrderResult = cycleSequence(df_mergeOrderResult, '상세구분', 'ModelCnt', maxCycle, ['index'])
                 progress += round(maxPb / 20)
                 self.powerReturnPb.emit(progress)
                 if self.isDebug:
                     df_mergeOrderResult.to_excel('.\\debug\\Power\\flow16.xlsx')
                 df_mergeOrderResult = df_mergeOrderResult.reset_index()
                 # 연속으로 같은 검사설비가 오지 않도록 순서를 재조정
-                for i in df_mergeOrderResult.index:
-                    if df_mergeOrderResult['긴급오더'][i] != '대상':
-                        if (i != 0 and (df_mergeOrderResult['상세구분'][i] == df_mergeOrderResult['상세구분'][i - 1])):
-                            for j in df_mergeOrderResult.index:
-                                if df_mergeOrderResult['긴급오더'][j] != '대상':
-                                    if ((j != 0 and j < len(df_mergeOrderResult) - 1) and (df_mergeOrderResult['상세구분'][i] != df_mergeOrderResult['상세구분'][j + 1]) and (df_mergeOrderResult['상세구분'][i] != df_mergeOrderResult['상세구분'][j])):
-                                        df_mergeOrderResult['level_0'][i] = (float(df_mergeOrderResult['level_0'][j]) + float(df_mergeOrderResult['level_0'][j + 1])) / 2
-                                        df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['level_0'], ascending=[True])
-                                        df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
-                                        break
+                df_mergeOrderResult, conflictCnt = spreadAdjacent(df_mergeOrderResult, '상세구분')
+                if conflictCnt > 0:
+                    self.powerReturnWarning.emit(f'같은 상세구분이 연속으로 배치된 곳이 [{conflictCnt}건] 남았습니다. 확인해주세요.')
 
                 df_unCt['index'] = 0
                 df_unCt['사이클그룹'] = 0
@@ -2297,7 +3409,7 @@ class SpThread(QObject):
     spReturnEmgLinkage = pyqtSignal(dict)
     spReturnEmgMscode = pyqtSignal(dict)
 
-    def __init__(self, debugFlag, date, constDate, list_masterFile, moduleMaxCnt, nonModuleMaxCnt, emgHoldList, df_receiveMain, cb_round, df_etcOrderInput):
+    def __init__(self, debugFlag, date, constDate, list_masterFile, moduleMaxCnt, nonModuleMaxCnt, emgHoldList, df_receiveMain, cb_round, df_etcOrderInput, frameStore):
         super().__init__()
         self.isDebug = debugFlag
         self.date = date
@@ -2309,29 +3421,7 @@ class SpThread(QObject):
         self.df_receiveMain = df_receiveMain
         self.cb_round = cb_round
         self.df_etcOrderInput = df_etcOrderInput
-
-    # 워킹데이 체크 내부함수
-    def checkWorkDay(self, df, today, compDate):
-        dtToday = pd.to_datetime(datetime.datetime.strptime(today, '%Y%m%d'))
-        dtComp = pd.to_datetime(compDate, unit='s')
-        workDay = 0
-        if len(df.index[(df['Date'] == dtComp)].tolist()) > 0:
-            index = int(df.index[(df['Date'] == dtComp)].tolist()[0])
-            # 위에서 찾은 완성지정일로부터 프로그램 구동 당일까지 워킹데이를 계산.
-            while dtToday > pd.to_datetime(df['Date'][index], unit='s'):
-                if df['WorkingDay'][index] == 1:
-                    workDay -= 1
-                index += 1
-            # 프로그램 구동 당일 ~ 완성지정일 까지의 워킹데이를 계산
-            for i in df.index:
-                dt = pd.to_datetime(df['Date'][i], unit='s')
-                if dtToday < dt and dt <= dtComp:
-                    if df['WorkingDay'][i] == 1:
-                        workDay += 1
-        else:
-            self.spReturnWarning.emit(f'FY{today[2:4]}_Calendar.xlsx 파일에 {str(dtComp.date())} 날짜의 워킹데이 데이터가 없습니다. 대한민국 휴일을 기준으로 근무일을 계산합니다. 이후, 해당 파일에 사력을 추가해주세요')
-            workDay = np.busday_count(begindates=dtToday.date(), enddates=dtComp.date())
-        return workDay
+        self.frameStore = frameStore
 
     # 콤마 삭제용 내부함수
     def delComma(self, value):
@@ -2342,18 +3432,9 @@ class SpThread(QObject):
         return str(value).split('-')[0]
 
     # 디비 불러오기 공통내부함수
-    def readDB(self, ip, port, sid, userName, password, sql):
-        location = r'.\\instantclient_21_7'
-        os.environ["PATH"] = location + ";" + os.environ["PATH"]
-        dsn = cx_Oracle.makedsn(ip, port, sid)
-        db = cx_Oracle.connect(userName, password, dsn)
-        cursor = db.cursor()
-        cursor.execute(sql)
-        out_data = cursor.fetchall()
-        df_oracle = pd.DataFrame(out_data)
-        col_names = [row[0] for row in cursor.description]
-        df_oracle.columns = col_names
-        return df_oracle
+    def readDB(self, ip, port, sid, userName, password, sql, dict_bind=None):
+        # 설정된 데이터 소스(Oracle 세션풀 또는 오프라인 SQLite)로 조회
+        return getDataSource().readDB(ip, port, sid, userName, password, sql, dict_bind)
 
     # 생산시간 합계용 내부함수
     def getSec(self, time_str):
@@ -2369,210 +3450,127 @@ class SpThread(QObject):
         value = re.sub(r"\\c", "", str(value))
         return value
 
-    def concatAlarmDetail(self, df_target, no, category, df_data, index, smtAssy, shortageCnt):
+    def concatAlarmDetail(self, alarmDetail, category, df_data, index, smtAssy, shortageCnt):
         """
         Args:
-            df_target(DataFrame)    : 알람상세내역 DataFrame
-            no(int)                 : 알람 번호
-            category(str)           : 알람 분류
-            df_data(DataFrame)      : 원본 DataFrame
-            index(int)              : 원본 DataFrame의 인덱스
-            smtAssy(str)            : Smt Assy 이름
-            shortageCnt(int)        : 부족 수량
-        Return:
-            return(DataFrame)       : 알람상세 Merge결과 DataFrame
+            alarmDetail(AlarmCollector) : 알람상세내역 누적 기록
+            category(str)               : 알람 분류
+            df_data(DataFrame)          : 원본 DataFrame
+            index(int)                  : 원본 DataFrame의 인덱스
+            smtAssy(str)                : Smt Assy 이름
+            shortageCnt(int)            : 부족 수량
         """
-        df_result = pd.DataFrame()
         if category == '1':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": smtAssy,
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기(그룹)": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기(그룹)": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '2':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": '-',
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기(그룹)": smtAssy,
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '-',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기(그룹)": smtAssy,
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타1':
-            df_result = pd.concat([df_target,
-                                pd.DataFrame.from_records([{"No.": no,
-                                                            "분류": category,
-                                                            "L/N": df_data['Linkage Number'][index],
-                                                            "MS CODE": df_data['MS Code'][index],
-                                                            "SMT ASSY": '미등록',
-                                                            "수주수량": df_data['미착공수주잔'][index],
-                                                            "부족수량": 0,
-                                                            "검사호기(그룹)": '-',
-                                                            "대상 검사시간(초)": 0,
-                                                            "필요시간(초)": 0,
-                                                            "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '미등록',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": 0,
+                                "검사호기(그룹)": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타2':
-            df_result = pd.concat([df_target,
-                                    pd.DataFrame.from_records([{"No.": no,
-                                                                "분류": category,
-                                                                "L/N": df_data['Linkage Number'][index],
-                                                                "MS CODE": df_data['MS Code'][index],
-                                                                "SMT ASSY": '-',
-                                                                "수주수량": df_data['미착공수주잔'][index],
-                                                                "부족수량": shortageCnt,
-                                                                "검사호기(그룹)": '-',
-                                                                "대상 검사시간(초)": 0,
-                                                                "필요시간(초)": 0,
-                                                                "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": '-',
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기(그룹)": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타3':
-            df_result = pd.concat([df_target,
-                        pd.DataFrame.from_records([{"No.": no,
-                                                    "분류": category,
-                                                    "L/N": df_data['Linkage Number'][index],
-                                                    "MS CODE": df_data['MS Code'][index],
-                                                    "SMT ASSY": smtAssy,
-                                                    "수주수량": df_data['미착공수주잔'][index],
-                                                    "부족수량": 0,
-                                                    "검사호기(그룹)": '-',
-                                                    "대상 검사시간(초)": 0,
-                                                    "필요시간(초)": 0,
-                                                    "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": 0,
+                                "검사호기(그룹)": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
         elif category == '기타4':
-            df_result = pd.concat([df_target,
-                                pd.DataFrame.from_records([{"No.": no,
-                                                            "분류": category,
-                                                            "L/N": df_data['Linkage Number'][index],
-                                                            "MS CODE": df_data['MS Code'][index],
-                                                            "SMT ASSY": smtAssy,
-                                                            "수주수량": df_data['미착공수주잔'][index],
-                                                            "부족수량": shortageCnt,
-                                                            "검사호기": '-',
-                                                            "대상 검사시간(초)": 0,
-                                                            "필요시간(초)": 0,
-                                                            "완성예정일": df_data['Planned Prod. Completion date'][index]}])])
-        return [df_result, no + 1]
-
-    def smtReflectInst(self, df_input, isRemain, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo):
+            alarmDetail.append({"분류": category,
+                                "L/N": df_data['Linkage Number'][index],
+                                "MS CODE": df_data['MS Code'][index],
+                                "SMT ASSY": smtAssy,
+                                "수주수량": df_data['미착공수주잔'][index],
+                                "부족수량": shortageCnt,
+                                "검사호기": '-',
+                                "대상 검사시간(초)": 0,
+                                "필요시간(초)": 0,
+                                "완성예정일": df_data['Planned Prod. Completion date'][index]})
+
+    def smtReflectInst(self, df_input, isRemain, dict_smtCnt, alarmDetail, smtIncidence):
         """
         Args:
             df_input(DataFrame)         : 입력 DataFrame
             isRemain(Bool)              : 잔여착공 여부 Flag
             dict_smtCnt(Dict)           : Smt잔여량 Dict
-            alarmDetailNo(int)          : 알람 번호
-            df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame
-            rowNo(int)                  : 사용 Smt Assy 갯수
+            alarmDetail(AlarmCollector) : 알람 상세 누적 기록
+            smtIncidence(SmtAssyIncidence) : MS Code별 사용 Smt Assy 연결 구조
         Return:
             return(List)
                 df_input(DataFrame)         : 입력 DataFrame (갱신 후)
                 dict_smtCnt(Dict)           : Smt잔여량 Dict (갱신 후)
-                alarmDetailNo(int)          : 알람 번호
-                df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame (갱신 후)
         """
         instCol = '평준화_적용_착공량'
         resultCol = 'SMT반영_착공량'
         if isRemain:
             instCol = '잔여_착공량'
             resultCol = 'SMT반영_착공량_잔여'
-        # 행별로 확인
-        for i in df_input.index:
-            # 사용 Smt Assy 개수 확인
-            for j in range(1, rowNo):
-                if j == 1:
-                    rowCnt = 1
-                if (str(df_input[f'ROW{str(j)}'][i]) != '' and str(df_input[f'ROW{str(j)}'][i]) != 'None' and str(df_input[f'ROW{str(j)}'][i]) != 'nan'):
-                    rowCnt = j
-                else:
-                    break
-            minCnt = 9999
-            isManageSMT = True
-            # 각 SmtAssy 별로 착공 가능 대수 확인
-            for j in range(1, rowCnt + 1):
-                if str(df_input[f'SMT비관리대상{str(j)}'][i]) == 'True':
-                    isManageSMT = False
-            for j in range(1, rowCnt + 1):
-                smtAssyName = str(df_input[f'ROW{str(j)}'][i])
-                if (df_input['MS Code'][i] != 'nan' and df_input['MS Code'][i] != 'None' and df_input['MS Code'][i] != ''):
-                    if (smtAssyName != '' and smtAssyName != 'None' and smtAssyName != 'nan'):
-                        # SMT관리 대상만 한정하여 로직을 실행
-                        if isManageSMT:
-                            # 긴급오더 혹은 당일착공 대상일 경우, SMT Assy 잔량에 관계없이 착공 실시.
-                            if df_input['긴급오더'][i] == '대상' or df_input['당일착공'][i] == '대상':
-                                # MS Code와 연결된 SMT Assy가 있을 경우, 정상적으로 로직을 실행
-                                if smtAssyName in dict_smtCnt:
-                                    if dict_smtCnt[smtAssyName] < 0:
-                                        diffCnt = df_input['미착공수주잔'][i]
-                                        if dict_smtCnt[smtAssyName] + df_input['미착공수주잔'][i] > 0:
-                                            diffCnt = 0 - dict_smtCnt[smtAssyName]
-                                        # SMT Assy가 부족할 경우에는 분류1 알람을 발생.
-                                        if not isRemain:
-                                            if dict_smtCnt[smtAssyName] > 0:
-                                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '1', df_input, i, smtAssyName, diffCnt)
-                                # SMT Assy가 DB에 등록되지 않은 경우, 기타3 알람을 출력.
-                                else:
-                                    minCnt = 0
-                                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타3', df_input, i, smtAssyName, 0)
-                            # 긴급오더 혹은 당일착공 대상이 아닐 경우, SMT Assy 잔량을 확인 후, SMT Assy 잔량이 부족할 경우, 부족한 양만큼 착공.
-                            else:
-                                # 사용하는 SmtAssy가 이미 등록된 SmtAssy일 경우의 로직
-                                if smtAssyName in dict_smtCnt:
-                                    # 최소필요착공량보다 SmtAssy 수량이 여유 있는 경우, 그대로 착공
-                                    if dict_smtCnt[smtAssyName] >= df_input[instCol][i]:
-                                        # 사용하는 SmtAssy가 다수 일 경우를 고려하여 최소수량 확인
-                                        if minCnt > df_input[instCol][i]:
-                                            minCnt = df_input[instCol][i]
-                                    # SmtAssy 수량의 여유가 없는 경우
-                                    else:
-                                        # 최소수량과 SmtAssy수량을 다시 비교
-                                        if dict_smtCnt[smtAssyName] > 0:
-                                            if minCnt > dict_smtCnt[smtAssyName]:
-                                                minCnt = dict_smtCnt[smtAssyName]
-                                        # SmtAssy수량이 0개 인 경우, 최소수량을 0으로 전환
-                                        else:
-                                            minCnt = 0
-                                        # 최소착공필요량 전체에 비해 SmtAssy수량이 부족한 경우, 알람을 출력.
-                                        if not isRemain:
-                                            if dict_smtCnt[smtAssyName] > 0:
-                                                df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail,
-                                                                                                        alarmDetailNo,
-                                                                                                        '1',
-                                                                                                        df_input,
-                                                                                                        i,
-                                                                                                        smtAssyName,
-                                                                                                        df_input[instCol][i] - dict_smtCnt[smtAssyName])
-                                # SMT Assy가 DB에 등록되지 않은 경우, 기타3 알람을 출력.
-                                else:
-                                    minCnt = 0
-                                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타3', df_input, i, smtAssyName, 0)
-                # MS Code와 연결된 SMT Assy가 등록되지 않았을 경우, 기타1 알람을 출력.
-                else:
-                    minCnt = 0
-                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타1', df_input, i, '미등록', 0)
-            # 최소 수량을 1번이라도 갱신한 경우, 결과컬럼의 값을 minCnt로 대체
-            if minCnt != 9999:
-                df_input[resultCol][i] = minCnt
-            # 갱신하지 않았을 경우, 기존 입력값을 그대로 출력
-            else:
-                df_input[resultCol][i] = df_input[instCol][i]
-            # 사용되는 각 Smt Assy 수량에서 결과값을 빼기위한 로직
-            for j in range(1, rowCnt + 1):
-                if (smtAssyName != '' and smtAssyName != 'None' and smtAssyName != 'nan'):
-                    smtAssyName = str(df_input[f'ROW{str(j)}'][i])
-                    if smtAssyName in dict_smtCnt:
-                        dict_smtCnt[smtAssyName] -= df_input[resultCol][i]
-        return [df_input, dict_smtCnt, alarmDetailNo, df_alarmDetail]
-
-    def grMaxCntReflect(self, df_input, isRemain, dict_categoryCnt, dict_firstGrCnt, dict_secGrCnt, alarmDetailNo, df_alarmDetail, limitCtCnt):
+        if len(df_input) == 0:
+            return [df_input, dict_smtCnt]
+        # 행별 사용 Smt Assy를 코드화
+        array_rowPtr, array_entryPos = smtIncidence.getRowAssy(df_input['MS Code'], ['', 'None', 'nan'])
+        array_assyId = smtIncidence.array_assyId[array_entryPos]
+        list_assyName = smtIncidence.list_assyName
+        array_nameValid = ~np.isin(np.array(list_assyName, dtype=object), ['', 'nan', 'None'])
+        array_registered = np.array([assyName in dict_smtCnt for assyName in list_assyName], dtype=bool)
+        array_stock = np.array([dict_smtCnt.get(assyName, 0) for assyName in list_assyName], dtype=object)
+        # 긴급오더 혹은 당일착공 대상일 경우, SMT Assy 잔량에 관계없이 착공 실시.
+        array_urgent = ((df_input['긴급오더'] == '대상') | (df_input['당일착공'] == '대상')).values
+        array_codeValid = (~df_input['MS Code'].isin(['nan', 'None', ''])).values
+        # 사용 Smt Assy 중 하나라도 SMT 비관리 대상이면, SMT 잔량을 확인하지 않음
+        array_manage = ~np.logical_or.reduceat(smtIncidence.array_nonManage[array_entryPos], array_rowPtr[:-1])
+        array_bypass = np.zeros(len(df_input), dtype=bool)
+        list_result, list_stock, array_alarmPos, array_alarmCategory, array_alarmAssy, array_alarmShortage, list_missingAssy = smtAllocateKernel(array_rowPtr, array_assyId, array_nameValid, array_registered, array_stock, df_input[instCol].values, array_urgent, array_codeValid, array_manage, array_bypass, isRemain, pd.api.types.is_integer_dtype(df_input[resultCol]))
+        df_input[resultCol] = pd.Series(list_result, index=df_input.index)
+        for assyId in np.flatnonzero(array_registered):
+            dict_smtCnt[list_assyName[assyId]] = list_stock[assyId]
+        # 계산 중 발생한 알람을 순서대로 기록
+        for pos, category, assyId, shortageCnt in zip(array_alarmPos, array_alarmCategory, array_alarmAssy, array_alarmShortage):
+            smtAssyName = '미등록' if assyId < 0 else list_assyName[assyId]
+            self.concatAlarmDetail(alarmDetail, category, df_input, df_input.index[pos], smtAssyName, shortageCnt)
+        return [df_input, dict_smtCnt]
+
+    def grMaxCntReflect(self, df_input, isRemain, dict_categoryCnt, dict_firstGrCnt, dict_secGrCnt, alarmDetail, limitCtCnt):
         """
         Args:
             df_input(DataFrame)         : 입력 DataFrame
@@ -2580,8 +3578,7 @@ class SpThread(QObject):
             dict_categoryCnt(Dict)      : 모듈/비모듈 별 잔여량 Dict
             dict_firstGrCnt(Dict)       : 1차 Max Gr 잔여량 Dict
             dict_secGrCnt(Dict)         : 2차 Max Gr 잔여량 Dict
-            alarmDetailNo(int)          : 알람 번호
-            df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame
+            alarmDetail(AlarmCollector) : 알람 상세 누적 기록
             limitCtCnt(int)             : CT제한대수
         Return:
             return(List)
@@ -2589,8 +3586,6 @@ class SpThread(QObject):
                 dict_categoryCnt(Dict)      : 모듈/비모듈 별 잔여량 Dict(갱신 후)
                 dict_firstGrCnt(Dict)       : 1차 Max Gr 잔여량 Dict(갱신 후)
                 dict_secGrCnt(Dict)         : 2차 Max Gr 잔여량 Dict(갱신 후)
-                alarmDetailNo(int)          : 알람 번호
-                df_alarmDetail(DataFrame)   : 알람 상세 기록용 DataFrame (갱신 후)
                 limitCtCnt(int)             : CT제한대수
         """
         instCol = 'SMT반영_착공량'
@@ -2603,23 +3598,23 @@ class SpThread(QObject):
             if (df_input['긴급오더'][i] == '대상' or df_input['당일착공'][i] == '대상'):
                 # 모듈구분 잔여 착공량이 부족한 경우, 기타2 알람 기록
                 if dict_categoryCnt[df_input['모듈 구분'][i]] < df_input[instCol][i] * df_input['공수'][i]:
-                    df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타2', df_input, i, '-', df_input[instCol][i] * df_input['공수'][i] - dict_categoryCnt[df_input['모듈 구분'][i]])
+                    self.concatAlarmDetail(alarmDetail, '기타2', df_input, i, '-', df_input[instCol][i] * df_input['공수'][i] - dict_categoryCnt[df_input['모듈 구분'][i]])
                 if df_input['2차_MAX_그룹'][i] != '-':
                     # 2차 MAX그룹의 잔여량이 부족한 경우, 분류2 알람 기록
                     if dict_secGrCnt[df_input['2차_MAX_그룹'][i]] < df_input[instCol][i]:
-                        df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2', df_input, i, df_input['2차_MAX_그룹'][i], df_input[instCol][i] - dict_firstGrCnt[df_input['2차_MAX_그룹'][i]])
+                        self.concatAlarmDetail(alarmDetail, '2', df_input, i, df_input['2차_MAX_그룹'][i], df_input[instCol][i] - dict_firstGrCnt[df_input['2차_MAX_그룹'][i]])
                     # 딕셔너리에서 차감
                     dict_secGrCnt[df_input['2차_MAX_그룹'][i]] -= df_input[instCol][i]
                 if df_input['1차_MAX_그룹'][i] != '-':
                     # 1차 MAX그룹의 잔여량이 부족한 경우, 분류2 알람 기록
                     if dict_firstGrCnt[df_input['1차_MAX_그룹'][i]] < df_input[instCol][i]:
-                        df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2', df_input, i, df_input['1차_MAX_그룹'][i], df_input[instCol][i] - dict_firstGrCnt[df_input['1차_MAX_그룹'][i]])
+                        self.concatAlarmDetail(alarmDetail, '2', df_input, i, df_input['1차_MAX_그룹'][i], df_input[instCol][i] - dict_firstGrCnt[df_input['1차_MAX_그룹'][i]])
                     # 딕셔너리에서 차감
                     dict_firstGrCnt[df_input['1차_MAX_그룹'][i]] -= df_input[instCol][i]
                 if '/CT' in df_input['MS Code'][i]:
                     # CT사양인 경우, CT잔여량이 부족하면 기타4 알람 기록
                     if limitCtCnt < df_input[instCol][i]:
-                        df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타4', df_input, i, '-', df_input[instCol][i] - limitCtCnt)
+                        self.concatAlarmDetail(alarmDetail, '기타4', df_input, i, '-', df_input[instCol][i] - limitCtCnt)
                     limitCtCnt -= df_input[instCol][i]
                 df_input[resultCol][i] = df_input[instCol][i]
                 dict_categoryCnt[df_input['모듈 구분'][i]] -= df_input[instCol][i] * df_input['공수'][i]
@@ -2648,11 +3643,11 @@ class SpThread(QObject):
                 # 최소필요착공량이며 SMT반영 착공량을 착공할 수 없는 상황일 경우, 상황에 따른 알람을 기록
                 if not isRemain and df_input[instCol][i] > 0 and (df_input[instCol][i] != df_input[resultCol][i]):
                     if df_input['1차_MAX_그룹'][i] != '-' and df_input[instCol][i] > dict_firstGrCnt[df_input['1차_MAX_그룹'][i]]:
-                        df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2', df_input, i, df_input['1차_MAX_그룹'][i], df_input[instCol][i] - df_input[resultCol][i])
+                        self.concatAlarmDetail(alarmDetail, '2', df_input, i, df_input['1차_MAX_그룹'][i], df_input[instCol][i] - df_input[resultCol][i])
                     if df_input['2차_MAX_그룹'][i] != '-' and df_input[instCol][i] > dict_secGrCnt[df_input['2차_MAX_그룹'][i]]:
-                        df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '2', df_input, i, df_input['2차_MAX_그룹'][i], df_input[instCol][i] - df_input[resultCol][i])
+                        self.concatAlarmDetail(alarmDetail, '2', df_input, i, df_input['2차_MAX_그룹'][i], df_input[instCol][i] - df_input[resultCol][i])
                     if '/CT' in df_input['MS Code'][i] and df_input[instCol][i] > limitCtCnt:
-                        df_alarmDetail, alarmDetailNo = self.concatAlarmDetail(df_alarmDetail, alarmDetailNo, '기타4', df_input, i, '-', df_input[instCol][i] - df_input[resultCol][i])
+                        self.concatAlarmDetail(alarmDetail, '기타4', df_input, i, '-', df_input[instCol][i] - df_input[resultCol][i])
                 # 조건에 따라 각 딕셔너리에서 착공량을 차감
                 dict_categoryCnt[df_input['모듈 구분'][i]] -= df_input[resultCol][i] * df_input['공수'][i]
                 if df_input['1차_MAX_그룹'][i] != '-':
@@ -2670,7 +3665,7 @@ class SpThread(QObject):
                 dict_categoryCnt[df_input['모듈 구분'][i]] = 0
             if '/CT' in df_input['MS Code'][i] and limitCtCnt < 0:
                 limitCtCnt = 0
-        return [df_input, dict_categoryCnt, dict_firstGrCnt, dict_secGrCnt, alarmDetailNo, df_alarmDetail, limitCtCnt]
+        return [df_input, dict_categoryCnt, dict_firstGrCnt, dict_secGrCnt, limitCtCnt]
 
     def run(self):
         # pandas 경고없애기 옵션 적용
@@ -2694,16 +3689,16 @@ class SpThread(QObject):
                 df_emgmscode = pd.DataFrame({'MS Code': emgmscode})
                 df_holdLinkage = pd.DataFrame({'Linkage Number': holdLinkage})
                 df_holdmscode = pd.DataFrame({'MS Code': holdmscode})
-                # 각 Linkage Number 컬럼의 타입을 일치시킴
-                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].astype(str)
-                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].astype(str)
+                # 각 Linkage Number 컬럼을 마스터 파일과 같은 16자리 키로 일치시킴
+                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].map(toLinkageKey)
+                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].map(toLinkageKey)
                 # 긴급오더, 홍딩오더 Join 전 컬럼 추가
                 df_emgLinkage['긴급오더'] = '대상'
                 df_emgmscode['긴급오더'] = '대상'
                 df_holdLinkage['홀딩오더'] = '대상'
                 df_holdmscode['홀딩오더'] = '대상'
                 # 레벨링 리스트 불러오기
-                df_levelingSp = pd.read_excel(self.list_masterFile[2])
+                df_levelingSp = self.frameStore.get(self.list_masterFile[2], schemaName='LEVELING')
                 # 레벨링 리스트의 착공 당일의 마지막 No를 가져오기 위한 처리
                 df_constDateSp = df_levelingSp[df_levelingSp['Scheduled Start Date (*)'] == self.constDate]
                 df_constDateSp = df_constDateSp[df_constDateSp['Sequence No'].notnull()]
@@ -2719,10 +3714,9 @@ class SpThread(QObject):
                 df_levelingSpUncorSeq = df_levelingSp[df_levelingSp['Sequence No'] == 'Uncor']
                 df_levelingSp = pd.concat([df_levelingSpDropSeq, df_levelingSpUndepSeq, df_levelingSpUncorSeq])
                 df_levelingSp['모듈 구분'] = '모듈'
-                df_levelingSp['Linkage Number'] = df_levelingSp['Linkage Number'].astype(str)
                 df_levelingSp = df_levelingSp.reset_index(drop=True)
                 df_levelingSp['미착공수주잔'] = df_levelingSp.groupby('Linkage Number')['Linkage Number'].transform('size')
-                df_condition = pd.read_excel(self.list_masterFile[7])
+                df_condition = self.frameStore.get(self.list_masterFile[7])
                 df_condition['No'] = df_condition['No'].fillna(method='ffill')
                 df_condition['1차_MAX_그룹'] = df_condition['1차_MAX_그룹'].fillna(method='ffill')
                 df_condition['2차_MAX_그룹'] = df_condition['2차_MAX_그룹'].fillna(method='ffill')
@@ -2731,7 +3725,7 @@ class SpThread(QObject):
                 # 비모듈 레벨링 리스트 불러오기 - 경로에 파일이 있으면 불러올것
                 if self.cb_round == '2차':
                     if Path(self.list_masterFile[9]).is_file():
-                        df_levelingBL = pd.read_excel(self.list_masterFile[9])
+                        df_levelingBL = self.frameStore.get(self.list_masterFile[9], schemaName='LEVELING')
                         df_constDateBL = df_levelingBL[df_levelingBL['Scheduled Start Date (*)'] == self.constDate]
                         df_constDateBL = df_constDateBL[df_constDateBL['Sequence No'].notnull()]
                         if len(df_constDateBL) > 0:
@@ -2745,12 +3739,11 @@ class SpThread(QObject):
                         df_levelingBLUncorSeq = df_levelingBL[df_levelingBL['Sequence No'] == 'Uncor']
                         df_levelingBL = pd.concat([df_levelingBLDropSeq, df_levelingBLUndepSeq, df_levelingBLUncorSeq])
                         df_levelingBL['모듈 구분'] = df_condition[df_condition['상세구분'] == 'BL=Case']['구분'].values[0]
-                        df_levelingBL['Linkage Number'] = df_levelingBL['Linkage Number'].astype(str)
                         df_levelingBL = df_levelingBL.reset_index(drop=True)
                         df_levelingBL['미착공수주잔'] = df_levelingBL.groupby('Linkage Number')['Linkage Number'].transform('size')
                         df_levelingSp = pd.concat([df_levelingSp, df_levelingBL])
                     if Path(self.list_masterFile[10]).is_file():
-                        df_levelingTerminal = pd.read_excel(self.list_masterFile[10])
+                        df_levelingTerminal = self.frameStore.get(self.list_masterFile[10], schemaName='LEVELING')
                         df_constDateTerminal = df_levelingTerminal[df_levelingTerminal['Scheduled Start Date (*)'] == self.constDate]
                         df_constDateTerminal = df_constDateTerminal[df_constDateTerminal['Sequence No'].notnull()]
                         if len(df_constDateTerminal) > 0:
@@ -2764,13 +3757,12 @@ class SpThread(QObject):
                         df_levelingTerminalUncorSeq = df_levelingTerminal[df_levelingTerminal['Sequence No'] == 'Uncor']
                         df_levelingTerminal = pd.concat([df_levelingTerminalDropSeq, df_levelingTerminalUndepSeq, df_levelingTerminalUncorSeq])
                         df_levelingTerminal['모듈 구분'] = df_condition[df_condition['상세구분'] == 'Terminal']['구분'].values[0]
-                        df_levelingTerminal['Linkage Number'] = df_levelingTerminal['Linkage Number'].astype(str)
                         df_levelingTerminal = df_levelingTerminal.reset_index(drop=True)
                         df_levelingTerminal['미착공수주잔'] = df_levelingTerminal.groupby('Linkage Number')['Linkage Number'].transform('size')
                         df_levelingSp = pd.concat([df_levelingSp, df_levelingTerminal])
                 elif self.cb_round == '1차':
                     if Path(self.list_masterFile[11]).is_file():
-                        df_levelingSlave = pd.read_excel(self.list_masterFile[11])
+                        df_levelingSlave = self.frameStore.get(self.list_masterFile[11], schemaName='LEVELING')
                         df_constDateSlave = df_levelingSlave[df_levelingSlave['Scheduled Start Date (*)'] == self.constDate]
                         df_constDateSlave = df_constDateSlave[df_constDateSlave['Sequence No'].notnull()]
                         if len(df_constDateSlave) > 0:
@@ -2784,7 +3776,6 @@ class SpThread(QObject):
                         df_levelingSlaveUncorSeq = df_levelingSlave[df_levelingSlave['Sequence No'] == 'Uncor']
                         df_levelingSlave = pd.concat([df_levelingSlaveDropSeq, df_levelingSlaveUndepSeq, df_levelingSlaveUncorSeq])
                         df_levelingSlave['모듈 구분'] = df_condition[df_condition['상세구분'] == 'Slave']['구분'].values[0]
-                        df_levelingSlave['Linkage Number'] = df_levelingSlave['Linkage Number'].astype(str)
                         df_levelingSlave = df_levelingSlave.reset_index(drop=True)
                         df_levelingSlave['미착공수주잔'] = df_levelingSlave.groupby('Linkage Number')['Linkage Number'].transform('size')
                         df_levelingSp = pd.concat([df_levelingSp, df_levelingSlave])
@@ -2792,27 +3783,23 @@ class SpThread(QObject):
                 self.spReturnPb.emit(progress)
                 if self.isDebug:
                     df_levelingSp.to_excel('.\\debug\\Sp\\flow1.xlsx')
-                df_sosFile = pd.read_excel(self.list_masterFile[0])
-                df_sosFile['Linkage Number'] = df_sosFile['Linkage Number'].astype(str)
-                df_levelingSp['Linkage Number'] = df_levelingSp['Linkage Number'].astype(str)
+                # 착공 대상 외 모델은 SOS2 파일을 읽을 때 제외하고, 특수 레벨링 리스트에 있는 Linkage Number만 가져옴
+                # (SWITCH 수주잔 알람은 전체 라인 대상이므로 S9307UF는 함께 가져옴)
+                set_linkage = set(df_levelingSp['Linkage Number'])
+                df_sosFile = self.frameStore.get(self.list_masterFile[0],
+                                                    rowFilter=lambda df: df['Linkage Number'].isin(set_linkage) | df['MS Code'].str.contains('S9307UF', na=False),
+                                                    schemaName='SOS2',
+                                                    excludeMsCode=getSosExcludeMsCode(self.cb_round))
                 progress += round(maxPb / 20)
                 self.spReturnPb.emit(progress)
                 # if self.isDebug:
                 #     df_sosFile.to_excel('.\\debug\\Sp\\flow2.xlsx')
-                # 착공 대상 외 모델 삭제
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('ZOTHER')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('YZ')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('SF')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('KM')].index)
-                df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('TA80')].index)
-                if self.cb_round != '1차':
-                    df_sosFile = df_sosFile.drop(df_sosFile[df_sosFile['MS Code'].str.contains('CT')].index)
                 progress += round(maxPb / 20)
                 self.spReturnPb.emit(progress)
                 if self.isDebug:
                     df_sosFile.to_excel('.\\debug\\Sp\\flow3.xlsx')
                 # 워킹데이 캘린더 불러오기
-                dfCalendar = pd.read_excel(self.list_masterFile[4])
+                dfCalendar = self.frameStore.get(self.list_masterFile[4], schemaName='CALENDAR')
                 today = datetime.datetime.today().strftime('%Y%m%d')
                 if self.isDebug:
                     today = self.date
@@ -2827,9 +3814,6 @@ class SpThread(QObject):
                 df_sosFileMerge['대표모델'] = df_sosFileMerge['MS Code'].str[:9]
                 # 남은 워킹데이 Column 생성
                 df_sosFileMerge['남은 워킹데이'] = 0
-                # 긴급오더, 홀딩오더 Linkage Number Column 타입 일치
-                df_emgLinkage['Linkage Number'] = df_emgLinkage['Linkage Number'].astype(str)
-                df_holdLinkage['Linkage Number'] = df_holdLinkage['Linkage Number'].astype(str)
                 # 긴급오더, 홀딩오더와 위 Sos파일을 Join
                 df_MergeLink = pd.merge(df_sosFileMerge, df_emgLinkage, on='Linkage Number', how='left')
                 dfMergemscode = pd.merge(df_sosFileMerge, df_emgmscode, on='MS Code', how='left')
@@ -2854,12 +3838,12 @@ class SpThread(QObject):
                     if oneMonthLater >= df_switch['Planned Prod. Completion date'][i]:
                         self.spReturnWarning.emit(f"Linkage Number:[{str(df_switch['Linkage Number'][i])}], SWITCH(S9307UF)의 수주잔이 확인되었습니다. 완성지정일: [{str(df_switch['Planned Prod. Completion date'][i])}]")
                 # 남은 워킹데이 체크 및 컬럼 추가
-                for i in df_MergeLink.index:
-                    df_MergeLink['남은 워킹데이'][i] = self.checkWorkDay(dfCalendar, today, df_MergeLink['Planned Prod. Completion date'][i])
-                    if df_MergeLink['남은 워킹데이'][i] < 1:
-                        df_MergeLink['긴급오더'][i] = '대상'
-                    elif df_MergeLink['남은 워킹데이'][i] == 1:
-                        df_MergeLink['당일착공'][i] = '대상'
+                array_workDay, list_missingDate = WorkDayIndex(dfCalendar).getRemainWorkDay(today, df_MergeLink['Planned Prod. Completion date'])
+                for missingDate in list_missingDate:
+                    self.spReturnWarning.emit(f'FY{today[2:4]}_Calendar.xlsx 파일에 {str(missingDate)} 날짜의 워킹데이 데이터가 없습니다. 대한민국 휴일을 기준으로 근무일을 계산합니다. 이후, 해당 파일에 사력을 추가해주세요')
+                df_MergeLink['남은 워킹데이'] = array_workDay
+                df_MergeLink.loc[df_MergeLink['남은 워킹데이'] < 1, '긴급오더'] = '대상'
+                df_MergeLink.loc[df_MergeLink['남은 워킹데이'] == 1, '당일착공'] = '대상'
                 df_MergeLink['Linkage Number'] = df_MergeLink['Linkage Number'].astype(str)
                 df_MergeLink['MODEL'] = df_MergeLink['MS Code'].str[:7]
                 df_MergeLink['MODEL'] = df_MergeLink['MODEL'].astype(str).apply(self.delHypen)
@@ -2881,25 +3865,41 @@ class SpThread(QObject):
                 smtAssyDbSID = parser.get('SMT Assy DB정보', 'SID')
                 smtAssyDbUser = parser.get('SMT Assy DB정보', 'Username')
                 smtAssyDbPw = parser.get('SMT Assy DB정보', 'Password')
-                # 해당 날짜의 Smt Assy 남은 대수 확인
+                pdbsDbHost = parser.get('MSCODE별 SMT Assy DB정보', 'Host')
+                pdbsDbPort = parser.getint('MSCODE별 SMT Assy DB정보', 'Port')
+                pdbsDbSID = parser.get('MSCODE별 SMT Assy DB정보', 'SID')
+                pdbsDbUser = parser.get('MSCODE별 SMT Assy DB정보', 'Username')
+                pdbsDbPw = parser.get('MSCODE별 SMT Assy DB정보', 'Password')
+                # DB로부터 메인라인의 MSCode별 사용 Smt Assy 가져옴 (AST, BMS, WEB 모델은 Sql 조건으로 제외)
+                sqlPdbs, dict_bindPdbs = getPdbsSql(['100L1304', '100L1318', '100L1331', '100L1312', '100L1303'])
+                df_pdbs = self.readDB(pdbsDbHost,
+                                        pdbsDbPort,
+                                        pdbsDbSID,
+                                        pdbsDbUser,
+                                        pdbsDbPw,
+                                        sqlPdbs,
+                                        dict_bindPdbs)
+                # 해당 날짜의 Smt Assy 남은 대수 확인 (BOM에 사용되는 Smt Assy만 조회)
+                sqlInven, dict_bindInven = getSmtInvenSql(yesterday, df_pdbs['SMT_SMT_ASSY'].dropna().unique().tolist())
                 df_SmtAssyInven = self.readDB(smtAssyDbHost,
                                                 smtAssyDbPort,
                                                 smtAssyDbSID,
                                                 smtAssyDbUser,
                                                 smtAssyDbPw,
-                                                "SELECT INV_D, PARTS_NO, CURRENT_INV_QTY FROM pdsg0040 where INV_D = TO_DATE(" + str(yesterday) + ",'YYYYMMDD')")
+                                                sqlInven,
+                                                dict_bindInven)
                 df_SmtAssyInven['현재수량'] = 0
                 # 2차 메인피킹 리스트 불러오기 및 Smt Assy 재고량 Df와 Join
                 if Path(self.list_masterFile[5]).is_file() or Path(self.list_masterFile[14]).is_file() or Path(self.list_masterFile[15]).is_file():
                     df_secOrderList = pd.DataFrame(columns=['ASSY NO', '대수', 'SMT STORE ADDRESS'])
                     if Path(self.list_masterFile[5]).is_file():
-                        df_secOrderMainList = pd.read_excel(self.list_masterFile[5], skiprows=5)
+                        df_secOrderMainList = self.frameStore.get(self.list_masterFile[5], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderMainList])
                     if Path(self.list_masterFile[14]).is_file():
-                        df_secOrderPowerList = pd.read_excel(self.list_masterFile[14], skiprows=5)
+                        df_secOrderPowerList = self.frameStore.get(self.list_masterFile[14], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderPowerList])
                     if Path(self.list_masterFile[15]).is_file():
-                        df_secOrderSpList = pd.read_excel(self.list_masterFile[15], skiprows=5)
+                        df_secOrderSpList = self.frameStore.get(self.list_masterFile[15], schemaName='PICKING')
                         df_secOrderList = pd.concat([df_secOrderList, df_secOrderSpList])
                     df_joinSmt = pd.merge(df_secOrderList, df_SmtAssyInven, how='right', left_on='ASSY NO', right_on='PARTS_NO')
                     df_joinSmt['대수'] = df_joinSmt['대수'].fillna(0)
@@ -2919,42 +3919,20 @@ class SpThread(QObject):
                 if self.isDebug:
                     df_joinSmt.to_excel('.\\debug\\Sp\\flow5.xlsx')
                 # PB01: S9221DS, TA40: S9091BU 재고량 미확인 모델 dict_smtCnt 추가
-                df_smtUnCheck = pd.read_excel(self.list_masterFile[8])
+                df_smtUnCheck = self.frameStore.get(self.list_masterFile[8])
                 list_nonManageSmt = df_smtUnCheck['SMT ASSY'].tolist()
-                pdbsDbHost = parser.get('MSCODE별 SMT Assy DB정보', 'Host')
-                pdbsDbPort = parser.getint('MSCODE별 SMT Assy DB정보', 'Port')
-                pdbsDbSID = parser.get('MSCODE별 SMT Assy DB정보', 'SID')
-                pdbsDbUser = parser.get('MSCODE별 SMT Assy DB정보', 'Username')
-                pdbsDbPw = parser.get('MSCODE별 SMT Assy DB정보', 'Password')
-
-                # DB로부터 메인라인의 MSCode별 사용 Smt Assy 가져옴
-                df_pdbs = self.readDB(pdbsDbHost,
-                                        pdbsDbPort,
-                                        pdbsDbSID,
-                                        pdbsDbUser,
-                                        pdbsDbPw,
-                                        "SELECT SMT_MS_CODE, SMT_SMT_ASSY, SMT_CRP_GR_NO FROM sap.pdbs0010 WHERE SMT_CRP_GR_NO = '100L1304' or SMT_CRP_GR_NO = '100L1318' or SMT_CRP_GR_NO = '100L1331' or SMT_CRP_GR_NO = '100L1312' or SMT_CRP_GR_NO = '100L1303'")
-                # 불필요한 데이터 삭제
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('AST')]
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('BMS')]
-                df_pdbs = df_pdbs[~df_pdbs['SMT_MS_CODE'].str.contains('WEB')]
                 progress += round(maxPb / 20)
                 self.spReturnPb.emit(progress)
                 if self.isDebug:
                     df_pdbs.to_excel('.\\debug\\Sp\\flow6.xlsx')
-                # 사용 Smt Assy를 병렬화
-                gb = df_pdbs.groupby('SMT_MS_CODE')
-                df_temp = pd.DataFrame([df_pdbs.loc[gb.groups[n], 'SMT_SMT_ASSY'].values for n in gb.groups], index=gb.groups.keys())
-                df_temp.columns = ['ROW' + str(i + 1) for i in df_temp.columns]
-                rowNo = len(df_temp.columns)
-                df_temp = df_temp.reset_index()
-                df_temp.rename(columns={'index': 'MS Code'}, inplace=True)
+                # MS Code별 사용 Smt Assy 연결 구조 생성 (SMT 비관리 대상 Smt Assy 표시 포함)
+                smtIncidence = SmtAssyIncidence(df_pdbs, '|'.join(list_nonManageSmt))
                 progress += round(maxPb / 20)
                 self.spReturnPb.emit(progress)
                 if self.isDebug:
-                    df_temp.to_excel('.\\debug\\Sp\\flow7.xlsx')
-                # 모델별 사용 Smt Assy를 Join
-                df_addSmtAssy = pd.merge(df_MergeLink, df_temp, on='MS Code', how='left')
+                    smtIncidence.toFrame().to_excel('.\\debug\\Sp\\flow7.xlsx')
+                # 모델별 사용 Smt Assy는 smtIncidence에서 MS Code로 조회
+                df_addSmtAssy = df_MergeLink.copy()
                 df_addSmtAssy = df_addSmtAssy.reset_index(drop=True)
                 progress += round(maxPb / 20)
                 self.spReturnPb.emit(progress)
@@ -3031,19 +4009,15 @@ class SpThread(QObject):
                     df_addSmtAssy.to_excel('.\\debug\\Sp\\flow10.xlsx')
                 # SMT 잔여수량 적용
                 df_addSmtAssy['SMT반영_착공량'] = 0
-                pattern = '|'.join(list_nonManageSmt)
-                for j in range(1, rowNo):
-                    df_addSmtAssy[f'SMT비관리대상{str(j)}'] = df_addSmtAssy[f'ROW{str(j)}'].str.contains(pattern, case=False)
                 if self.isDebug:
                     df_addSmtAssy.to_excel('.\\debug\\Sp\\flow10-1.xlsx')
                 # 알람 상세 DataFrame 생성
-                df_alarmDetail = pd.DataFrame(columns=["No.", "분류", "L/N", "MS CODE", "SMT ASSY", "수주수량", "부족수량", "검사호기(그룹)", "대상 검사시간(초)", "필요시간(초)", "완성예정일"])
-                alarmDetailNo = 1
+                alarmDetail = AlarmCollector(["No.", "분류", "L/N", "MS CODE", "SMT ASSY", "수주수량", "부족수량", "검사호기(그룹)", "대상 검사시간(초)", "필요시간(초)", "완성예정일"])
                 # 최소착공량에 대해 Smt적용 착공량 계산
-                df_addSmtAssy, dict_smtCnt, alarmDetailNo, df_alarmDetail = self.smtReflectInst(df_addSmtAssy, False, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo)
+                df_addSmtAssy, dict_smtCnt = self.smtReflectInst(df_addSmtAssy, False, dict_smtCnt, alarmDetail, smtIncidence)
                 # 잔여 착공량에 대해 Smt적용 착공량 계산
                 df_addSmtAssy['SMT반영_착공량_잔여'] = 0
-                df_addSmtAssy, dict_smtCnt, alarmDetailNo, df_alarmDetail = self.smtReflectInst(df_addSmtAssy, True, dict_smtCnt, alarmDetailNo, df_alarmDetail, rowNo)
+                df_addSmtAssy, dict_smtCnt = self.smtReflectInst(df_addSmtAssy, True, dict_smtCnt, alarmDetail, smtIncidence)
                 progress += round(maxPb / 20)
                 self.spReturnPb.emit(progress)
                 if self.isDebug:
@@ -3093,27 +4067,27 @@ class SpThread(QObject):
                     df_addSmtAssy.to_excel('.\\debug\\Sp\\flow12-1.xlsx')
                 df_addSmtAssy['설비능력반영_착공량'] = 0
                 # CT 조건표 불러오기
-                df_limitCtCond = pd.read_excel(self.list_masterFile[13])
+                df_limitCtCond = self.frameStore.get(self.list_masterFile[13])
                 limitCtCnt = df_limitCtCond[df_limitCtCond['상세구분'] == 'OTHER']['허용수량'].values[0]
                 # 조건표의 제한대수를 적용하여 착공 (최소필요착공량)
-                df_addSmtAssy, dict_categoryCnt, dict_firstGrCnt, dict_secGrCnt, alarmDetailNo, df_alarmDetail, limitCtCnt = self.grMaxCntReflect(df_addSmtAssy,
-                                                                                                                                                False,
-                                                                                                                                                dict_categoryCnt,
-                                                                                                                                                dict_firstGrCnt,
-                                                                                                                                                dict_secGrCnt,
-                                                                                                                                                alarmDetailNo,
-                                                                                                                                                df_alarmDetail,
-                                                                                                                                                limitCtCnt)
+                df_addSmtAssy, dict_categoryCnt, dict_firstGrCnt, dict_secGrCnt, limitCtCnt = self.grMaxCntReflect(df_addSmtAssy,
+                                                                                                                   False,
+                                                                                                                   dict_categoryCnt,
+                                                                                                                   dict_firstGrCnt,
+                                                                                                                   dict_secGrCnt,
+                                                                                                                   alarmDetail,
+                                                                                                                   limitCtCnt)
                 df_addSmtAssy['설비능력반영_착공량_잔여'] = 0
                 # 조건표의 제한대수를 적용하여 착공 (여유분)
-                df_addSmtAssy, dict_categoryCnt, dict_firstGrCnt, dict_secGrCnt, alarmDetailNo, df_alarmDetail, limitCtCnt = self.grMaxCntReflect(df_addSmtAssy,
-                                                                                                                                                True,
-                                                                                                                                                dict_categoryCnt,
-                                                                                                                                                dict_firstGrCnt,
-                                                                                                                                                dict_secGrCnt,
-                                                                                                                                                alarmDetailNo,
-                                                                                                                                                df_alarmDetail,
-                                                                                                                                                limitCtCnt)
+                df_addSmtAssy, dict_categoryCnt, dict_firstGrCnt, dict_secGrCnt, limitCtCnt = self.grMaxCntReflect(df_addSmtAssy,
+                                                                                                                   True,
+                                                                                                                   dict_categoryCnt,
+                                                                                                                   dict_firstGrCnt,
+                                                                                                                   dict_secGrCnt,
+                                                                                                                   alarmDetail,
+                                                                                                                   limitCtCnt)
+                # 누적된 알람 상세 기록을 DataFrame으로 변환
+                df_alarmDetail = alarmDetail.toFrame()
                 if self.isDebug:
                     df_alarmDetail.to_excel('.\\debug\\Sp\\df_alarmDetail.xlsx')
                 df_addSmtAssy = df_addSmtAssy.reset_index(drop=True)
@@ -3209,24 +4183,10 @@ class SpThread(QObject):
                 df_addSmtAssy['총착공량'] = df_addSmtAssy['설비능력반영_착공량'] + df_addSmtAssy['설비능력반영_착공량_잔여']
                 df_addSmtAssy = df_addSmtAssy[df_addSmtAssy['총착공량'] != 0]
                 # 홀딩리스트 불러오기
-                df_holdingList = pd.read_excel(self.list_masterFile[17])
+                df_holdingList = self.frameStore.get(self.list_masterFile[17])
                 # 홀딩리스트와 비교하여 조건에 해당하는 경우, 알람 메시지 출력
-                for i in df_holdingList.index:
-                    message = ""
-                    if len(df_addSmtAssy[df_addSmtAssy['MODEL'] == df_holdingList['MODEL'][i]]['총착공량'].values) > 0:
-                        totalCnt = 0
-                        for cnt in df_addSmtAssy[df_addSmtAssy['MODEL'] == df_holdingList['MODEL'][i]]['총착공량'].values:
-                            totalCnt += cnt
-                        message = f"{df_holdingList['MODEL'][i]} {int(totalCnt)}대 {df_holdingList['REMARK'][i]}"
-                    if len(df_addSmtAssy[df_addSmtAssy['Linkage Number'] == df_holdingList['LINKAGENO'][i]]['총착공량'].values) > 0:
-                        message = f"{df_holdingList['LINKAGENO'][i]} {int(df_addSmtAssy[df_addSmtAssy['Linkage Number'] == df_holdingList['LINKAGENO'][i]]['총착공량'].values[0])}대 {df_holdingList['REMARK'][i]}"
-                    if len(df_addSmtAssy[df_addSmtAssy['MS Code'] == df_holdingList['MS-CODE'][i]]['총착공량'].values) > 0:
-                        totalCnt = 0
-                        for cnt in df_addSmtAssy[df_addSmtAssy['MS Code'] == df_holdingList['MS-CODE'][i]]['총착공량'].values:
-                            totalCnt += cnt
-                        message = f"{df_holdingList['MS-CODE'][i]} {int(totalCnt)}대 {df_holdingList['REMARK'][i]}"
-                    if len(message) > 0:
-                        self.spReturnWarning.emit(message)
+                for message in getHoldingMessage(df_holdingList, df_addSmtAssy):
+                    self.spReturnWarning.emit(message)
                 # 최대착공량만큼 착공 못했을 경우, 메시지 출력
                 if math.floor(dict_categoryCnt['모듈']) > 0:
                     self.spReturnWarning.emit(f'아직 착공하지 못한 특수(모듈)이 [{math.floor(dict_categoryCnt["모듈"])}대] 남았습니다. 최대 생산대수 설정을 확인해주세요.')
@@ -3240,20 +4200,8 @@ class SpThread(QObject):
                 self.spReturnPb.emit(progress)
                 if self.isDebug:
                     df_mergeOrder.to_excel('.\\debug\\Sp\\flow14.xlsx')
-                df_mergeOrderResult = pd.DataFrame().reindex_like(df_mergeOrder)
-                df_mergeOrderResult = df_mergeOrderResult[0:0]
                 # 총착공량 만큼 개별화
-                for i in df_addSmtAssy.index:
-                    for j in df_mergeOrder.index:
-                        if df_addSmtAssy['Linkage Number'][i] == df_mergeOrder['Linkage Number'][j]:
-                            if j > 0:
-                                if df_mergeOrder['Linkage Number'][j] != df_mergeOrder['Linkage Number'][j - 1]:
-                                    orderCnt = int(df_addSmtAssy['총착공량'][i])
-                            else:
-                                orderCnt = int(df_addSmtAssy['총착공량'][i])
-                            if orderCnt > 0:
-                                df_mergeOrderResult = df_mergeOrderResult.append(df_mergeOrder.iloc[j])
-                                orderCnt -= 1
+                df_mergeOrderResult = explodeOrder(df_addSmtAssy, df_mergeOrder)
                 # 사이클링을 위해 검사설비별로 정리
                 df_mergeOrderResult = df_mergeOrderResult.sort_values(by=['대표모델'], ascending=[False])
                 df_mergeOrderResult = df_mergeOrderResult.reset_index(drop=True)
@@ -3291,42 +4239,16 @@ class SpThread(QObject):
                         df_terminal = df_terminal.reset_index(drop=True)
                     # 최대 사이클 번호 체크
                     maxCycle = float(df_cycleCopy['대표모델Cnt'][0])
-                    cycleGr = 1.0
-                    df_module['사이클그룹'] = 0
-                    # 각 검사장치별로 사이클 그룹을 작성하고, 최대 사이클과 비교하여 각 사이클그룹에서 배수처리
-                    for i in df_module.index:
-                        if df_module['긴급오더'][i] != '대상':
-                            multiCnt = maxCycle / df_module['대표모델Cnt'][i]
-                            if i == 0:
-                                df_module['사이클그룹'][i] = cycleGr
-                            else:
-                                if df_module['대표모델'][i] != df_module['대표모델'][i - 1]:
-                                    if i == 1:
-                                        cycleGr = 2.0
-                                    else:
-                                        cycleGr = 1.0
-                                df_module['사이클그룹'][i] = cycleGr * multiCnt
-                            cycleGr += 1.0
-                        if cycleGr >= maxCycle:
-                            cycleGr = 1.0
-                    # 배정된 사이클 그룹 순으로 정렬
-                    df_module = df_module.sort_values(by=['사이클그룹'], ascending=[True])
-                    df_module = df_module.reset_index(drop=True)
+                    # 각 대표모델별로 사이클 그룹을 작성하고, 최대 사이클과 비교하여 각 사이클그룹에서 배수처리한 뒤 사이클그룹 순으로 정렬
+                    df_module = cycleSequence(df_module, '대표모델', '대표모델Cnt', maxCycle)
                     progress += round(maxPb / 20)
                     self.spReturnPb.emit(progress)
                     if self.isDebug:
                         df_module.to_excel('.\\debug\\Sp\\flow16.xlsx')
                     df_module = df_module.reset_index()
-                    for i in df_module.index:
-                        if df_module['긴급오더'][i] != '대상':
-                            if (i != 0 and (df_module['대표모델'][i] == df_module['대표모델'][i - 1])):
-                                for j in df_module.index:
-                                    if df_module['긴급오더'][j] != '대상':
-                                        if ((j != 0 and j < len(df_module) - 1) and (df_module['대표모델'][i] != df_module['대표모델'][j + 1]) and (df_module['대표모델'][i] != df_module['대표모델'][j])):
-                                            df_module['index'][i] = ((float(df_module['index'][j]) + float(df_module['index'][j + 1])) / 2)
-                                            df_module = df_module.sort_values(by=['index'], ascending=[True])
-                                            df_module = df_module.reset_index(drop=True)
-                                            break
+                    df_module, conflictCnt = spreadAdjacent(df_module, '대표모델')
+                    if conflictCnt > 0:
+                        self.spReturnWarning.emit(f'같은 대표모델이 연속으로 배치된 곳이 [{conflictCnt}건] 남았습니다. 확인해주세요.')
                     if self.isDebug:
                         df_module.to_excel('.\\debug\\Sp\\flow16-1.xlsx')
                     df_unCt['index'] = 0
@@ -3797,7 +4719,7 @@ class UISubWindow(QMainWindow):
         try:
             fileName = QFileDialog.getOpenFileName(self, 'Open File', './', 'Excel Files (*.xlsx)')[0]
             if fileName != "":
-                df = pd.read_excel(fileName)
+                df = readExcel(fileName)
                 for i in df.index:
                     linkageNo = str(df[df.columns[0]][i])
                     if len(linkageNo) == 16:
@@ -3834,7 +4756,7 @@ class UISubWindow(QMainWindow):
         try:
             fileName = QFileDialog.getOpenFileName(self, 'Open File', './', 'Excel Files (*.xlsx)')[0]
             if fileName != "":
-                df = pd.read_excel(fileName)
+                df = readExcel(fileName)
                 for i in df.index:
                     mscode = str(df[df.columns[0]][i])
                     if len(mscode) > 0:
@@ -4078,6 +5000,7 @@ class Ui_MainWindow(QMainWindow):
         self.isMainEnd = False
         self.isPowerEnd = False
         self.isSpEnd = False
+        self.frameStore = MasterFrameStore()
         if self.isDebug:
             self.date = QLineEdit(self.groupBox)
             self.date.setObjectName('date')
@@ -4089,6 +5012,8 @@ class Ui_MainWindow(QMainWindow):
         self.thread2.setTerminationEnabled(True)
         self.thread3 = QThread()
         self.thread3.setTerminationEnabled(True)
+        self.thread4 = QThread()
+        self.thread4.setTerminationEnabled(True)
         self.show()
 
     def retranslateUi(self, MainWindow):
@@ -4126,7 +5051,7 @@ class Ui_MainWindow(QMainWindow):
             self.MaxOrderInputFilePath = r'.\\2차_착공량입력.xlsx'
             self.etcOrderInputFilePath = r'.\\1차_착공량입력.xlsx'
         if os.path.exists(self.MaxOrderInputFilePath):
-            df_orderInput = pd.read_excel(self.MaxOrderInputFilePath)
+            df_orderInput = readExcel(self.MaxOrderInputFilePath)
             self.mainOrderinput.setText(str(df_orderInput['착공량'][0]))
             self.spModuleOrderinput.setText(str(df_orderInput['착공량'][1]))
             self.spNonModuleOrderinput.setText(str(df_orderInput['착공량'][2]))
@@ -4134,7 +5059,7 @@ class Ui_MainWindow(QMainWindow):
         else:
             logging.error('%s 파일이 없습니다. 착공량을 수동으로 입력해주세요.', self.MaxOrderInputFilePath)
         if os.path.exists(self.etcOrderInputFilePath):
-            df_etcOrderInput = pd.read_excel(self.etcOrderInputFilePath)
+            df_etcOrderInput = readExcel(self.etcOrderInputFilePath)
         else:
             df_etcOrderInput = pd.DataFrame()
             logging.error('%s 파일이 없습니다. 파일을 확인해주세요.', self.etcOrderInputFilePath)
@@ -4214,6 +5139,13 @@ class Ui_MainWindow(QMainWindow):
         self.thread2.quit()
         self.thread2.wait()
 
+    # 마스터 파일 로딩 에러메시지 출력용 함수
+    def loadShowError(self, str):
+        logging.error(f'마스터 파일 로딩 에러 - {str}')
+        self.enableRunBtn()
+        self.thread4.quit()
+        self.thread4.wait()
+
     # 특수라인 에러메시지 출력용 함수
     def spShowError(self, str):
         logging.warning(f'특수라인 에러 - {str}')
@@ -4434,7 +5366,8 @@ class Ui_MainWindow(QMainWindow):
                                                 list_emgHold,
                                                 df,
                                                 self.cb_round.currentText(),
-                                                self.df_etcOrderInput)
+                                                self.df_etcOrderInput,
+                                                self.frameStore)
                     self.thread_sp.moveToThread(self.thread3)
                     self.thread3.started.connect(self.thread_sp.run)
                     self.thread_sp.spReturnError.connect(self.spShowError)
@@ -4458,12 +5391,43 @@ class Ui_MainWindow(QMainWindow):
         self.disableRunBtn()
         self.setSpMaxPb(200)
         self.progressbar_sp.setValue(0)
+        self.list_masterFile = self.loadMasterFile()
+        if self.isFileReady:
+            # 착공 1회 동안 각 라인이 공유할 마스터파일 저장소 생성
+            self.frameStore = MasterFrameStore()
+            # 설정파일을 제외한 마스터 파일을 라인 쓰레드 시작 전에 동시에 읽어둠
+            list_loadTarget = []
+            dict_schemaName = {0: 'SOS2', 1: 'LEVELING', 2: 'LEVELING', 3: 'LEVELING', 4: 'CALENDAR', 5: 'PICKING',
+                                9: 'LEVELING', 10: 'LEVELING', 11: 'LEVELING', 14: 'PICKING', 15: 'PICKING'}
+            for idx, path in enumerate(self.list_masterFile):
+                if idx != 16 and Path(path).is_file():
+                    if idx == 0:
+                        list_loadTarget.append([path, {'schemaName': 'SOS2', 'excludeMsCode': getSosExcludeMsCode(self.cb_round.currentText())}])
+                    elif idx in dict_schemaName:
+                        list_loadTarget.append([path, {'schemaName': dict_schemaName[idx]}])
+                    else:
+                        list_loadTarget.append([path, {}])
+            self.thread_load = LoadThread(self.frameStore, list_loadTarget, min(4, os.cpu_count() or 1))
+            self.thread_load.moveToThread(self.thread4)
+            self.thread4.started.connect(self.thread_load.run)
+            self.thread_load.loadReturnError.connect(self.loadShowError)
+            self.thread_load.loadReturnInfo.connect(logging.info)
+            self.thread_load.loadReturnEnd.connect(self.startLineLeveling)
+            self.thread4.start()
+        else:
+            self.enableRunBtn()
+            logging.warning('필수 파일이 없어 더 이상 진행할 수 없습니다.')
+
+    # 마스터 파일 로딩 완료 후 메인/전원라인 쓰레드 시작 함수
+    def startLineLeveling(self, isEnd):
+        self.thread4.quit()
+        self.thread4.wait()
         date = datetime.datetime.today().strftime('%Y%m%d')
         if self.isDebug:
             date = self.date.text()
-        list_masterFile = self.loadMasterFile()
+        list_masterFile = self.list_masterFile
         list_emgHold = self.loadEmgHoldList()
-        if self.isFileReady:
+        if isEnd:
             if len(self.mainOrderinput.text()) > 0:
                 if self.labelDate.text() != '미선택':
                     self.thread_main = MainThread(self.isDebug,
@@ -4473,7 +5437,8 @@ class Ui_MainWindow(QMainWindow):
                                                     float(self.mainOrderinput.text()),
                                                     list_emgHold,
                                                     self.cb_round.currentText(),
-                                                    self.df_etcOrderInput)
+                                                    self.df_etcOrderInput,
+                                                    self.frameStore)
                     self.thread_main.moveToThread(self.thread)
                     self.thread.started.connect(self.thread_main.run)
                     self.thread_main.mainReturnError.connect(self.mainShowError)
@@ -4499,7 +5464,8 @@ class Ui_MainWindow(QMainWindow):
                                                     float(self.powerOrderinput.text()),
                                                     list_emgHold,
                                                     self.cb_round.currentText(),
-                                                    self.df_etcOrderInput)
+                                                    self.df_etcOrderInput,
+                                                    self.frameStore)
                     self.thread_power.moveToThread(self.thread2)
                     self.thread2.started.connect(self.thread_power.run)
                     self.thread_power.powerReturnError.connect(self.powerShowError)
@@ -4515,13 +5481,26 @@ class Ui_MainWindow(QMainWindow):
                     logging.info('착공지정일이 입력되지 않았습니다. 캘린더로부터 착공지정일을 선택해주세요.')
             else:
                 logging.info('전원기종 착공량이 입력되지 않아 전원기종 착공은 미실시 됩니다.')
-        else:
-            self.enableRunBtn()
-            logging.warning('필수 파일이 없어 더 이상 진행할 수 없습니다.')
 
 
 if __name__ == '__main__':
     import sys
+    # 실행파일로 배포시 마스터 파일 로딩용 프로세스 풀이 동작하도록 처리
+    multiprocessing.freeze_support()
+    # 엑셀 읽기 엔진 벤치마크 명령 (python FAM3_Leveling.py --bench-excel [파일 또는 폴더 ...])
+    if len(sys.argv) > 1 and sys.argv[1] == '--bench-excel':
+        benchmarkExcelEngine(sys.argv[2:])
+        sys.exit(0)
+    # DB 조회 결과 기록 명령 (python FAM3_Leveling.py --capture-db [YYYYMMDD])
+    if len(sys.argv) > 1 and sys.argv[1] == '--capture-db':
+        captureDataSource(sys.argv[2:])
+        sys.exit(0)
+    # 검사설비 부분 착공 계산 검증 명령 (python FAM3_Leveling.py --check-ate [파일 ...])
+    if len(sys.argv) > 1 and sys.argv[1] == '--check-ate':
+        sys.exit(1 if checkAtePartialCnt(sys.argv[2:]) > 0 else 0)
+    # 오라클 클라이언트는 시작시 한번만 초기화하고, 종료시 세션풀을 정리
+    oraclePool.initClient()
     app = QtWidgets.QApplication(sys.argv)
+    app.aboutToQuit.connect(oraclePool.close)
     ui = Ui_MainWindow()
     sys.exit(app.exec_())